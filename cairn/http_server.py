@@ -6,7 +6,7 @@ import json
 import asyncio
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
-from typing import Dict, Any
+from typing import Dict, Any, List
 import threading
 
 from .server import SimpleMCPServer
@@ -82,12 +82,46 @@ class CairnHTTPHandler(BaseHTTPRequestHandler):
                         loop.close()
                 else:
                     self._send_response(400, {"error": "Request body is required"})
+            elif path == "/tool/batch":
+                # Handle several independent tool calls in one request
+                content_length = int(self.headers.get('Content-Length', 0))
+                if content_length > 0:
+                    body = self.rfile.read(content_length)
+                    calls = json.loads(body.decode('utf-8'))
+                    
+                    if not isinstance(calls, list) or not all(isinstance(call, dict) for call in calls):
+                        self._send_response(400, {"error": "Request body must be a list of tool call objects"})
+                        return
+                    
+                    loop = asyncio.new_event_loop()
+                    asyncio.set_event_loop(loop)
+                    try:
+                        results = loop.run_until_complete(self._run_tool_calls(calls))
+                        self._send_response(200, {"results": results})
+                    finally:
+                        loop.close()
+                else:
+                    self._send_response(400, {"error": "Request body is required"})
             else:
                 self._send_response(404, {"error": "Endpoint not found"})
                 
         except Exception as e:
             self._send_response(500, {"error": str(e)})
     
+    async def _run_tool_calls(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run batched tool calls in order, one result per call; a failing call never aborts the rest"""
+        results = []
+        for call in calls:
+            tool_name = call.get('name')
+            if not tool_name:
+                results.append({"success": False, "error": "Tool name is required"})
+                continue
+            try:
+                results.append(await self.mcp_server.handle_tool_call(tool_name, call.get('arguments', {})))
+            except Exception as e:
+                results.append({"success": False, "error": str(e)})
+        return results
+    
     def _send_response(self, status_code: int, data: Dict[str, Any]):
         """Send HTTP response with JSON data"""
         self.send_response(status_code)
@@ -137,6 +171,7 @@ class CairnHTTPServer:
         print(f"  GET  /resources           - List available resources")
         print(f"  GET  /resource/{{uri}}      - Get specific resource")
         print(f"  POST /tool                - Execute a tool")
+        print(f"  POST /tool/batch          - Execute a list of tools in order")
         print("\n💡 Example tool call:")
         print(f"  curl -X POST http://{self.host}:{self.port}/tool \\")
         print(f"    -H 'Content-Type: application/json' \\")
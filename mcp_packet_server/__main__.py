@@ -0,0 +1,13 @@
+"""
+Entry point for python -m mcp_packet_server: runs the offline test scripts
+"""
+
+import sys
+from pathlib import Path
+
+# The scripts use flat imports, so put the package directory on the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from run_tests import main
+
+main()
@@ -0,0 +1,80 @@
+"""
+Shared create -> read/list/search flow for the live integration scripts
+"""
+
+import asyncio
+import os
+import traceback
+from typing import Any, Callable, Dict, Optional
+
+from services.base_handler import BaseServiceHandler
+
+
+async def run_integration_test(
+    label: str,
+    handler_cls: Callable[[], BaseServiceHandler],
+    item_type: str,
+    create_payload: Dict[str, Any],
+    id_getter: Callable[[Dict[str, Any]], str],
+    read_display: Callable[[Dict[str, Any]], str],
+    list_display: Callable[[Dict[str, Any]], str],
+    search_payload: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Create one item, then read it back, list and optionally search concurrently"""
+    print(f"🧪 Testing Real {label} Integration")
+    print("=" * 50)
+
+    try:
+        print(f"📱 Initializing {label} handler...")
+        handler = handler_cls()
+        print("✅ Handler initialized successfully")
+
+        print(f"\n📝 Testing {item_type} creation...")
+        for key, value in create_payload.items():
+            print(f"  {key}: {value}")
+
+        result = await handler._execute_with_timing("create", create_payload, item_type)
+
+        if os.getenv("VERBOSE_TESTS"):
+            print(f"📊 Full result: {result}")
+
+        if not result["success"]:
+            print(f"❌ {item_type.capitalize()} creation failed: {result['error']}")
+            return
+
+        print(f"✅ {item_type.capitalize()} created successfully!")
+        print(f"📊 Result: {result['result']}")
+
+        # Everything after the create only needs its ID, so overlap the calls
+        print(f"\n📖 Testing {item_type} follow-up calls concurrently...")
+        calls = [
+            handler._execute_with_timing("read", {"id": id_getter(result["result"]), "item_type": item_type}),
+            handler._execute_with_timing("list", {"item_type": item_type, "max_results": 5}),
+        ]
+        if search_payload is not None:
+            calls.append(handler._execute_with_timing("search", search_payload))
+        read_result, list_result, *search_results = await asyncio.gather(*calls)
+
+        if read_result["success"]:
+            print(f"✅ {item_type.capitalize()} retrieved successfully!")
+            print(f"📊 Retrieved {item_type}: {read_display(read_result['result']['item'])}")
+        else:
+            print(f"❌ {item_type.capitalize()} retrieval failed: {read_result['error']}")
+
+        if list_result["success"]:
+            print(f"✅ Listed successfully! Found {list_result['result']['count']} {item_type}s")
+            # Show the first few items
+            for i, item in enumerate(list_result['result']['items'][:3]):
+                print(f"  {i+1}. {list_display(item)}")
+        else:
+            print(f"❌ {item_type.capitalize()} listing failed: {list_result['error']}")
+
+        for search_result in search_results:
+            if search_result["success"]:
+                print(f"✅ Search successful! Found {search_result['result']['count']} matching {item_type}s")
+            else:
+                print(f"❌ {item_type.capitalize()} search failed: {search_result['error']}")
+
+    except Exception as e:
+        print(f"❌ Test failed with error: {e}")
+        traceback.print_exc()
@@ -6,8 +6,13 @@ environment variables from the repository-local `.env` file so secrets are
 available without manual `source` steps, and without risking accidental git
 commits.
 """
+import asyncio
+import atexit
+import logging
 import os
+import sys
 from pathlib import Path
+from typing import Any, Callable, Coroutine, Iterable, List, TypeVar
 
 try:
     from dotenv import load_dotenv  # type: ignore
@@ -15,6 +20,8 @@ except ModuleNotFoundError:  # pragma: no cover
     # dotenv not installed; skip automatic loading
     load_dotenv = None  # type: ignore
 
+T = TypeVar("T")
+
 
 def init_env():  # pragma: no cover
     """Load variables from `mcp_packet_server/.env` if present.
@@ -31,3 +38,80 @@ def init_env():  # pragma: no cover
             load_dotenv(dotenv_path=env_path, override=False)
             os.environ["_MCP_ENV_LOADED"] = "1"
 
+
+
+def buffer_stdout() -> None:  # pragma: no cover
+    """Block-buffer stdout for print-heavy scripts.
+
+    Console output is line-buffered by default, so every `print` becomes its
+    own write.  After this, output goes out in large chunks and is flushed
+    once more at exit.
+    """
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    atexit.register(sys.stdout.flush)
+
+
+def init_test_logging() -> None:  # pragma: no cover
+    """Send test-script logging to stdout alongside the status prints.
+
+    Per-item detail lines are logged at DEBUG and only shown when
+    VERBOSE_TESTS is set, so their formatting is skipped otherwise.
+    """
+    level = logging.DEBUG if os.getenv("VERBOSE_TESTS") else logging.INFO
+    logging.basicConfig(level=level, format="%(message)s", stream=sys.stdout)
+
+
+def use_uvloop() -> bool:  # pragma: no cover
+    """Install uvloop's event loop policy when it is available.
+
+    Must run before `asyncio.run`.  uvloop has no Windows support, so there
+    (or when the package is not installed) the default policy is kept.
+    Returns True if uvloop was installed.
+    """
+    if sys.platform == "win32":
+        return False
+
+    try:
+        import uvloop
+    except ModuleNotFoundError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def run_eager(main: Coroutine[Any, Any, T]) -> T:  # pragma: no cover
+    """Run `main` like `asyncio.run`, with eager task execution where supported.
+
+    On Python 3.12+ tasks that finish before their first suspension (such as
+    packets rejected by validation) never pass through the ready queue.
+    Older interpreters fall back to plain `asyncio.run`.
+    """
+    if sys.version_info >= (3, 12):
+        with asyncio.Runner() as runner:
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+            return runner.run(main)
+
+    return asyncio.run(main)
+
+
+def run_all(mains: Iterable[Callable[[], Coroutine[Any, Any, T]]]) -> List[T]:  # pragma: no cover
+    """Run each coroutine function in turn on one shared event loop.
+
+    The loop, selector and default executor are built once for the whole
+    sequence instead of once per `asyncio.run`.  Task execution is eager on
+    Python 3.12+, as in `run_eager`.
+    """
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner() as runner:
+            if sys.version_info >= (3, 12):
+                runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+            return [runner.run(main()) for main in mains]
+
+    loop = asyncio.new_event_loop()
+    try:
+        return [loop.run_until_complete(main()) for main in mains]
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
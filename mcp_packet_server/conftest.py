@@ -0,0 +1,53 @@
+"""
+Shared pytest fixtures for the MCP Packet Server test scripts
+Each server is built once per session instead of once per test
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bootstrap import use_uvloop
+from enhanced_server import EnhancedMCPServer
+from server import MCPPacketServer
+from warmup import warm_up
+
+# Live-API scripts need real credentials; run them directly instead
+collect_ignore = [
+    "test_live_services.py",
+    "test_real_integration.py",
+    "test_todoist_integration.py",
+]
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Run tests on uvloop when available, and pay import cost before the first test"""
+    use_uvloop()
+    warm_up()
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """Mark *_live tests slow and skip them unless GMAIL_LIVE is set"""
+    skip_live = pytest.mark.skip(reason="set GMAIL_LIVE=1 to run live Gmail tests")
+    for item in items:
+        if item.name.endswith("_live"):
+            item.add_marker(pytest.mark.slow)
+            if not os.getenv("GMAIL_LIVE"):
+                item.add_marker(skip_live)
+
+
+@pytest.fixture(scope="session")
+def server() -> MCPPacketServer:
+    """One MCPPacketServer shared by every test in the session"""
+    return MCPPacketServer()
+
+
+@pytest.fixture(scope="session")
+def enhanced_server() -> EnhancedMCPServer:
+    """One EnhancedMCPServer shared by every test in the session"""
+    return EnhancedMCPServer(cache_policy="lfu", max_tools=80)
@@ -4,6 +4,7 @@ Debug script for Google Calendar API integration
 """
 
 import os
+import traceback
 from datetime import datetime, timedelta
 
 from google.auth.transport.requests import Request
@@ -156,11 +157,9 @@ def debug_calendar_api():
 
     except HttpError as error:
         print(f"❌ Google Calendar API error: {error}")
-        import traceback
         traceback.print_exc()
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
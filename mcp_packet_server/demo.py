@@ -65,8 +65,7 @@ class MCPPacketDemo:
         services_result = await self.server._list_services({})
         total_operations = 0
         for service_info in services_result["services"].values():
-            total_ops = len(service_info["supported_actions"]) * len(service_info["supported_item_types"])
-            total_operations += total_ops
+            total_operations += service_info["total_operations"]
 
         consolidation_ratio = total_operations / len(self.server.tools)
         print(f"\n📈 Consolidation Ratio: {total_operations} operations → {len(self.server.tools)} tools")
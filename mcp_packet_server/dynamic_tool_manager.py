@@ -3,12 +3,20 @@ Dynamic Tool Manager for MCP Packet Server
 Implements intelligent tool loading, unloading, and eviction policies
 """
 
+import os
 import sys
 import time
 from collections import OrderedDict, defaultdict
 from threading import Lock
 from typing import Any, Callable, Dict, Optional
 
+# psutil imports (with error handling)
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 
 class ToolCache:
     """Base tool cache with configurable capacity"""
@@ -272,9 +280,8 @@ class DynamicToolManager:
 
     def get_memory_usage(self) -> Dict[str, Any]:
         """Get memory usage statistics"""
-        import os
-
-        import psutil
+        if not PSUTIL_AVAILABLE:
+            raise RuntimeError("psutil is required for memory usage statistics")
 
         process = psutil.Process(os.getpid())
         memory_info = process.memory_info()
@@ -10,7 +10,7 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from bootstrap import init_env
+from bootstrap import init_env, use_uvloop
 
 init_env()
 
@@ -21,6 +21,8 @@ from services import (
     GmailServiceHandler,
     GoogleCalendarServiceHandler,
     TodoistServiceHandler,
+    close_shared_session,
+    summarize_services,
 )
 from validation_tripwires import PacketValidationTripwires, ServiceValidationTripwires
 
@@ -59,6 +61,9 @@ class EnhancedMCPServer:
             'deep_pcb': DeepPCBServiceHandler()
         }
 
+        # Handler capabilities are class-level constants, so summarise them once
+        self._service_info = summarize_services(self.service_handlers)
+
         # Initialize tripwire validation system
         self.packet_tripwires = PacketValidationTripwires(self.service_handlers)
         self.service_tripwires = ServiceValidationTripwires()
@@ -89,13 +94,13 @@ class EnhancedMCPServer:
 
         for service_name, handler in self.service_handlers.items():
             # Generate tool names for each supported action + item_type combination
-            for action in handler.supported_actions:
-                for item_type in handler.supported_item_types:
+            for action in sorted(handler.supported_actions):
+                for item_type in sorted(handler.supported_item_types):
                     tool_name = f"{action}_{service_name}_{item_type}"
                     all_tools.append((tool_name, service_name))
 
             # Also register generic action tools (e.g., "create_todoist" for any item type)
-            for action in handler.supported_actions:
+            for action in sorted(handler.supported_actions):
                 generic_tool_name = f"{action}_{service_name}"
                 all_tools.append((generic_tool_name, service_name))
 
@@ -110,7 +115,7 @@ class EnhancedMCPServer:
         """Register the core MCP tools (always loaded)"""
         # Get dynamic service and action lists from handlers
         available_services = list(self.service_handlers.keys())
-        available_actions = []
+        available_actions: List[str] = []
         for handler in self.service_handlers.values():
             available_actions.extend(handler.supported_actions)
         available_actions = list(set(available_actions))  # Remove duplicates
@@ -399,7 +404,7 @@ class EnhancedMCPServer:
 
             # TRIPWIRE 1: Format and Input Validation
             validation_start = time.time()
-            validation_results = self.packet_tripwires.validate_packet(packet)
+            validation_results = await self.packet_tripwires.validate_packet_async(packet)
             validation_duration = (time.time() - validation_start) * 1000
 
             # Add processing step: validation
@@ -753,12 +758,8 @@ class EnhancedMCPServer:
         include_schemas = arguments.get("include_schemas", False)
 
         services = {}
-        for service_name, handler in self.service_handlers.items():
-            service_info = {
-                "name": service_name,
-                "supported_actions": handler.supported_actions,
-                "supported_item_types": handler.supported_item_types
-            }
+        for service_name, cached_info in self._service_info.items():
+            service_info = dict(cached_info)
 
             if include_schemas:
                 service_info["schema"] = await self._get_service_schema_internal(service_name)
@@ -830,38 +831,44 @@ async def main():
     """Main entry point for testing"""
     server = EnhancedMCPServer(cache_policy="lfu", max_tools=20)
 
-    print("🚀 Enhanced MCP Server with Dynamic Tool Management")
-    print("=" * 60)
-    print(f"📚 Available tools: {len(server.tools)}")
-    print(f"🔗 Available resources: {len(server.resources)}")
-    print(f"⚙️  Cache policy: {server.tool_manager.cache_policy.upper()}")
-    print(f"📊 Tool limit: {server.tool_manager.max_tools}")
+    try:
+
+        print("🚀 Enhanced MCP Server with Dynamic Tool Management")
+        print("=" * 60)
+        print(f"📚 Available tools: {len(server.tools)}")
+        print(f"🔗 Available resources: {len(server.resources)}")
+        print(f"⚙️  Cache policy: {server.tool_manager.cache_policy.upper()}")
+        print(f"📊 Tool limit: {server.tool_manager.max_tools}")
 
-    # Test dynamic tool loading
-    print("\n🧪 Testing Dynamic Tool Management:")
+        # Test dynamic tool loading
+        print("\n🧪 Testing Dynamic Tool Management:")
 
-    # Test 1: Load a tool
-    print("\n1️⃣ Loading Todoist task creator...")
-    result = await server._load_tool({"tool_name": "create_todoist_task"})
-    print(f"   Result: {result}")
+        # Test 1: Load a tool
+        print("\n1️⃣ Loading Todoist task creator...")
+        result = await server._load_tool({"tool_name": "create_todoist_task"})
+        print(f"   Result: {result}")
 
-    # Test 2: Get tool status
-    print("\n2️⃣ Getting tool status...")
-    status = await server._get_tool_status({"tool_name": "create_todoist_task"})
-    print(f"   Status: {status}")
+        # Test 2: Get tool status
+        print("\n2️⃣ Getting tool status...")
+        status = await server._get_tool_status({"tool_name": "create_todoist_task"})
+        print(f"   Status: {status}")
 
-    # Test 3: Get performance metrics
-    print("\n3️⃣ Getting performance metrics...")
-    metrics = await server._get_performance_metrics({})
-    print(f"   Cache size: {metrics['metrics']['cache_stats']['current_size']}/{metrics['metrics']['cache_stats']['capacity']}")
+        # Test 3: Get performance metrics
+        print("\n3️⃣ Getting performance metrics...")
+        metrics = await server._get_performance_metrics({})
+        print(f"   Cache size: {metrics['metrics']['cache_stats']['current_size']}/{metrics['metrics']['cache_stats']['capacity']}")
 
-    # Test 4: Change cache policy
-    print("\n4️⃣ Changing cache policy to LRU...")
-    policy_result = await server._set_cache_policy({"policy": "lru"})
-    print(f"   Result: {policy_result}")
+        # Test 4: Change cache policy
+        print("\n4️⃣ Changing cache policy to LRU...")
+        policy_result = await server._set_cache_policy({"policy": "lru"})
+        print(f"   Result: {policy_result}")
 
-    print("\n✅ Enhanced MCP Server test completed!")
+        print("\n✅ Enhanced MCP Server test completed!")
+    finally:
+        # Release pooled HTTP connections held by the service handlers
+        await close_shared_session()
 
 
 if __name__ == "__main__":
+    use_uvloop()
     asyncio.run(main())
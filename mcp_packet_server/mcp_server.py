@@ -13,11 +13,40 @@ from typing import Any, Dict
 # Add current directory to path for imports
 sys.path.insert(0, str(__file__).replace('/mcp_server.py', ''))
 
-from bootstrap import init_env
+from bootstrap import init_env, use_uvloop
 from enhanced_server import EnhancedMCPServer
+from services import close_shared_session
 
 init_env()
 
+# orjson is optional; responses fall back to the stdlib encoder without it
+try:
+    import orjson
+
+    def _encode(obj: Any) -> bytes:
+        """Serialize a JSON-RPC message for the wire"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def _encode_text(obj: Any) -> str:
+        """Serialize a tool or resource payload as indented JSON text"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _encode(obj: Any) -> bytes:
+        """Serialize a JSON-RPC message for the wire"""
+        return json.dumps(obj).encode()
+
+    def _encode_text(obj: Any) -> str:
+        """Serialize a tool or resource payload as indented JSON text"""
+        return json.dumps(obj, indent=2)
+
+
+def _send(message: Dict[str, Any]) -> None:
+    """Write one JSON-RPC message to stdout"""
+    # Flush text written via print() first so messages never interleave out of order
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_encode(message) + b"\n")
+    sys.stdout.buffer.flush()
+
 
 class MCPServer:
     """MCP Protocol Server Implementation"""
@@ -121,7 +150,7 @@ class MCPServer:
                     "content": [
                         {
                             "type": "text",
-                            "text": json.dumps(result, indent=2)
+                            "text": _encode_text(result)
                         }
                     ]
                 }
@@ -175,7 +204,7 @@ class MCPServer:
                                 {
                                     "uri": uri,
                                     "mimeType": "application/json",
-                                    "text": json.dumps(content, indent=2)
+                                    "text": _encode_text(content)
                                 }
                             ]
                         }
@@ -223,21 +252,21 @@ async def main():
             try:
                 request = json.loads(line)
             except json.JSONDecodeError as e:
-                print(json.dumps({
+                _send({
                     "jsonrpc": "2.0",
                     "id": None,
                     "error": {
                         "code": "ParseError",
                         "message": f"Invalid JSON: {e}"
                     }
-                }), flush=True)
+                })
                 continue
 
             # Handle request
             response = await server.handle_request(request)
 
             # Send response to stdout
-            print(json.dumps(response), flush=True)
+            _send(response)
 
         except KeyboardInterrupt:
             print("🛑 Server interrupted", file=sys.stderr)
@@ -252,10 +281,14 @@ async def main():
                     "message": str(e)
                 }
             }
-            print(json.dumps(error_response), flush=True)
+            _send(error_response)
+
+    # Release pooled HTTP connections held by the service handlers
+    await close_shared_session()
 
 
 if __name__ == "__main__":
+    use_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
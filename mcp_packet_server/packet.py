@@ -4,11 +4,16 @@ Enhanced with comprehensive error handling and validation
 """
 
 import json
+import sys
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__ on the
+# small records that validation creates for every packet
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class PacketStatus(str, Enum):
@@ -28,7 +33,7 @@ class PacketPriority(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ErrorDetails:
     """Detailed error information for debugging and resolution"""
     error_type: str  # "FORMAT_ERROR", "VALIDATION_ERROR", "EXECUTION_ERROR"
@@ -60,7 +65,7 @@ class ErrorDetails:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationResults:
     """Results of packet validation with detailed error information"""
     is_valid: bool
@@ -177,6 +182,18 @@ class MCPPacket:
         )
         self.processing_log.append(step)
 
+    def extend_processing_log(self, steps: Iterable[Tuple[Any, ...]]) -> None:
+        """Add several processing steps sharing one timestamp
+
+        Each step is (step_name, step_type, status) optionally followed by
+        details, duration_ms and error_details, as for add_processing_step.
+        """
+        now = datetime.utcnow().isoformat()
+        self.processing_log.extend(
+            ProcessingStep(step_name, step_type, now, status, *rest)
+            for step_name, step_type, status, *rest in steps
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert packet to dictionary for serialization"""
         packet_dict = asdict(self)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Run the offline test scripts on one shared event loop
+Also the package entry point: python -m mcp_packet_server
+"""
+
+import sys
+from pathlib import Path
+
+# The scripts use flat imports, so put the package directory on the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import test_basic
+import test_deeppcb
+import test_enhanced_validation
+import test_gmail_integration
+import test_todoist
+from bootstrap import buffer_stdout, init_test_logging, run_all, use_uvloop
+from warmup import warm_up
+
+
+def main() -> None:
+    """Run every offline test script and exit non-zero if any of them fails"""
+    buffer_stdout()
+    init_test_logging()
+    use_uvloop()
+    warm_up()
+    try:
+        results = run_all([
+            test_basic.main,
+            test_enhanced_validation.main,
+            test_deeppcb.main,
+            test_gmail_integration.main,
+            test_todoist.main,
+        ])
+        if not all(results):
+            sys.exit(1)
+    except KeyboardInterrupt:
+        print("\n🛑 Tests interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Tests failed with error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
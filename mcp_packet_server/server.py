@@ -9,7 +9,7 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from bootstrap import init_env
+from bootstrap import init_env, use_uvloop
 
 init_env()
 
@@ -19,6 +19,8 @@ from services import (
     GmailServiceHandler,
     GoogleCalendarServiceHandler,
     TodoistServiceHandler,
+    close_shared_session,
+    summarize_services,
 )
 
 
@@ -42,6 +44,9 @@ class MCPPacketServer:
             'deep_pcb': DeepPCBServiceHandler()
         }
 
+        # Handler capabilities are class-level constants, so summarise them once
+        self._service_info = summarize_services(self.service_handlers)
+
         # Packet execution tracking
         self.packet_queue = {}
         self.execution_history = {}
@@ -260,12 +265,8 @@ class MCPPacketServer:
         include_schemas = arguments.get("include_schemas", False)
 
         services = {}
-        for service_name, handler in self.service_handlers.items():
-            service_info = {
-                "name": service_name,
-                "supported_actions": handler.supported_actions,
-                "supported_item_types": handler.supported_item_types
-            }
+        for service_name, cached_info in self._service_info.items():
+            service_info = dict(cached_info)
 
             if include_schemas:
                 service_info["schema"] = await self._get_service_schema_internal(service_name)
@@ -506,13 +507,10 @@ class MCPPacketServer:
 
     def _get_services_summary(self) -> Dict[str, Any]:
         """Get summary of all services"""
-        summary = {}
-        for service_name, handler in self.service_handlers.items():
-            summary[service_name] = {
-                "supported_actions": handler.supported_actions,
-                "supported_item_types": handler.supported_item_types,
-                "total_operations": len(handler.supported_actions) * len(handler.supported_item_types)
-            }
+        summary: Dict[str, Any] = {
+            service_name: {key: value for key, value in info.items() if key != "name"}
+            for service_name, info in self._service_info.items()
+        }
 
         total_operations = sum(service["total_operations"] for service in summary.values())
         summary["_meta"] = {
@@ -527,7 +525,7 @@ class MCPPacketServer:
         """Get the schema for MCP packets"""
         # Dynamically generate schema from service handlers
         available_services = list(self.service_handlers.keys())
-        available_actions = []
+        available_actions: List[str] = []
         for handler in self.service_handlers.values():
             available_actions.extend(handler.supported_actions)
         available_actions = list(set(available_actions))  # Remove duplicates
@@ -548,78 +546,84 @@ async def main():
     """Main entry point for testing"""
     server = MCPPacketServer()
 
-    print("🚀 MCP Packet Server - Proof of Concept")
-    print("=" * 50)
-    print(f"📚 Available tools: {len(server.tools)} (consolidated from 137!)")
-    print(f"🔗 Available resources: {len(server.resources)}")
-
-    # List available tools
-    print("\n📋 Core Tools:")
-    for tool in server.list_tools():
-        print(f"  • {tool['name']}: {tool['description']}")
-
-    # List available services
-    print("\n🔧 Available Services:")
-    services_result = await server._list_services({})
-    for service_name, service_info in services_result["services"].items():
-        total_ops = len(service_info["supported_actions"]) * len(service_info["supported_item_types"])
-        print(f"  • {service_name}: {total_ops} operations")
-
-    # Test packet execution
-    print("\n🧪 Testing Packet Execution:")
-
-    # Test 1: Create Todoist task
-    print("\n1. Creating Todoist task...")
-    task_result = await server._execute_packet({
-        "tool_type": "todoist",
-        "action": "create",
-        "item_type": "task",
-        "payload": {
-            "content": "Test task from MCP Packet Server",
-            "due_date": "tomorrow",
-            "priority": 2
-        }
-    })
-    print(f"   Result: {task_result}")
-
-    # Test 2: Create Google Calendar event
-    print("\n2. Creating Google Calendar event...")
-    event_result = await server._execute_packet({
-        "tool_type": "gcal",
-        "action": "create",
-        "item_type": "event",
-        "payload": {
-            "summary": "Test Event from MCP Packet Server",
-            "start_time": "2024-01-15T14:00:00Z",
-            "end_time": "2024-01-15T15:00:00Z"
-        }
-    })
-    print(f"   Result: {event_result}")
-
-    # Test 3: Batch execution
-    print("\n3. Testing batch execution...")
-    batch_result = await server._batch_execute({
-        "packets": [
-            {
-                "tool_type": "todoist",
-                "action": "list",
-                "item_type": "task",
-                "payload": {"limit": 5}
-            },
-            {
-                "tool_type": "gmail",
-                "action": "search",
-                "item_type": "email",
-                "payload": {"query": "test", "max_results": 3}
+    try:
+
+        print("🚀 MCP Packet Server - Proof of Concept")
+        print("=" * 50)
+        print(f"📚 Available tools: {len(server.tools)} (consolidated from 137!)")
+        print(f"🔗 Available resources: {len(server.resources)}")
+
+        # List available tools
+        print("\n📋 Core Tools:")
+        for tool in server.list_tools():
+            print(f"  • {tool['name']}: {tool['description']}")
+
+        # List available services
+        print("\n🔧 Available Services:")
+        services_result = await server._list_services({})
+        for service_name, service_info in services_result["services"].items():
+            total_ops = len(service_info["supported_actions"]) * len(service_info["supported_item_types"])
+            print(f"  • {service_name}: {total_ops} operations")
+
+        # Test packet execution
+        print("\n🧪 Testing Packet Execution:")
+
+        # Test 1: Create Todoist task
+        print("\n1. Creating Todoist task...")
+        task_result = await server._execute_packet({
+            "tool_type": "todoist",
+            "action": "create",
+            "item_type": "task",
+            "payload": {
+                "content": "Test task from MCP Packet Server",
+                "due_date": "tomorrow",
+                "priority": 2
             }
-        ],
-        "parallel": True
-    })
-    print(f"   Result: {batch_result}")
+        })
+        print(f"   Result: {task_result}")
+
+        # Test 2: Create Google Calendar event
+        print("\n2. Creating Google Calendar event...")
+        event_result = await server._execute_packet({
+            "tool_type": "gcal",
+            "action": "create",
+            "item_type": "event",
+            "payload": {
+                "summary": "Test Event from MCP Packet Server",
+                "start_time": "2024-01-15T14:00:00Z",
+                "end_time": "2024-01-15T15:00:00Z"
+            }
+        })
+        print(f"   Result: {event_result}")
+
+        # Test 3: Batch execution
+        print("\n3. Testing batch execution...")
+        batch_result = await server._batch_execute({
+            "packets": [
+                {
+                    "tool_type": "todoist",
+                    "action": "list",
+                    "item_type": "task",
+                    "payload": {"limit": 5}
+                },
+                {
+                    "tool_type": "gmail",
+                    "action": "search",
+                    "item_type": "email",
+                    "payload": {"query": "test", "max_results": 3}
+                }
+            ],
+            "parallel": True
+        })
+        print(f"   Result: {batch_result}")
 
-    print("\n✅ MCP Packet Server test completed successfully!")
-    print(f"🎯 Successfully consolidated 137 tools into just {len(server.tools)} core tools!")
+        print("\n✅ MCP Packet Server test completed successfully!")
+        print(f"🎯 Successfully consolidated 137 tools into just {len(server.tools)} core tools!")
+    finally:
+        # Release pooled HTTP connections held by the service handlers
+        await close_shared_session()
 
 
 if __name__ == "__main__":
+    use_uvloop()
     asyncio.run(main())
@@ -3,7 +3,8 @@ Services package for MCP Packet Server
 Each service has its own handler file for better maintainability
 """
 
-from .base_handler import BaseServiceHandler
+from ._http import close_shared_session, get_shared_session
+from .base_handler import BaseServiceHandler, summarize_services
 from .deep_pcb_handler import DeepPCBServiceHandler
 from .gmail_handler import GmailServiceHandler
 from .google_calendar_handler import GoogleCalendarServiceHandler
@@ -14,5 +15,8 @@ __all__ = [
     'DeepPCBServiceHandler',
     'TodoistServiceHandler',
     'GoogleCalendarServiceHandler',
-    'GmailServiceHandler'
+    'GmailServiceHandler',
+    'summarize_services',
+    'get_shared_session',
+    'close_shared_session'
 ]
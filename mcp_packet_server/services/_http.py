@@ -0,0 +1,59 @@
+"""
+Shared HTTP session for MCP Packet Server service handlers
+One aiohttp connection pool per process, reused by every async handler
+"""
+
+import asyncio
+from typing import Optional
+
+# aiohttp imports (with error handling)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+_session: Optional["aiohttp.ClientSession"] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_shared_session() -> "aiohttp.ClientSession":
+    """Return the process-wide session, opening it on first use"""
+    global _session, _session_loop
+
+    if not AIOHTTP_AVAILABLE:
+        raise RuntimeError("aiohttp is required for HTTP-backed service operations")
+
+    # Creation never awaits, so no lock is needed; a session is tied to the loop
+    # that opened it, so a new loop (e.g. a second asyncio.run) gets a new one
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        if _session is not None and not _session.closed:
+            _close_stale_session(_session, _session_loop)
+        connector = aiohttp.TCPConnector(limit=200, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75)
+        _session = aiohttp.ClientSession(connector=connector)
+        _session_loop = loop
+    return _session
+
+
+def _close_stale_session(session: "aiohttp.ClientSession", session_loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close a session left behind by an earlier event loop so its connector is not leaked"""
+    if session_loop is not None and session_loop.is_running():
+        # Still serving another thread; close it on its own loop
+        asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+    else:
+        # The loop is finished, so nothing can await the close; shutting the
+        # connector marks the session closed without touching that loop
+        connector = session.connector
+        if connector is not None:
+            connector.close()
+
+
+async def close_shared_session() -> None:
+    """Close the process-wide session; call once on server shutdown"""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
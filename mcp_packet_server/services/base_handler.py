@@ -1,25 +1,127 @@
 """
 Base Service Handler for MCP Packet Server
-Abstract base class that all service handlers inherit from
+Base class that all service handlers inherit from
 """
 
+import asyncio
+import functools
 import time
-from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, ClassVar, Dict, FrozenSet, Optional, Tuple
 
 
-class BaseServiceHandler(ABC):
+def _iso_now(
+    _t: Callable[[], float] = time.time,
+    _gm: Callable[[float], time.struct_time] = time.gmtime,
+    _sf: Callable[[str, time.struct_time], str] = time.strftime,
+) -> str:
+    """Current UTC time as an ISO 8601 string, without building a datetime"""
+    return _sf("%Y-%m-%dT%H:%M:%SZ", _gm(_t()))
+
+
+@functools.lru_cache(maxsize=256)
+def _mock_list(item_type: str, count: int, minute_bucket: int, created_key: str = "created_at") -> Tuple[Dict[str, Any], ...]:
+    """Mock list items for one minute bucket; callers must copy before handing them out"""
+    created = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(minute_bucket * 60))
+    return tuple(
+        {"id": f"{item_type}_{i}", "name": f"Sample {item_type} {i}", "status": "active", created_key: created}
+        for i in range(1, count + 1)
+    )
+
+
+async def _coalesced(inflight: Dict[Tuple, "asyncio.Future"], key: Tuple, factory: Callable[[], Awaitable]) -> Any:
+    """Share one in-flight call per key: later callers await the first caller's task"""
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    # Shielded so one caller being cancelled does not cancel the others' result
+    return await asyncio.shield(task)
+
+
+def handles(action: str) -> Callable:
+    """Register the decorated method as the handler for a non-create action"""
+    def decorator(func: Any) -> Any:
+        func._handles_action = action
+        return func
+    return decorator
+
+
+def creates(item_type: str) -> Callable:
+    """Register the decorated method as the create operation for an item type"""
+    def decorator(func: Any) -> Any:
+        func._creates_item_type = item_type
+        return func
+    return decorator
+
+
+class BaseServiceHandler:
     """Base class for all service handlers"""
 
+    # Instance state only; class-level tables below stay ordinary class attributes
+    __slots__ = ("service_name", "_success_skel", "_error_skel")
+
+    # Subclasses override these at class level; frozensets give O(1) lookups
+    supported_actions: ClassVar[FrozenSet[str]] = frozenset()
+    supported_item_types: ClassVar[FrozenSet[str]] = frozenset()
+
+    # action -> unbound method, built once per class from @handles markers
+    _DISPATCH: ClassVar[Dict[str, Callable]] = {}
+
+    # item type -> unbound create method, built once per class from @creates markers
+    _CREATE_DISPATCH: ClassVar[Dict[str, Callable]] = {}
+
+    # (payload key, item type) pairs used when the packet names no known item type
+    _CREATE_HINTS: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        dispatch = dict(cls._DISPATCH)
+        create_dispatch = dict(cls._CREATE_DISPATCH)
+        for attr in vars(cls).values():
+            action = getattr(attr, "_handles_action", None)
+            if action is not None:
+                dispatch[action] = attr
+            item_type = getattr(attr, "_creates_item_type", None)
+            if item_type is not None:
+                create_dispatch[item_type] = attr
+        cls._DISPATCH = dispatch
+        cls._CREATE_DISPATCH = create_dispatch
+
     def __init__(self, service_name: str):
         self.service_name = service_name
-        self.supported_actions = []
-        self.supported_item_types = []
 
-    @abstractmethod
-    async def execute(self, action: str, payload: Dict[str, Any], item_type: str = None) -> Any:
+        # Response skeletons, copied per call instead of rebuilt from literals
+        self._success_skel = {"success": True, "service": service_name}
+        self._error_skel = {"success": False, "service": service_name}
+
+    async def execute(self, action: str, payload: Dict[str, Any], item_type: Optional[str] = None) -> Any:
         """Execute the specified action with the given payload and item type"""
-        pass
+        if action == "create":
+            handler = self._resolve_create_handler(payload, item_type)
+        else:
+            method = self._DISPATCH.get(action)
+            if method is None:
+                raise ValueError(f"Unsupported action: {action}")
+            handler = method.__get__(self)
+
+        # Mock-only operations may be plain functions; only await coroutines
+        if asyncio.iscoroutinefunction(handler):
+            return await handler(payload)
+        return handler(payload)
+
+    def _resolve_create_handler(self, payload: Dict[str, Any], item_type: Optional[str] = None) -> Callable[[Dict[str, Any]], Any]:
+        """Return the operation that creates the requested item type"""
+        handler = self._CREATE_DISPATCH.get(item_type) if item_type is not None else None
+        if handler is None:
+            for key, hinted_type in self._CREATE_HINTS:
+                if key in payload:
+                    handler = self._CREATE_DISPATCH[hinted_type]
+                    break
+            else:
+                raise ValueError(f"Unsupported item type for creation: {item_type}")
+        bound: Callable[[Dict[str, Any]], Any] = handler.__get__(self)
+        return bound
 
     def supports_action(self, action: str) -> bool:
         """Check if this handler supports the given action"""
@@ -31,20 +133,20 @@ class BaseServiceHandler(ABC):
 
     def _create_response(self, success: bool, data: Any = None, error: str = None, execution_time: float = 0.0) -> Dict[str, Any]:
         """Create a standardized response format"""
-        response = {
-            "success": success,
-            "execution_time": execution_time,
-            "service": self.service_name
-        }
-
-        if success and data is not None:
-            response["result"] = data
-        elif not success and error is not None:
-            response["error"] = error
+        if success:
+            response = self._success_skel.copy()
+            response["execution_time"] = execution_time
+            if data is not None:
+                response["result"] = data
+        else:
+            response = self._error_skel.copy()
+            response["execution_time"] = execution_time
+            if error is not None:
+                response["error"] = error
 
         return response
 
-    async def _execute_with_timing(self, action: str, payload: Dict[str, Any], item_type: str = None) -> Dict[str, Any]:
+    async def _execute_with_timing(self, action: str, payload: Dict[str, Any], item_type: Optional[str] = None) -> Dict[str, Any]:
         """Execute operation with timing and error handling"""
         start_time = time.time()
 
@@ -66,3 +168,20 @@ class BaseServiceHandler(ABC):
                 error=str(e),
                 execution_time=execution_time
             )
+
+
+def summarize_services(service_handlers: Dict[str, BaseServiceHandler]) -> Dict[str, Dict[str, Any]]:
+    """Capability summary per service, built once by the servers
+
+    Actions and item types are sorted tuples, so shallow copies handed to
+    callers cannot change the cached summary.
+    """
+    return {
+        service_name: {
+            "name": service_name,
+            "supported_actions": tuple(sorted(handler.supported_actions)),
+            "supported_item_types": tuple(sorted(handler.supported_item_types)),
+            "total_operations": len(handler.supported_actions) * len(handler.supported_item_types)
+        }
+        for service_name, handler in service_handlers.items()
+    }
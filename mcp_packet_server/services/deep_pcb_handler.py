@@ -3,168 +3,146 @@ DeepPCB Service Handler for MCP Packet Server
 Handles PCB design and component management operations
 """
 
+import itertools
+import logging
 import os
+import re
 import time
-from datetime import datetime
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, FrozenSet, NamedTuple, Optional, Tuple
 
-from .base_handler import BaseServiceHandler
+from .base_handler import BaseServiceHandler, _iso_now, _mock_list, creates, handles
 
+_log = logging.getLogger(__name__)
 
-class DeepPCBServiceHandler(BaseServiceHandler):
-    """Handles DeepPCB-related packet operations"""
+# Strips anything but words, spaces and part-number punctuation from search queries
+_QUERY_RE = re.compile(r'[^\w\s:@.\-\+*]')
 
-    def __init__(self):
-        super().__init__("deep_pcb")
-        self.supported_actions = ["create", "read", "update", "delete", "list", "search"]
-        self.supported_item_types = ["pcb_design", "component", "footprint", "schematic", "layout"]
 
-        # Get DeepPCB API credentials from environment
-        self.api_key = os.getenv("DEEPPCB_API_KEY")
-        self.api_url = os.getenv("DEEPPCB_API_URL", "https://api.deeppcb.com/v1")
+@dataclass(frozen=True, repr=False)  # no repr, so the API key never reaches logs
+class _DeepPCBEnv:
+    """DeepPCB settings read from the environment once at import"""
 
-        if not self.api_key:
-            print("⚠️  Warning: DEEPPCB_API_KEY environment variable not set - DeepPCB operations will be limited")
-            self.api_key = None
-
-    async def execute(self, action: str, payload: Dict[str, Any], item_type: str = None) -> Any:
-        """Execute DeepPCB operation"""
-        if action == "create":
-            if item_type == "pcb_design" or payload.get("design_name"):
-                return await self._create_pcb_design(payload)
-            elif item_type == "component" or payload.get("component_name"):
-                return await self._create_component(payload)
-            elif item_type == "footprint":
-                return await self._create_footprint(payload)
-            elif item_type == "schematic":
-                return await self._create_schematic(payload)
-            elif item_type == "layout":
-                return await self._create_layout(payload)
-            else:
-                raise ValueError(f"Unsupported item type for creation: {item_type}")
+    __slots__ = ("api_key", "api_url")
 
-        elif action == "read":
-            return await self._read_item(payload)
+    api_key: Optional[str]
+    api_url: str
 
-        elif action == "update":
-            return await self._update_item(payload)
 
-        elif action == "delete":
-            return await self._delete_item(payload)
+_ENV = _DeepPCBEnv(
+    api_key=os.getenv("DEEPPCB_API_KEY") or None,
+    api_url=os.getenv("DEEPPCB_API_URL", "https://api.deeppcb.com/v1")
+)
 
-        elif action == "list":
-            return await self._list_items(payload)
 
-        elif action == "search":
-            return await self._search_items(payload)
+class _CreateSpec(NamedTuple):
+    """How to build one kind of DeepPCB item"""
 
-        else:
-            raise ValueError(f"Unsupported action: {action}")
+    name_field: str
+    id_prefix: str
+    fields: Tuple[Tuple[str, Any], ...]  # (payload key, default) copied after the name
+    status: str
+    result_key: str
+    label: str
+    missing_name_error: str
 
-    async def _create_pcb_design(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a new PCB design"""
-        design_name = payload.get("design_name")
-        description = payload.get("description", "")
-        layers = payload.get("layers", 2)
 
-        if not design_name:
-            raise ValueError("Design name is required for PCB design creation")
+_CREATE_SPECS = {
+    "pcb_design": _CreateSpec(
+        "design_name", "design_", (("description", ""), ("layers", 2)), "draft",
+        "design", "PCB design", "Design name is required for PCB design creation"
+    ),
+    "component": _CreateSpec(
+        "component_name", "comp_", (("package_type", "SMD"), ("pin_count", 0)), "active",
+        "component", "Component", "Component name is required for component creation"
+    ),
+    "footprint": _CreateSpec(
+        "footprint_name", "footprint_", (("package_type", "SMD"), ("dimensions", {})), "active",
+        "footprint", "Footprint", "Footprint name is required for footprint creation"
+    ),
+    "schematic": _CreateSpec(
+        "schematic_name", "schematic_", (("design_id", None),), "draft",
+        "schematic", "Schematic", "Schematic name is required for schematic creation"
+    ),
+    "layout": _CreateSpec(
+        "layout_name", "layout_", (("design_id", None), ("board_size", {"width": 100, "height": 100})), "draft",
+        "layout", "Layout", "Layout name is required for layout creation"
+    ),
+}
 
-        # Mock implementation - replace with actual DeepPCB API call
-        design_data = {
-            "id": f"design_{int(time.time())}",
-            "name": design_name,
-            "description": description,
-            "layers": layers,
-            "status": "draft",
-            "created_at": datetime.now().isoformat()
-        }
 
-        return {"design": design_data, "message": "PCB design created successfully"}
+class DeepPCBServiceHandler(BaseServiceHandler):
+    """Handles DeepPCB-related packet operations"""
 
-    async def _create_component(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a new component"""
-        component_name = payload.get("component_name")
-        package_type = payload.get("package_type", "SMD")
-        pin_count = payload.get("pin_count", 0)
+    __slots__ = ("api_key", "api_url", "_id_counter")
 
-        if not component_name:
-            raise ValueError("Component name is required for component creation")
+    supported_actions: ClassVar[FrozenSet[str]] = frozenset({"create", "read", "update", "delete", "list", "search"})
+    supported_item_types: ClassVar[FrozenSet[str]] = frozenset({"pcb_design", "component", "footprint", "schematic", "layout"})
 
-        # Mock implementation - replace with actual DeepPCB API call
-        component_data = {
-            "id": f"comp_{int(time.time())}",
-            "name": component_name,
-            "package_type": package_type,
-            "pin_count": pin_count,
-            "status": "active",
-            "created_at": datetime.now().isoformat()
-        }
+    # Payload keys that identify the item type when the packet omits it
+    _CREATE_HINTS = (("design_name", "pcb_design"), ("component_name", "component"))
 
-        return {"component": component_data, "message": "Component created successfully"}
+    def __init__(self):
+        super().__init__("deep_pcb")
 
-    async def _create_footprint(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a new footprint"""
-        footprint_name = payload.get("footprint_name")
-        package_type = payload.get("package_type", "SMD")
-        dimensions = payload.get("dimensions", {})
+        # Mock ids: a millisecond-seeded counter, so bursts of creates never collide
+        self._id_counter = itertools.count(int(time.time() * 1000))
 
-        if not footprint_name:
-            raise ValueError("Footprint name is required for footprint creation")
+        # DeepPCB API credentials from the import-time environment snapshot
+        self.api_key = _ENV.api_key
+        self.api_url = _ENV.api_url
 
-        # Mock implementation - replace with actual DeepPCB API call
-        footprint_data = {
-            "id": f"footprint_{int(time.time())}",
-            "name": footprint_name,
-            "package_type": package_type,
-            "dimensions": dimensions,
-            "status": "active",
-            "created_at": datetime.now().isoformat()
-        }
-
-        return {"footprint": footprint_data, "message": "Footprint created successfully"}
+        if not self.api_key:
+            _log.warning("DEEPPCB_API_KEY environment variable not set - DeepPCB operations will be limited")
 
-    async def _create_schematic(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a new schematic"""
-        schematic_name = payload.get("schematic_name")
-        design_id = payload.get("design_id")
+    @creates("pcb_design")
+    def _create_pcb_design(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new PCB design"""
+        return self._create_generic("pcb_design", payload)
 
-        if not schematic_name:
-            raise ValueError("Schematic name is required for schematic creation")
+    @creates("component")
+    def _create_component(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new component"""
+        return self._create_generic("component", payload)
 
-        # Mock implementation - replace with actual DeepPCB API call
-        schematic_data = {
-            "id": f"schematic_{int(time.time())}",
-            "name": schematic_name,
-            "design_id": design_id,
-            "status": "draft",
-            "created_at": datetime.now().isoformat()
-        }
+    @creates("footprint")
+    def _create_footprint(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new footprint"""
+        return self._create_generic("footprint", payload)
 
-        return {"schematic": schematic_data, "message": "Schematic created successfully"}
+    @creates("schematic")
+    def _create_schematic(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new schematic"""
+        return self._create_generic("schematic", payload)
 
-    async def _create_layout(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    @creates("layout")
+    def _create_layout(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new layout"""
-        layout_name = payload.get("layout_name")
-        design_id = payload.get("design_id")
-        board_size = payload.get("board_size", {"width": 100, "height": 100})
+        return self._create_generic("layout", payload)
+
+    def _create_generic(self, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Create any DeepPCB item described by its _CREATE_SPECS entry"""
+        spec = _CREATE_SPECS[kind]
+        name = payload.get(spec.name_field)
 
-        if not layout_name:
-            raise ValueError("Layout name is required for layout creation")
+        if not name:
+            raise ValueError(spec.missing_name_error)
 
         # Mock implementation - replace with actual DeepPCB API call
-        layout_data = {
-            "id": f"layout_{int(time.time())}",
-            "name": layout_name,
-            "design_id": design_id,
-            "board_size": board_size,
-            "status": "draft",
-            "created_at": datetime.now().isoformat()
-        }
+        data = {"id": f"{spec.id_prefix}{next(self._id_counter)}", "name": name}
+        for field_name, default in spec.fields:
+            if field_name in payload:
+                data[field_name] = payload[field_name]
+            else:
+                # Copy dict defaults so callers never share one mutable object
+                data[field_name] = dict(default) if isinstance(default, dict) else default
+        data["status"] = spec.status
+        data["created_at"] = _iso_now()
 
-        return {"layout": layout_data, "message": "Layout created successfully"}
+        return {spec.result_key: data, "message": f"{spec.label} created successfully"}
 
-    async def _read_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    @handles("read")
+    def _read_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Read a DeepPCB item"""
         item_id = payload.get("id")
         item_type = payload.get("item_type", "pcb_design")
@@ -177,12 +155,13 @@ class DeepPCBServiceHandler(BaseServiceHandler):
             "id": item_id,
             "name": f"Sample {item_type}",
             "status": "active",
-            "created_at": datetime.now().isoformat()
+            "created_at": _iso_now()
         }
 
         return {"item": mock_data, "item_type": item_type}
 
-    async def _update_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    @handles("update")
+    def _update_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Update a DeepPCB item"""
         item_id = payload.get("id")
         updates = payload.get("updates", {})
@@ -198,12 +177,13 @@ class DeepPCBServiceHandler(BaseServiceHandler):
             "id": item_id,
             "updated_fields": list(updates.keys()),
             "status": "updated",
-            "updated_at": datetime.now().isoformat()
+            "updated_at": _iso_now()
         }
 
         return {"item": updated_data, "message": "Item updated successfully"}
 
-    async def _delete_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    @handles("delete")
+    def _delete_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Delete a DeepPCB item"""
         item_id = payload.get("id")
 
@@ -213,27 +193,22 @@ class DeepPCBServiceHandler(BaseServiceHandler):
         # Mock implementation - replace with actual DeepPCB API call
         return {"message": f"Item {item_id} deleted successfully"}
 
-    async def _list_items(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    @handles("list")
+    def _list_items(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """List DeepPCB items"""
         item_type = payload.get("item_type", "pcb_design")
         max_results = payload.get("max_results", 10)
 
         # Mock implementation - replace with actual DeepPCB API call
-        mock_items = [
-            {
-                "id": f"{item_type}_{i}",
-                "name": f"Sample {item_type} {i}",
-                "status": "active",
-                "created_at": datetime.now().isoformat()
-            }
-            for i in range(1, min(max_results + 1, 6))
-        ]
+        count = min(max_results, 5)
+        mock_items = [item.copy() for item in _mock_list(item_type, count, int(time.time()) // 60)]
 
         return {"items": mock_items, "count": len(mock_items), "item_type": item_type}
 
-    async def _search_items(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    @handles("search")
+    def _search_items(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Search DeepPCB items"""
-        query = payload.get("query", "")
+        query = _QUERY_RE.sub('', payload.get("query", ""))
         item_type = payload.get("item_type", "pcb_design")
         max_results = payload.get("max_results", 10)
 
@@ -241,14 +216,16 @@ class DeepPCBServiceHandler(BaseServiceHandler):
             raise ValueError("Search query is required")
 
         # Mock implementation - replace with actual DeepPCB API call
+        count = min(max_results, 3)
+        now_iso = _iso_now()
         mock_results = [
             {
                 "id": f"{item_type}_search_{i}",
                 "name": f"Search result {i} for '{query}'",
                 "status": "active",
-                "created_at": datetime.now().isoformat()
+                "created_at": now_iso
             }
-            for i in range(1, min(max_results + 1, 4))
+            for i in range(1, count + 1)
         ]
 
         return {"items": mock_results, "count": len(mock_results), "query": query, "item_type": item_type}
@@ -3,50 +3,134 @@ Gmail Service Handler for MCP Packet Server
 Handles email and label management operations
 """
 
+import asyncio
+import base64
+import itertools
+import json
+import logging
 import os
+import re
 import time
-from datetime import datetime
-from typing import Any, Dict
+from dataclasses import dataclass
+from email.header import Header
+from email.message import Message
+from email.parser import BytesParser
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Union, cast
 
-from .base_handler import BaseServiceHandler
+from ._http import AIOHTTP_AVAILABLE, get_shared_session
+from .base_handler import BaseServiceHandler, _iso_now, _mock_list, creates, handles
+
+_log = logging.getLogger(__name__)
 
 # Gmail imports (with error handling)
 try:
     from google.auth.transport.requests import Request as GmailRequest
     from google.oauth2.credentials import Credentials as GmailCredentials
     from google_auth_oauthlib.flow import InstalledAppFlow as GmailInstalledAppFlow
-    from googleapiclient.discovery import build as gmail_build
-    from googleapiclient.errors import HttpError as GmailHttpError
     GMAIL_AVAILABLE = True
 except ImportError:
     GMAIL_AVAILABLE = False
-    print("⚠️  Warning: Gmail API libraries not available - Gmail operations will be limited")
+    _log.warning("Gmail API libraries not available - Gmail operations will be limited")
+
+if not AIOHTTP_AVAILABLE:
+    _log.warning("aiohttp not available - Gmail operations will be limited")
+
+GMAIL_API_URL = "https://gmail.googleapis.com/gmail/v1/users/me"
+GMAIL_BATCH_URL = "https://gmail.googleapis.com/batch/gmail/v1"
+GMAIL_BATCH_BOUNDARY = "batch_cairn"
+GMAIL_BATCH_LIMIT = 100  # Gmail accepts at most 100 sub-requests per batch
+
+# Control characters never belong in a query; Gmail operators like "..." and () are kept
+_QUERY_RE = re.compile(r'[\x00-\x1f\x7f]')
+
+
+@dataclass(frozen=True)
+class _GmailEnv:
+    """Gmail credential paths read from the environment once at import"""
+
+    __slots__ = ("token_path", "credentials_path")
+
+    token_path: str
+    credentials_path: str
+
+
+_ENV = _GmailEnv(
+    token_path=os.getenv("GMAIL_TOKEN_PATH", "../gmail/token.json"),
+    credentials_path=os.getenv("GMAIL_CREDENTIALS_PATH", "../gmail/client_secret.json")
+)
+
+# Fixed headers for plain-text messages, prebuilt once
+_MESSAGE_TRAILER = b"MIME-Version: 1.0\r\nContent-Type: text/plain; charset=utf-8\r\nContent-Transfer-Encoding: 8bit\r\n\r\n"
+
+
+class GmailHttpError(Exception):
+    """Non-success response from the Gmail REST API"""
+
+    def __init__(self, status: int, reason: str):
+        super().__init__(f"{status} {reason}")
+        self.status = status
 
 
 class GmailServiceHandler(BaseServiceHandler):
     """Handles Gmail-related packet operations"""
 
+    __slots__ = ("_creds", "_service_initialized", "_id_counter")
+
+    supported_actions: ClassVar[FrozenSet[str]] = frozenset({"create", "read", "update", "delete", "list", "search"})
+    supported_item_types: ClassVar[FrozenSet[str]] = frozenset({"email", "label", "attachment"})
+
+    # Payload keys that identify the item type when the packet omits it
+    _CREATE_HINTS = (("to", "email"),)
+
+    # Credentials are loaded once per process and shared by every instance
+    _creds_cache: ClassVar[Optional[Any]] = None
+    _creds_loaded: ClassVar[bool] = False
+    _creds_lock: ClassVar[Optional[asyncio.Lock]] = None
+
     def __init__(self):
         super().__init__("gmail")
-        self.supported_actions = ["create", "read", "update", "delete", "list", "search"]
-        self.supported_item_types = ["email", "label", "attachment"]
 
-        # Initialize Gmail API client
-        self.service = self._get_gmail_service()
-
-    def _get_gmail_service(self):
-        """Get authenticated Gmail service"""
-        if not GMAIL_AVAILABLE:
-            print("⚠️  Warning: Gmail API libraries not available - using mock service")
+        # Mock ids: a millisecond-seeded counter, so bursts of creates never collide
+        self._id_counter = itertools.count(int(time.time() * 1000))
+
+        # OAuth credentials are loaded on first use; HTTP goes through the shared session
+        self._creds: Any = None
+        self._service_initialized = False
+
+    async def execute(self, action: str, payload: Dict[str, Any], item_type: Optional[str] = None) -> Any:
+        """Execute Gmail operation once credentials are loaded"""
+        if not self._service_initialized:
+            await self._ensure_credentials()
+        return await super().execute(action, payload, item_type)
+
+    async def _ensure_credentials(self):
+        """Load the shared credentials on first use"""
+        cls = type(self)
+        if not cls._creds_loaded:
+            # Created lazily so the lock binds to the running loop
+            if cls._creds_lock is None:
+                cls._creds_lock = asyncio.Lock()
+            async with cls._creds_lock:
+                if not cls._creds_loaded:
+                    # Disk reads, token refresh and the OAuth browser flow all block
+                    cls._creds_cache = await asyncio.to_thread(self._get_gmail_credentials)
+                    cls._creds_loaded = True
+        self._creds = cls._creds_cache
+        self._service_initialized = True
+
+    def _get_gmail_credentials(self) -> Any:
+        """Get authenticated Gmail credentials"""
+        if not GMAIL_AVAILABLE or not AIOHTTP_AVAILABLE:
+            _log.warning("Gmail API libraries not available - using mock service")
             return None
 
         try:
             SCOPES = ['https://www.googleapis.com/auth/gmail.modify']
 
             creds = None
-            # Get credential paths from environment variables
-            token_path = os.getenv("GMAIL_TOKEN_PATH", "../gmail/token.json")
-            credentials_path = os.getenv("GMAIL_CREDENTIALS_PATH", "../gmail/client_secret.json")
+            # Credential paths from the import-time environment snapshot
+            token_path = _ENV.token_path
+            credentials_path = _ENV.credentials_path
 
             if os.path.exists(token_path):
                 creds = GmailCredentials.from_authorized_user_file(token_path, SCOPES)
@@ -57,8 +141,10 @@ class GmailServiceHandler(BaseServiceHandler):
                     creds.refresh(GmailRequest())
                 else:
                     if not os.path.exists(credentials_path):
-                        print(f"⚠️  Warning: Gmail credentials file not found: {credentials_path}")
-                        print("   Set GMAIL_CREDENTIALS_PATH environment variable to fix this")
+                        _log.warning(
+                            "Gmail credentials file not found: %s (set GMAIL_CREDENTIALS_PATH to fix this)",
+                            credentials_path
+                        )
                         return None
 
                     flow = GmailInstalledAppFlow.from_client_secrets_file(credentials_path, SCOPES)
@@ -68,39 +154,99 @@ class GmailServiceHandler(BaseServiceHandler):
                 with open(token_path, 'w') as token:
                     token.write(creds.to_json())
 
-            return gmail_build('gmail', 'v1', credentials=creds)
+            return creds
         except Exception as e:
-            print(f"⚠️  Warning: Failed to initialize Gmail service: {e}")
+            _log.warning("Failed to initialize Gmail service: %s", e)
             return None
 
-    async def execute(self, action: str, payload: Dict[str, Any], item_type: str = None) -> Any:
-        """Execute Gmail operation"""
-        if action == "create":
-            if item_type == "email" or "to" in payload:
-                return await self._create_email(payload)
-            elif item_type == "label":
-                return await self._create_label(payload)
-            else:
-                raise ValueError(f"Unsupported item type for creation: {item_type}")
-
-        elif action == "read":
-            return await self._read_item(payload)
-
-        elif action == "update":
-            return await self._update_item(payload)
-
-        elif action == "delete":
-            return await self._delete_item(payload)
-
-        elif action == "list":
-            return await self._list_items(payload)
-
-        elif action == "search":
-            return await self._search_items(payload)
+    async def _access_token(self) -> str:
+        """Return a bearer token, refreshing only once the cached one expires"""
+        if self._creds.expired and self._creds.refresh_token:
+            await asyncio.to_thread(self._creds.refresh, GmailRequest())
+        return cast(str, self._creds.token)
+
+    async def _request(
+        self, method: str, path: str, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Call the Gmail REST API and return the decoded JSON body"""
+        headers = {"Authorization": f"Bearer {await self._access_token()}"}
+        session = await get_shared_session()
+        async with session.request(
+            method, f"{GMAIL_API_URL}{path}", headers=headers, params=params, json=json
+        ) as response:
+            if response.status >= 400:
+                raise GmailHttpError(response.status, await response.text())
+            if response.status == 204:
+                return None
+            return await response.json()
+
+    async def _batch_get_messages(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch full messages for ids with one batch request per 100 ids"""
+        messages = []
+        for start in range(0, len(ids), GMAIL_BATCH_LIMIT):
+            messages.extend(await self._batch_get_chunk(ids[start:start + GMAIL_BATCH_LIMIT]))
+        return messages
+
+    async def _batch_get_chunk(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """Send one multipart batch of messages.get sub-requests"""
+        parts = [
+            f"--{GMAIL_BATCH_BOUNDARY}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <item{i}>\r\n\r\n"
+            f"GET /gmail/v1/users/me/messages/{message_id}\r\n\r\n"
+            for i, message_id in enumerate(ids)
+        ]
+        parts.append(f"--{GMAIL_BATCH_BOUNDARY}--\r\n")
+        headers = {
+            "Authorization": f"Bearer {await self._access_token()}",
+            "Content-Type": f"multipart/mixed; boundary={GMAIL_BATCH_BOUNDARY}"
+        }
+
+        session = await get_shared_session()
+        async with session.post(GMAIL_BATCH_URL, data="".join(parts), headers=headers) as response:
+            if response.status >= 400:
+                raise GmailHttpError(response.status, await response.text())
+            content_type = response.headers["Content-Type"]
+            body = await response.read()
+
+        return self._parse_batch_response(content_type, body, ids)
+
+    @staticmethod
+    def _parse_batch_response(content_type: str, body: bytes, ids: List[str]) -> List[Dict[str, Any]]:
+        """Split a multipart batch response into messages ordered like ids"""
+        envelope = BytesParser().parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+        results: List[Dict[str, Any]] = [{"id": message_id, "error": "missing from batch response"} for message_id in ids]
+
+        # A non-multipart body (e.g. a bare error page) leaves every id with its default error
+        if not envelope.is_multipart():
+            return results
+
+        for part in cast(List[Message], envelope.get_payload()):
+            # Responses echo our Content-ID as <response-item{i}>; parts that can't be placed
+            # are skipped, leaving their id with the default error
+            _, _, suffix = (part["Content-ID"] or "").strip("<>").rpartition("item")
+            if not suffix.isdecimal() or int(suffix) >= len(ids):
+                continue
+            index = int(suffix)
+
+            http_response = part.get_payload(decode=True)
+            if not isinstance(http_response, bytes):
+                results[index] = {"id": ids[index], "error": "empty batch response part"}
+                continue
+            head, _, payload = http_response.partition(b"\r\n\r\n")
+            status_line = head.split(b"\r\n", 1)[0].decode("latin-1")
+            status = status_line.split(" ", 2)
+            if len(status) < 2 or status[1] != "200":
+                results[index] = {"id": ids[index], "error": status_line or "malformed batch response part"}
+                continue
+            try:
+                results[index] = json.loads(payload)
+            except ValueError:
+                results[index] = {"id": ids[index], "error": "malformed JSON in batch response part"}
 
-        else:
-            raise ValueError(f"Unsupported action: {action}")
+        return results
 
+    @creates("email")
     async def _create_email(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Gmail email (send)"""
         to = payload.get("to", [])
@@ -115,17 +261,17 @@ class GmailServiceHandler(BaseServiceHandler):
         if not subject:
             raise ValueError("Email subject is required")
 
-        if not self.service:
+        if not self._creds:
             # Mock implementation when service is not available
             email_data = {
-                "id": f"email_{int(time.time())}",
+                "id": f"email_{next(self._id_counter)}",
                 "to": to,
                 "subject": subject,
                 "body": body,
                 "cc": cc,
                 "bcc": bcc,
                 "status": "sent",
-                "created": datetime.now().isoformat()
+                "created": _iso_now()
             }
             return {"email": email_data, "message": "Email sent successfully (mock mode)"}
 
@@ -135,10 +281,7 @@ class GmailServiceHandler(BaseServiceHandler):
             message = self._create_message(to, subject, body, cc, bcc)
 
             # Send the email
-            sent_message = self.service.users().messages().send(
-                userId='me',
-                body=message
-            ).execute()
+            sent_message = await self._request("POST", "/messages/send", json=message)
 
             return {"email": sent_message, "message": "Email sent successfully"}
         except GmailHttpError as error:
@@ -146,20 +289,30 @@ class GmailServiceHandler(BaseServiceHandler):
 
     def _create_message(self, to, subject, body, cc=None, bcc=None):
         """Create a Gmail message"""
-        import base64
-        from email.mime.text import MIMEText
-
-        message = MIMEText(body)
-        message['to'] = ', '.join(to) if isinstance(to, list) else to
-        message['subject'] = subject
-
+        headers = [b"To: " + self._header_value(to)]
         if cc:
-            message['cc'] = ', '.join(cc) if isinstance(cc, list) else cc
+            headers.append(b"Cc: " + self._header_value(cc))
         if bcc:
-            message['bcc'] = ', '.join(bcc) if isinstance(bcc, list) else bcc
-
-        return {'raw': base64.urlsafe_b64encode(message.as_bytes()).decode()}
-
+            headers.append(b"Bcc: " + self._header_value(bcc))
+
+        # Non-ASCII subjects need RFC 2047 encoded words, folded with CRLF like the other headers
+        subject_value = self._header_value(subject)
+        if not subject.isascii():
+            subject_value = Header(subject, "utf-8").encode(linesep="\r\n").encode("ascii")
+        headers.append(b"Subject: " + subject_value)
+
+        message = b"\r\n".join(headers) + b"\r\n" + _MESSAGE_TRAILER + body.encode("utf-8")
+        return {'raw': base64.urlsafe_b64encode(message).decode('ascii')}
+
+    @staticmethod
+    def _header_value(value: Union[str, List[str]]) -> bytes:
+        """Encode a header value, refusing line breaks that would inject headers"""
+        text = ', '.join(value) if isinstance(value, list) else value
+        if "\r" in text or "\n" in text:
+            raise ValueError("Email header values must not contain line breaks")
+        return text.encode("utf-8")
+
+    @creates("label")
     async def _create_label(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Gmail label"""
         name = payload.get("name")
@@ -169,15 +322,15 @@ class GmailServiceHandler(BaseServiceHandler):
         if not name:
             raise ValueError("Label name is required")
 
-        if not self.service:
+        if not self._creds:
             # Mock implementation
             label_data = {
-                "id": f"label_{int(time.time())}",
+                "id": f"label_{next(self._id_counter)}",
                 "name": name,
                 "labelListVisibility": label_list_visibility,
                 "messageListVisibility": message_list_visibility,
                 "status": "active",
-                "created": datetime.now().isoformat()
+                "created": _iso_now()
             }
             return {"label": label_data, "message": "Label created successfully (mock mode)"}
 
@@ -189,15 +342,13 @@ class GmailServiceHandler(BaseServiceHandler):
                 'messageListVisibility': message_list_visibility
             }
 
-            label = self.service.users().labels().create(
-                userId='me',
-                body=label_body
-            ).execute()
+            label = await self._request("POST", "/labels", json=label_body)
 
             return {"label": label, "message": "Label created successfully"}
         except GmailHttpError as error:
             raise Exception(f"Gmail API error: {error}")
 
+    @handles("read")
     async def _read_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Read a Gmail item"""
         item_id = payload.get("id")
@@ -206,35 +357,30 @@ class GmailServiceHandler(BaseServiceHandler):
         if not item_id:
             raise ValueError("Item ID is required for read operations")
 
-        if not self.service:
+        if not self._creds:
             # Mock implementation
             mock_data = {
                 "id": item_id,
                 "name": f"Sample {item_type}",
                 "status": "active",
-                "created": datetime.now().isoformat()
+                "created": _iso_now()
             }
             return {"item": mock_data, "item_type": item_type}
 
         # Real API implementation
         try:
             if item_type == "email":
-                message = self.service.users().messages().get(
-                    userId='me',
-                    id=item_id
-                ).execute()
+                message = await self._request("GET", f"/messages/{item_id}")
                 return {"item": message, "item_type": item_type}
             elif item_type == "label":
-                label = self.service.users().labels().get(
-                    userId='me',
-                    id=item_id
-                ).execute()
+                label = await self._request("GET", f"/labels/{item_id}")
                 return {"item": label, "item_type": item_type}
             else:
                 raise ValueError(f"Unsupported item type: {item_type}")
         except GmailHttpError as error:
             raise Exception(f"Gmail API error: {error}")
 
+    @handles("update")
     async def _update_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Update a Gmail item"""
         item_id = payload.get("id")
@@ -246,13 +392,13 @@ class GmailServiceHandler(BaseServiceHandler):
         if not updates:
             raise ValueError("Updates are required for update operations")
 
-        if not self.service:
+        if not self._creds:
             # Mock implementation
             updated_data = {
                 "id": item_id,
                 "updated_fields": list(updates.keys()),
                 "status": "updated",
-                "updated": datetime.now().isoformat()
+                "updated": _iso_now()
             }
             return {"item": updated_data, "message": "Item updated successfully (mock mode)"}
 
@@ -266,11 +412,7 @@ class GmailServiceHandler(BaseServiceHandler):
                 if 'remove_label_ids' in updates:
                     modify_body['removeLabelIds'] = updates['remove_label_ids']
 
-                message = self.service.users().messages().modify(
-                    userId='me',
-                    id=item_id,
-                    body=modify_body
-                ).execute()
+                message = await self._request("POST", f"/messages/{item_id}/modify", json=modify_body)
 
                 return {"item": message, "message": "Message updated successfully"}
             else:
@@ -278,72 +420,77 @@ class GmailServiceHandler(BaseServiceHandler):
         except GmailHttpError as error:
             raise Exception(f"Gmail API error: {error}")
 
+    @handles("delete")
     async def _delete_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Delete a Gmail item"""
+        """Delete a Gmail item
+
+        Emails are deleted permanently unless payload["trash"] is set; the
+        gmail.modify scope this handler requests only allows trashing.
+        """
         item_id = payload.get("id")
+        item_type = payload.get("item_type", "email")
 
         if not item_id:
             raise ValueError("Item ID is required for delete operations")
 
-        if not self.service:
+        if item_type not in ("email", "label"):
+            raise ValueError(f"Unsupported item type: {item_type}")
+
+        if not self._creds:
             # Mock implementation
             return {"message": f"Item {item_id} deleted successfully (mock mode)"}
 
         # Real API implementation
         try:
-            self.service.users().messages().delete(
-                userId='me',
-                id=item_id
-            ).execute()
+            if item_type == "label":
+                await self._request("DELETE", f"/labels/{item_id}")
+                return {"message": f"Label {item_id} deleted successfully"}
+
+            if payload.get("trash"):
+                message = await self._request("POST", f"/messages/{item_id}/trash")
+                return {"item": message, "message": f"Message {item_id} moved to trash"}
+
+            # _request raises on any error status, so returning means Gmail answered 2xx
+            await self._request("DELETE", f"/messages/{item_id}")
+            if not payload.get("verify_delete"):
+                return {"message": f"Message {item_id} deleted successfully"}
 
             # Verify deletion by attempting to fetch the message
             try:
-                self.service.users().messages().get(
-                    userId='me',
-                    id=item_id
-                ).execute()
+                await self._request("GET", f"/messages/{item_id}")
                 raise Exception("Message deletion verification failed - message still exists")
             except GmailHttpError as error:
-                if error.resp.status == 404:
+                if error.status == 404:
                     return {"message": f"Message {item_id} deleted and verified successfully"}
                 else:
                     raise Exception(f"Unexpected error during deletion verification: {error}")
         except GmailHttpError as error:
             raise Exception(f"Gmail API error: {error}")
 
+    @handles("list")
     async def _list_items(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """List Gmail items"""
         item_type = payload.get("item_type", "email")
         max_results = payload.get("max_results", 10)
 
-        if not self.service:
+        if not self._creds:
             # Mock implementation
-            mock_items = [
-                {
-                    "id": f"{item_type}_{i}",
-                    "name": f"Sample {item_type} {i}",
-                    "status": "active",
-                    "created": datetime.now().isoformat()
-                }
-                for i in range(1, min(max_results + 1, 6))
-            ]
+            count = min(max_results, 5)
+            mock_items = [item.copy() for item in _mock_list(item_type, count, int(time.time()) // 60, "created")]
             return {"items": mock_items, "count": len(mock_items), "item_type": item_type}
 
         # Real API implementation
         try:
             if item_type == "email":
-                messages_result = self.service.users().messages().list(
-                    userId='me',
-                    maxResults=max_results
-                ).execute()
+                messages_result = await self._request("GET", "/messages", params={"maxResults": max_results})
 
                 messages = messages_result.get('messages', [])
+                if payload.get("include_payload") and messages:
+                    messages = await self._batch_get_messages([message["id"] for message in messages])
                 return {"items": messages, "count": len(messages)}
 
             elif item_type == "label":
-                labels_result = self.service.users().labels().list(
-                    userId='me'
-                ).execute()
+                labels_result = await self._request("GET", "/labels")
 
                 labels = labels_result.get('labels', [])
                 return {"items": labels, "count": len(labels)}
@@ -353,34 +500,33 @@ class GmailServiceHandler(BaseServiceHandler):
         except GmailHttpError as error:
             raise Exception(f"Gmail API error: {error}")
 
+    @handles("search")
     async def _search_items(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Search Gmail items"""
-        query = payload.get("query", "")
+        query = _QUERY_RE.sub('', payload.get("query", ""))
         max_results = payload.get("max_results", 10)
 
         if not query:
             raise ValueError("Search query is required")
 
-        if not self.service:
+        if not self._creds:
             # Mock implementation
+            count = min(max_results, 3)
+            now_iso = _iso_now()
             mock_results = [
                 {
                     "id": f"search_{i}",
                     "name": f"Search result {i} for '{query}'",
                     "status": "active",
-                    "created": datetime.now().isoformat()
+                    "created": now_iso
                 }
-                for i in range(1, min(max_results + 1, 4))
+                for i in range(1, count + 1)
             ]
             return {"items": mock_results, "count": len(mock_results), "query": query}
 
         # Real API implementation
         try:
-            messages_result = self.service.users().messages().list(
-                userId='me',
-                q=query,
-                maxResults=max_results
-            ).execute()
+            messages_result = await self._request("GET", "/messages", params={"q": query, "maxResults": max_results})
 
             messages = messages_result.get('messages', [])
             return {"items": messages, "count": len(messages), "query": query}
@@ -3,41 +3,192 @@ Google Calendar Service Handler for MCP Packet Server
 Handles calendar event and calendar management operations
 """
 
+import asyncio
+import contextlib
+import copy
 import os
+import re
+import sys
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple
 
-from .base_handler import BaseServiceHandler
+from .base_handler import BaseServiceHandler, _coalesced, creates, handles
 
-# Google Calendar imports (with error handling)
-try:
+# Google API libraries are imported on first use (see _import_google), so processes
+# that never touch the calendar never pay for them; None until the import is tried
+GOOGLE_AVAILABLE: Optional[bool] = None
+
+# Declared here for type checkers; _import_google binds them at runtime
+if TYPE_CHECKING:
+    import google_auth_httplib2
+    import httplib2
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
-    GOOGLE_AVAILABLE = True
-except ImportError:
-    GOOGLE_AVAILABLE = False
-    print("⚠️  Warning: Google API libraries not available - Google Calendar operations will be limited")
+
+
+def _import_google() -> bool:
+    """Import the Google API libraries into module globals; False if not installed"""
+    global GOOGLE_AVAILABLE, google_auth_httplib2, httplib2, Request, Credentials, InstalledAppFlow, build, HttpError
+
+    if GOOGLE_AVAILABLE is None:
+        try:
+            import google_auth_httplib2
+            import httplib2
+            from google.auth.transport.requests import Request
+            from google.oauth2.credentials import Credentials
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            from googleapiclient.discovery import build
+            from googleapiclient.errors import HttpError
+            GOOGLE_AVAILABLE = True
+        except ImportError:
+            GOOGLE_AVAILABLE = False
+            print("⚠️  Warning: Google API libraries not available - Google Calendar operations will be limited")
+    return GOOGLE_AVAILABLE
+
+
+# Google caps one batch request at 50 sub-requests
+GCAL_BATCH_LIMIT = 50
+
+# Partial-response masks for the event read/list paths; payload["fields"] overrides them
+GCAL_EVENT_FIELDS = "id,summary,start,end,location,attendees/email,description"
+GCAL_EVENT_LIST_FIELDS = "items(id,summary,start,end,location,attendees/email,htmlLink),nextPageToken"
+GCAL_EVENT_SYNC_FIELDS = "items(id,status,summary,start,end,location,attendees/email,htmlLink),nextPageToken,nextSyncToken"
+
+# Timestamps already in RFC 3339 form are sent as-is, skipping the datetime round trip
+_RFC3339_RE = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(?:\.\d+)?(?:Z|[+-]\d\d:\d\d)")
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11
+_FROMISOFORMAT_TAKES_Z = sys.version_info >= (3, 11)
+
+
+def _rfc3339(value: str) -> str:
+    """Validate an ISO 8601 timestamp and return it in RFC 3339 form"""
+    if _RFC3339_RE.fullmatch(value):
+        return value
+    if not _FROMISOFORMAT_TAKES_Z and value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value).isoformat()
+
+
+# Seconds a cached read stays fresh; listings go stale faster than single items
+GCAL_READ_TTL = 300.0
+GCAL_LIST_TTL = 30.0
+
+# Cached reads one handler keeps; the least recently used go first
+GCAL_CACHE_SIZE = 256
+
+# API requests one handler runs at once, to stay under Google's rate limits
+GCAL_MAX_CONCURRENCY = 8
+
+# Discovery-built client (and the credentials it carries) shared by every handler instance;
+# built on first use, and a failed build is retried on the next call rather than remembered
+_SERVICE = None
+_SERVICE_LOCK: Optional[asyncio.Lock] = None
+
+# (token, refresh token, expiry) last read from or written to token.json
+_TOKEN_FINGERPRINT: Optional[Tuple] = None
+
+
+def _token_fingerprint(creds: Any) -> Tuple:
+    """Identify the credential state that token.json records"""
+    return (creds.token, creds.refresh_token, creds.expiry.isoformat() if creds.expiry else None)
+
+
+def _save_token(creds: Any, token_path: str):
+    """Persist credentials atomically, skipping the write when token.json already matches"""
+    global _TOKEN_FINGERPRINT
+
+    fingerprint = _token_fingerprint(creds)
+    if fingerprint == _TOKEN_FINGERPRINT:
+        return
+
+    # Write beside the target and swap in, so a crash never leaves a truncated token;
+    # the file holds a refresh token, so only the owner may read it
+    tmp_path = token_path + ".tmp"
+    # A leftover temp file would keep its old mode, so start from a fresh one
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(tmp_path)
+    try:
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), 'w') as token:
+            token.write(creds.to_json())
+        os.replace(tmp_path, token_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    _TOKEN_FINGERPRINT = fingerprint
+
+
+class GoogleCalendarApiError(Exception):
+    """Failed Google Calendar API call; chained to the HttpError when there is one"""
+
+
+# httplib2 connections are not thread-safe, so each worker thread gets its own
+_THREAD_HTTP = threading.local()
 
 
 class GoogleCalendarServiceHandler(BaseServiceHandler):
     """Handles Google Calendar-related packet operations"""
 
+    supported_actions: ClassVar[FrozenSet[str]] = frozenset({"create", "read", "update", "delete", "list", "search"})
+    supported_item_types: ClassVar[FrozenSet[str]] = frozenset({"event", "calendar", "reminder"})
+
+    # Payload keys that identify the item type when the packet omits it
+    _CREATE_HINTS = (("summary", "event"), ("events", "event"))
+
     def __init__(self):
         super().__init__("gcal")
-        self.supported_actions = ["create", "read", "update", "delete", "list", "search"]
-        self.supported_item_types = ["event", "calendar", "reminder"]
 
-        # Initialize Google Calendar API client
-        self.service = self._get_calendar_service()
         self.default_calendar_id = "primary"
 
-    def _get_calendar_service(self):
-        """Get authenticated Google Calendar service"""
-        if not GOOGLE_AVAILABLE:
+        # (op, calendar_id, ...) -> (monotonic stored-at, result), in LRU order;
+        # writes drop the calendar's entries
+        self._cache: OrderedDict[Tuple, Tuple[float, Dict[str, Any]]] = OrderedDict()
+
+        # calendar_id -> nextSyncToken from the last incremental event list
+        self._sync_tokens: Dict[str, str] = {}
+
+        # Created on first use so it binds to the running event loop
+        self._api_slots: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+
+    @property
+    def service(self) -> Any:
+        """Google Calendar API client, or None in mock mode; built by _ensure_service"""
+        return _SERVICE
+
+    async def execute(self, action: str, payload: Dict[str, Any], item_type: Optional[str] = None) -> Any:
+        """Execute Google Calendar operation once the service is built"""
+        if _SERVICE is None:
+            await self._ensure_service()
+        return await super().execute(action, payload, item_type)
+
+    async def _ensure_service(self) -> None:
+        """Build the process-wide authenticated Google Calendar service on first use"""
+        global _SERVICE, _SERVICE_LOCK
+
+        # Missing libraries never come back, so skip the worker-thread hop in mock mode
+        if GOOGLE_AVAILABLE is False:
+            return
+        # Created lazily so the lock binds to the running loop
+        if _SERVICE_LOCK is None:
+            _SERVICE_LOCK = asyncio.Lock()
+        async with _SERVICE_LOCK:
+            if _SERVICE is None:
+                # Disk reads, token refresh and the OAuth browser flow all block
+                _SERVICE = await asyncio.to_thread(self._build_calendar_service)
+
+    def _build_calendar_service(self) -> Any:
+        """Authenticate and build a Google Calendar service"""
+        global _TOKEN_FINGERPRINT
+
+        if not _import_google():
             print("⚠️  Warning: Google API libraries not available - using mock service")
             return None
 
@@ -51,6 +202,7 @@ class GoogleCalendarServiceHandler(BaseServiceHandler):
 
             if os.path.exists(token_path):
                 creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+                _TOKEN_FINGERPRINT = _token_fingerprint(creds)
 
             # If there are no (valid) credentials available, let the user log in
             if not creds or not creds.valid:
@@ -66,44 +218,78 @@ class GoogleCalendarServiceHandler(BaseServiceHandler):
                     creds = flow.run_local_server(port=0)
 
                 # Save the credentials for the next run
-                with open(token_path, 'w') as token:
-                    token.write(creds.to_json())
+                _save_token(creds, token_path)
 
-            return build('calendar', 'v3', credentials=creds)
+            # Bundled discovery document, so building never fetches it over HTTP;
+            # the client refreshes the cached credentials itself once they expire
+            return build('calendar', 'v3', credentials=creds, static_discovery=True)
         except Exception as e:
             print(f"⚠️  Warning: Failed to initialize Google Calendar service: {e}")
             return None
 
-    async def execute(self, action: str, payload: Dict[str, Any], item_type: str = None) -> Any:
-        """Execute Google Calendar operation"""
-        if action == "create":
-            if item_type == "event" or "summary" in payload:
-                return await self._create_event(payload)
-            elif item_type == "calendar":
-                return await self._create_calendar(payload)
-            else:
-                raise ValueError(f"Unsupported item type for creation: {item_type}")
-
-        elif action == "read":
-            return await self._read_item(payload)
-
-        elif action == "update":
-            return await self._update_item(payload)
-
-        elif action == "delete":
-            return await self._delete_item(payload)
-
-        elif action == "list":
-            return await self._list_items(payload)
-
-        elif action == "search":
-            return await self._search_items(payload)
-
-        else:
-            raise ValueError(f"Unsupported action: {action}")
-
+    async def _execute(self, request: Any) -> Any:
+        """Execute an API or batch request in a worker thread under the concurrency limit
+
+        Identical GETs already in flight share a single response.
+        """
+        if getattr(request, "method", None) == "GET":
+            return await _coalesced(self._inflight, (request.uri, request.body), lambda: self._execute_now(request))
+        return await self._execute_now(request)
+
+    async def _execute_now(self, request: Any) -> Any:
+        """Execute a request once a concurrency slot is free"""
+        if self._api_slots is None:
+            self._api_slots = asyncio.Semaphore(GCAL_MAX_CONCURRENCY)
+        async with self._api_slots:
+            return await asyncio.to_thread(self._execute_in_thread, request)
+
+    def _execute_in_thread(self, request: Any) -> Any:
+        """Execute a request over this worker thread's own authorized connection"""
+        http = getattr(_THREAD_HTTP, "http", None)
+        if http is None:
+            http = _THREAD_HTTP.http = google_auth_httplib2.AuthorizedHttp(
+                self.service._http.credentials, http=httplib2.Http()
+            )
+        return request.execute(http=http)
+
+    def _cache_get(self, key: Tuple, ttl: float) -> Optional[Dict[str, Any]]:
+        """Return a private copy of a cached result younger than ttl seconds, or None"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+    def _cache_put(self, key: Tuple, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a copy of a result, evicting stale and least recently used entries, and hand it back"""
+        now = time.monotonic()
+        # Nothing outlives the longest TTL, so anything older is dead weight
+        for stale in [k for k, (stored_at, _) in self._cache.items() if now - stored_at >= GCAL_READ_TTL]:
+            del self._cache[stale]
+        self._cache[key] = (now, copy.deepcopy(result))
+        self._cache.move_to_end(key)
+        while len(self._cache) > GCAL_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+
+    def _invalidate(self, calendar_id: Optional[str] = None) -> None:
+        """Drop cached reads for one calendar, or for all of them"""
+        if calendar_id is None:
+            self._cache.clear()
+            return
+        for key in [key for key in self._cache if key[1] == calendar_id]:
+            del self._cache[key]
+
+    @creates("event")
     async def _create_event(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Google Calendar event"""
+        events = payload.get("events")
+        if events is not None:
+            return await self._bulk_create_events(events)
+
         summary = payload.get("summary", "")
         start_time_str = payload.get("start_time")
         end_time_str = payload.get("end_time")
@@ -130,35 +316,97 @@ class GoogleCalendarServiceHandler(BaseServiceHandler):
             return {"event": event_data, "message": "Event created successfully (mock mode)"}
 
         # Real API implementation
-        try:
-            # Parse and validate time strings
-            start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-            end_time = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-        except ValueError as e:
-            raise ValueError(f"Invalid time format: {e}. Expected ISO format (e.g., 2024-12-19T16:20:00-06:00)")
+        event = await self._execute(self.service.events().insert(
+            calendarId=self.default_calendar_id,
+            body=self._event_body(payload)
+        ))
+        self._invalidate(self.default_calendar_id)
 
-        # Convert to RFC3339 format for Google Calendar API
-        start_time_rfc3339 = start_time.isoformat()
-        end_time_rfc3339 = end_time.isoformat()
+        return {"event": event, "message": "Event created successfully"}
+
+    def _event_body(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the API request body for an event create payload"""
+        summary = payload.get("summary", "")
+        attendees = payload.get("attendees", [])
+
+        if not summary:
+            raise ValueError("Event summary is required")
+
+        start_value = payload.get("start_time")
+        end_value = payload.get("end_time")
+        if not start_value or not end_value:
+            raise ValueError("Event start_time and end_time are required")
+
+        try:
+            # Validate time strings and convert to RFC3339 format for Google Calendar API
+            start_time = _rfc3339(start_value)
+            end_time = _rfc3339(end_value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid time format: {e}. Expected ISO format (e.g., 2024-12-19T16:20:00-06:00)") from e
 
         event_body = {
             "summary": summary,
-            "start": {"dateTime": start_time_rfc3339},
-            "end": {"dateTime": end_time_rfc3339},
-            "description": description,
-            "location": location
+            "start": {"dateTime": start_time},
+            "end": {"dateTime": end_time},
+            "description": payload.get("description", ""),
+            "location": payload.get("location", "")
         }
 
         if attendees:
             event_body["attendees"] = [{"email": email} for email in attendees]
 
-        event = self.service.events().insert(
-            calendarId=self.default_calendar_id,
-            body=event_body
-        ).execute()
+        return event_body
 
-        return {"event": event, "message": "Event created successfully"}
+    async def _run_batch(self, api_requests: List[Any]) -> List[Any]:
+        """Execute API requests as multipart batches of up to GCAL_BATCH_LIMIT, in request order"""
+        results: List[Any] = [None] * len(api_requests)
+
+        # Failed sub-requests keep their exception, so callers can tell them from responses
+        def callback(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+            results[int(request_id)] = exception if exception is not None else response
+
+        # Batches run one after another, so a bulk call holds at most one concurrency slot
+        for start in range(0, len(api_requests), GCAL_BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=callback)
+            for index in range(start, min(start + GCAL_BATCH_LIMIT, len(api_requests))):
+                batch.add(api_requests[index], request_id=str(index))
+            await self._execute(batch)
 
+        return results
+
+    @staticmethod
+    def _bulk_result(verb: str, items_key: str, keys: List[str], results: List[Any],
+                     done: List[Any]) -> Dict[str, Any]:
+        """Bulk response with failed sub-requests reported apart, keyed like keys
+
+        Partial when some sub-requests failed; raises when every one did.
+        """
+        errors = {key: str(result) for key, result in zip(keys, results) if isinstance(result, Exception)}
+        if errors and not done:
+            raise GoogleCalendarApiError(f"Google Calendar API error: all {len(errors)} events failed: {next(iter(errors.values()))}")
+
+        message = f"{len(done)} events {verb}, {len(errors)} failed" if errors else f"Events {verb} successfully"
+        return {items_key: done, "errors": errors, "count": len(done), "partial": bool(errors), "message": message}
+
+    async def _bulk_create_events(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create many events in ceil(N/50) batch round trips"""
+        if not self.service:
+            # Mock implementation
+            created = [(await self._create_event(event))["event"] for event in events]
+            return {"events": created, "count": len(created), "message": "Events created successfully (mock mode)"}
+
+        bodies = [self._event_body(event) for event in events]
+        insert = self.service.events().insert
+        results = await self._run_batch([
+            insert(calendarId=self.default_calendar_id, body=body) for body in bodies
+        ])
+        self._invalidate(self.default_calendar_id)
+
+        # New events have no id yet, so failures are keyed by their position in the request
+        created = [result for result in results if not isinstance(result, Exception)]
+        return self._bulk_result("created", "events", [str(i) for i in range(len(results))], results, created)
+
+    @creates("calendar")
     async def _create_calendar(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Google Calendar"""
         summary = payload.get("summary", "")
@@ -187,10 +435,12 @@ class GoogleCalendarServiceHandler(BaseServiceHandler):
             "timeZone": timezone_str
         }
 
-        calendar = self.service.calendars().insert(body=calendar_body).execute()
+        calendar = await self._execute(self.service.calendars().insert(body=calendar_body))
+        self._invalidate()
 
         return {"calendar": calendar, "message": "Calendar created successfully"}
 
+    @handles("read")
     async def _read_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Read a Google Calendar item"""
         item_id = payload.get("id")
@@ -211,23 +461,34 @@ class GoogleCalendarServiceHandler(BaseServiceHandler):
             return {"item": mock_data, "item_type": item_type}
 
         # Real API implementation
+        key = ("read", calendar_id, item_type, item_id, payload.get("fields"))
+        cached = self._cache_get(key, GCAL_READ_TTL)
+        if cached is not None:
+            return cached
+
         try:
             if item_type == "event":
-                event = self.service.events().get(
+                event = await self._execute(self.service.events().get(
                     calendarId=calendar_id,
-                    eventId=item_id
-                ).execute()
-                return {"item": event, "item_type": item_type}
+                    eventId=item_id,
+                    fields=payload.get("fields", GCAL_EVENT_FIELDS)
+                ))
+                return self._cache_put(key, {"item": event, "item_type": item_type})
             elif item_type == "calendar":
-                calendar = self.service.calendars().get(calendarId=item_id).execute()
-                return {"item": calendar, "item_type": item_type}
+                calendar = await self._execute(self.service.calendars().get(calendarId=item_id))
+                return self._cache_put(key, {"item": calendar, "item_type": item_type})
             else:
                 raise ValueError(f"Unsupported item type: {item_type}")
         except HttpError as error:
-            raise Exception(f"Google Calendar API error: {error}")
+            raise GoogleCalendarApiError(f"Google Calendar API error: {error}") from error
 
+    @handles("update")
     async def _update_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Update a Google Calendar item"""
+        items = payload.get("items")
+        if items is not None:
+            return await self._bulk_update_events(items, payload.get("calendar_id", self.default_calendar_id))
+
         item_id = payload.get("id")
         updates = payload.get("updates", {})
         calendar_id = payload.get("calendar_id", self.default_calendar_id)
@@ -250,27 +511,30 @@ class GoogleCalendarServiceHandler(BaseServiceHandler):
 
         # Real API implementation
         try:
-            # For events, we need to get the current event first
-            event = self.service.events().get(
-                calendarId=calendar_id,
-                eventId=item_id
-            ).execute()
-
-            # Update the event with new data
-            event.update(updates)
+            # PATCH sends only the changed fields: no read first, no full-body rewrite
+            if payload.get("item_type") == "calendar":
+                calendar = await self._execute(self.service.calendars().patch(calendarId=item_id, body=updates))
+                self._invalidate()
+                return {"item": calendar, "message": "Calendar patched successfully"}
 
-            updated_event = self.service.events().update(
+            updated_event = await self._execute(self.service.events().patch(
                 calendarId=calendar_id,
                 eventId=item_id,
-                body=event
-            ).execute()
+                body=updates
+            ))
+            self._invalidate(calendar_id)
 
-            return {"item": updated_event, "message": "Event updated successfully"}
+            return {"item": updated_event, "message": "Event patched successfully"}
         except HttpError as error:
-            raise Exception(f"Google Calendar API error: {error}")
+            raise GoogleCalendarApiError(f"Google Calendar API error: {error}") from error
 
+    @handles("delete")
     async def _delete_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Delete a Google Calendar item"""
+        ids = payload.get("ids")
+        if ids is not None:
+            return await self._bulk_delete_events(ids, payload.get("calendar_id", self.default_calendar_id))
+
         item_id = payload.get("id")
         calendar_id = payload.get("calendar_id", self.default_calendar_id)
 
@@ -283,15 +547,52 @@ class GoogleCalendarServiceHandler(BaseServiceHandler):
 
         # Real API implementation
         try:
-            self.service.events().delete(
+            await self._execute(self.service.events().delete(
                 calendarId=calendar_id,
                 eventId=item_id
-            ).execute()
+            ))
+            self._invalidate(calendar_id)
 
             return {"message": f"Event {item_id} deleted successfully"}
         except HttpError as error:
-            raise Exception(f"Google Calendar API error: {error}")
+            raise GoogleCalendarApiError(f"Google Calendar API error: {error}") from error
+
+    async def _bulk_update_events(self, items: List[Dict[str, Any]], calendar_id: str) -> Dict[str, Any]:
+        """Patch many events in ceil(N/50) batch round trips"""
+        for item in items:
+            if not item.get("id"):
+                raise ValueError("Item ID is required for update operations")
+            if not item.get("updates"):
+                raise ValueError("Updates are required for update operations")
+
+        if not self.service:
+            # Mock implementation
+            updated = [(await self._update_item(item))["item"] for item in items]
+            return {"items": updated, "count": len(updated), "message": "Items updated successfully (mock mode)"}
+
+        patch = self.service.events().patch
+        results = await self._run_batch([
+            patch(calendarId=calendar_id, eventId=item["id"], body=item["updates"]) for item in items
+        ])
+        self._invalidate(calendar_id)
 
+        updated = [result for result in results if not isinstance(result, Exception)]
+        return self._bulk_result("patched", "items", [item["id"] for item in items], results, updated)
+
+    async def _bulk_delete_events(self, ids: List[str], calendar_id: str) -> Dict[str, Any]:
+        """Delete many events in ceil(N/50) batch round trips"""
+        if not self.service:
+            # Mock implementation
+            return {"deleted": list(ids), "count": len(ids), "message": "Items deleted successfully (mock mode)"}
+
+        delete = self.service.events().delete
+        results = await self._run_batch([delete(calendarId=calendar_id, eventId=item_id) for item_id in ids])
+        self._invalidate(calendar_id)
+
+        deleted = [item_id for item_id, result in zip(ids, results) if not isinstance(result, Exception)]
+        return self._bulk_result("deleted", "deleted", ids, results, deleted)
+
+    @handles("list")
     async def _list_items(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """List Google Calendar items"""
         item_type = payload.get("item_type", "event")
@@ -300,40 +601,99 @@ class GoogleCalendarServiceHandler(BaseServiceHandler):
 
         if not self.service:
             # Mock implementation
+            count = min(limit, 5)
+            now_iso = datetime.now().isoformat()
             mock_items = [
                 {
                     "id": f"{item_type}_{i}",
                     "name": f"Sample {item_type} {i}",
                     "status": "active",
-                    "created": datetime.now().isoformat()
+                    "created": now_iso
                 }
-                for i in range(1, min(limit + 1, 6))
+                for i in range(1, count + 1)
             ]
             return {"items": mock_items, "count": len(mock_items), "item_type": item_type}
 
         # Real API implementation
+        if item_type == "event" and payload.get("incremental"):
+            return await self._list_changed_events(calendar_id)
+
+        key = ("list", calendar_id, item_type, limit, payload.get("fields"))
+        cached = self._cache_get(key, GCAL_LIST_TTL)
+        if cached is not None:
+            return cached
+
         try:
             if item_type == "event":
                 now = datetime.utcnow().isoformat() + 'Z'
-                events_result = self.service.events().list(
+                events = await self._collect_pages(
+                    self.service.events(),
+                    limit,
                     calendarId=calendar_id,
                     timeMin=now,
-                    maxResults=limit,
                     singleEvents=True,
-                    orderBy='startTime'
-                ).execute()
-
-                events = events_result.get('items', [])
-                return {"items": events, "count": len(events), "item_type": item_type}
+                    orderBy='startTime',
+                    fields=payload.get("fields", GCAL_EVENT_LIST_FIELDS)
+                )
+                return self._cache_put(key, {"items": events, "count": len(events), "item_type": item_type})
             elif item_type == "calendar":
-                calendars_result = self.service.calendarList().list().execute()
-                calendars = calendars_result.get('items', [])
-                return {"items": calendars[:limit], "count": len(calendars), "item_type": item_type}
+                calendars = await self._collect_pages(self.service.calendarList(), limit)
+                return self._cache_put(key, {"items": calendars, "count": len(calendars), "item_type": item_type})
             else:
                 raise ValueError(f"Unsupported item type: {item_type}")
         except HttpError as error:
-            raise Exception(f"Google Calendar API error: {error}")
-
+            raise GoogleCalendarApiError(f"Google Calendar API error: {error}") from error
+
+    async def _collect_pages(self, collection: Any, limit: int, **params: Any) -> List[Dict[str, Any]]:
+        """Follow nextPageToken until limit items are collected; pages are sized to the limit"""
+        request = collection.list(maxResults=min(limit, 250), **params)
+        items: List[Dict[str, Any]] = []
+        while request is not None and len(items) < limit:
+            response = await self._execute(request)
+            items.extend(response.get('items', []))
+            request = collection.list_next(request, response)
+        return items[:limit]
+
+    async def _list_changed_events(self, calendar_id: str) -> Dict[str, Any]:
+        """List events changed since the previous incremental list of the calendar
+
+        The first call (or one after the token expires) is a full sync; later calls
+        return only the delta, with cancelled events marked by status.
+        """
+        events_api = self.service.events()
+        sync_token = self._sync_tokens.get(calendar_id)
+        events: List[Dict[str, Any]] = []
+        page_token = None
+
+        while True:
+            try:
+                # timeMin and orderBy cannot be combined with a sync token
+                events_result = await self._execute(events_api.list(
+                    calendarId=calendar_id,
+                    syncToken=sync_token,
+                    pageToken=page_token,
+                    singleEvents=True,
+                    fields=GCAL_EVENT_SYNC_FIELDS
+                ))
+            except HttpError as error:
+                if sync_token is not None and error.resp.status == 410:
+                    # Token expired on the server: drop it and resync from scratch
+                    self._sync_tokens.pop(calendar_id, None)
+                    sync_token = None
+                    events = []
+                    page_token = None
+                    continue
+                raise GoogleCalendarApiError(f"Google Calendar API error: {error}") from error
+
+            events.extend(events_result.get('items', []))
+            page_token = events_result.get('nextPageToken')
+            if not page_token:
+                break
+
+        self._sync_tokens[calendar_id] = events_result.get('nextSyncToken')
+        return {"items": events, "count": len(events), "item_type": "event", "full_sync": sync_token is None}
+
+    @handles("search")
     async def _search_items(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Search Google Calendar items"""
         query = payload.get("query", "")
@@ -345,30 +705,37 @@ class GoogleCalendarServiceHandler(BaseServiceHandler):
 
         if not self.service:
             # Mock implementation
+            count = min(max_results, 3)
+            now_iso = datetime.now().isoformat()
             mock_results = [
                 {
                     "id": f"search_{i}",
                     "name": f"Search result {i} for '{query}'",
                     "status": "active",
-                    "created": datetime.now().isoformat()
+                    "created": now_iso
                 }
-                for i in range(1, min(max_results + 1, 4))
+                for i in range(1, count + 1)
             ]
             return {"items": mock_results, "count": len(mock_results), "query": query}
 
         # Real API implementation
+        key = ("search", calendar_id, query, max_results, payload.get("fields"))
+        cached = self._cache_get(key, GCAL_LIST_TTL)
+        if cached is not None:
+            return cached
+
         try:
             now = datetime.utcnow().isoformat() + 'Z'
-            events_result = self.service.events().list(
+            events = await self._collect_pages(
+                self.service.events(),
+                max_results,
                 calendarId=calendar_id,
                 q=query,
                 timeMin=now,
-                maxResults=max_results,
                 singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-
-            events = events_result.get('items', [])
-            return {"items": events, "count": len(events), "query": query}
+                orderBy='startTime',
+                fields=payload.get("fields", GCAL_EVENT_LIST_FIELDS)
+            )
+            return self._cache_put(key, {"items": events, "count": len(events), "query": query})
         except HttpError as error:
-            raise Exception(f"Google Calendar API error: {error}")
+            raise GoogleCalendarApiError(f"Google Calendar API error: {error}") from error
@@ -3,22 +3,83 @@ Todoist Service Handler for MCP Packet Server
 Handles task and project management operations
 """
 
+import asyncio
+import json
 import os
+import re
 import time
-from typing import Any, Dict
+import uuid
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .base_handler import BaseServiceHandler
+from .base_handler import BaseServiceHandler, _coalesced, creates, handles
+
+# orjson is optional; API bodies fall back to the stdlib codec without it
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize a request body"""
+        return orjson.dumps(obj)
+
+    def _loads(data: bytes) -> Any:
+        """Decode a response body"""
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize a request body"""
+        return json.dumps(obj).encode()
+
+    def _loads(data: bytes) -> Any:
+        """Decode a response body"""
+        return json.loads(data)
+
+# One retry policy for every call: backoff on throttling and server errors, honouring
+# Retry-After; writes carry an X-Request-Id, so a retried POST is applied only once
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST", "DELETE", "PUT", "PATCH"}),
+    respect_retry_after_header=True
+)
+
+# One keep-alive connection pool shared by every handler instance; retries reuse it
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=_RETRY))
+
+# API requests one handler runs at once, to stay under Todoist's rate limits
+TODOIST_MAX_CONCURRENCY = 16
+
+# Task creates arriving within one window share a Sync API call of up to 100 commands
+TODOIST_SYNC_URL = "https://api.todoist.com/sync/v9/sync"
+TODOIST_SYNC_LIMIT = 100
+TODOIST_BATCH_WINDOW = 0.010
+
+# Characters with meaning in Todoist's filter language; queries holding any are matched locally
+_FILTER_SYNTAX_RE = re.compile(r"[&|!(),\\]")
+
+# item_type -> REST v2 collection path
+_TODOIST_ENDPOINTS = {"task": "tasks", "project": "projects", "label": "labels", "comment": "comments"}
 
 
 class TodoistServiceHandler(BaseServiceHandler):
     """Handles Todoist-related packet operations"""
 
-    def __init__(self):
+    supported_actions: ClassVar[FrozenSet[str]] = frozenset({"create", "read", "update", "delete", "list", "search"})
+    supported_item_types: ClassVar[FrozenSet[str]] = frozenset({"task", "project", "label", "comment"})
+
+    # Payload keys that identify the item type when the packet omits it
+    _CREATE_HINTS = (("content", "task"), ("name", "project"))
+
+    def __init__(self, session: Optional[requests.Session] = None):
         super().__init__("todoist")
-        self.supported_actions = ["create", "read", "update", "delete", "list", "search"]
-        self.supported_item_types = ["task", "project", "label", "comment"]
+
+        # Keep-alive pool shared by every handler unless the caller brings its own
+        self._session = session or _SESSION
 
         # Get Todoist API token from environment
         self.api_token = os.getenv("TODOIST_API_TOKEN")
@@ -28,37 +89,136 @@ class TodoistServiceHandler(BaseServiceHandler):
             self.api_token = None
 
         self.base_url = "https://api.todoist.com/rest/v2"
-
-    async def execute(self, action: str, payload: Dict[str, Any], item_type: str = None) -> Any:
-        """Execute Todoist operation"""
-        if action == "create":
-            if item_type == "task" or payload.get("content"):
-                return await self._create_task(payload)
-            elif item_type == "project" or payload.get("name"):
-                return await self._create_project(payload)
-            elif item_type == "label":
-                return await self._create_label(payload)
-            else:
-                raise ValueError(f"Unsupported item type for creation: {item_type}")
-
-        elif action == "read":
-            return await self._read_item(payload)
-
-        elif action == "update":
-            return await self._update_item(payload)
-
-        elif action == "delete":
-            return await self._delete_item(payload)
-
-        elif action == "list":
-            return await self._list_items(payload)
-
-        elif action == "search":
-            return await self._search_items(payload)
-
+        self._auth_header = {"Authorization": f"Bearer {self.api_token}"}
+        self._json_headers = {**self._auth_header, "Content-Type": "application/json"}
+
+        # Created on first use so it binds to the running event loop
+        self._api_slots: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+
+        # Task creates waiting for the next Sync API flush
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # Running flush tasks, referenced here so the loop cannot collect one mid-flight
+        self._flush_tasks: Set[asyncio.Future] = set()
+
+    async def _request(self, method: str, url: str, json: Any = None, **kwargs: Any) -> Any:
+        """Run a pooled Todoist API call in a worker thread and return the decoded body
+
+        Identical GETs already in flight share a single response.
+        """
+        if method == "GET":
+            params = kwargs.get("params")
+            key = (url, tuple(sorted(params.items())) if params else ())
+            return await _coalesced(self._inflight, key, lambda: self._send(method, url, json, **kwargs))
+        return await self._send(method, url, json, **kwargs)
+
+    async def _send(self, method: str, url: str, json: Any = None, **kwargs: Any) -> Any:
+        """Send one request once a concurrency slot is free"""
+        if self._api_slots is None:
+            self._api_slots = asyncio.Semaphore(TODOIST_MAX_CONCURRENCY)
+
+        if json is not None:
+            kwargs["data"] = _dumps(json)
+            headers = {**self._json_headers, "X-Request-Id": str(uuid.uuid4())}
         else:
-            raise ValueError(f"Unsupported action: {action}")
+            headers = self._auth_header
+        async with self._api_slots:
+            response = await asyncio.to_thread(self._session.request, method, url, headers=headers, **kwargs)
+        response.raise_for_status()
+        # Close, reopen and delete answer 204 with no body
+        return _loads(response.content) if response.content else None
+
+    async def _queue_task_add(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a task create for the next flush and wait for the created task"""
+        loop = asyncio.get_running_loop()
+        if self._flush_handle is not None and getattr(self._flush_handle, "_loop", loop) is not loop:
+            # Left over from a loop that has since stopped; its callers are gone
+            self._flush_handle = None
+            self._pending = []
+
+        future: asyncio.Future[Dict[str, Any]] = loop.create_future()
+        self._pending.append((task_data, future))
+
+        if len(self._pending) >= TODOIST_SYNC_LIMIT:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(TODOIST_BATCH_WINDOW, self._start_flush)
+
+        return await future
+
+    def _start_flush(self) -> None:
+        """Hand the queued task creates to a flush task"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._flush(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Create a batch of tasks and resolve each caller's future"""
+        try:
+            # A lone create keeps the REST call, which returns the full task
+            if len(batch) == 1:
+                results = [await self._request("POST", f"{self.base_url}/tasks", json=batch[0][0])]
+            else:
+                results = await self._sync_add_tasks([task_data for task_data, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _sync_add_tasks(self, tasks: List[Dict[str, Any]]) -> List[Any]:
+        """Create tasks with one Sync API call; failed commands come back as exceptions
+
+        The Sync API only returns ids, so the created tasks are then read back with
+        one REST call and callers get the same shape as a single REST create.
+        """
+        commands = []
+        for task_data in tasks:
+            args = {key: value for key, value in task_data.items() if value is not None and key != "due_date"}
+            if task_data.get("due_date"):
+                args["due"] = {"date": task_data["due_date"]}
+            commands.append({"type": "item_add", "uuid": str(uuid.uuid4()), "temp_id": str(uuid.uuid4()), "args": args})
+
+        response = await self._request("POST", TODOIST_SYNC_URL, json={"commands": commands})
+        sync_status = response.get("sync_status", {})
+        temp_id_mapping = response.get("temp_id_mapping", {})
+
+        created_ids = [
+            temp_id_mapping.get(command["temp_id"]) for command in commands
+            if sync_status.get(command["uuid"]) == "ok"
+        ]
+        created_tasks = {}
+        if created_ids:
+            fetched = await self._request("GET", f"{self.base_url}/tasks", params={"ids": ",".join(created_ids)})
+            created_tasks = {task["id"]: task for task in fetched}
+
+        results: List[Any] = []
+        for command in commands:
+            status = sync_status.get(command["uuid"])
+            if status != "ok":
+                results.append(Exception(f"Todoist API error: {status}"))
+                continue
+            task_id = temp_id_mapping.get(command["temp_id"])
+            if task_id in created_tasks:
+                results.append(created_tasks[task_id])
+            else:
+                results.append(Exception(f"Todoist API error: created task {task_id} could not be read back"))
+        return results
 
+    @creates("task")
     async def _create_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Todoist task"""
         content = payload.get("content")
@@ -72,20 +232,20 @@ class TodoistServiceHandler(BaseServiceHandler):
 
         if not self.api_token:
             # Mock implementation when API token is not available
+            now_ts = time.time()
             task_data = {
-                "id": f"task_{int(time.time())}",
+                "id": f"task_{int(now_ts)}",
                 "content": content,
                 "due": {"date": due_date} if due_date else None,
                 "priority": priority,
                 "project_id": project_id,
                 "labels": labels,
                 "status": "active",
-                "created_at": time.time()
+                "created_at": now_ts
             }
             return {"task": task_data, "message": "Task created successfully (mock mode)"}
 
         # Real API implementation
-        headers = {"Authorization": f"Bearer {self.api_token}"}
         task_data = {
             "content": content,
             "due_date": due_date,
@@ -94,11 +254,11 @@ class TodoistServiceHandler(BaseServiceHandler):
             "labels": labels
         }
 
-        response = requests.post(f"{self.base_url}/tasks", json=task_data, headers=headers)
-        response.raise_for_status()
+        task = await self._queue_task_add(task_data)
 
-        return {"task": response.json(), "message": "Task created successfully"}
+        return {"task": task, "message": "Task created successfully"}
 
+    @creates("project")
     async def _create_project(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Todoist project"""
         name = payload.get("name")
@@ -110,27 +270,27 @@ class TodoistServiceHandler(BaseServiceHandler):
 
         if not self.api_token:
             # Mock implementation
+            now_ts = time.time()
             project_data = {
-                "id": f"project_{int(time.time())}",
+                "id": f"project_{int(now_ts)}",
                 "name": name,
                 "color": color,
                 "parent_id": parent_id,
                 "status": "active",
-                "created_at": time.time()
+                "created_at": now_ts
             }
             return {"project": project_data, "message": "Project created successfully (mock mode)"}
 
         # Real API implementation
-        headers = {"Authorization": f"Bearer {self.api_token}"}
         project_data = {"name": name, "color": color}
         if parent_id:
             project_data["parent_id"] = parent_id
 
-        response = requests.post(f"{self.base_url}/projects", json=project_data, headers=headers)
-        response.raise_for_status()
+        project = await self._request("POST", f"{self.base_url}/projects", json=project_data)
 
-        return {"project": response.json(), "message": "Project created successfully"}
+        return {"project": project, "message": "Project created successfully"}
 
+    @creates("label")
     async def _create_label(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Todoist label"""
         name = payload.get("name")
@@ -142,25 +302,25 @@ class TodoistServiceHandler(BaseServiceHandler):
 
         if not self.api_token:
             # Mock implementation
+            now_ts = time.time()
             label_data = {
-                "id": f"label_{int(time.time())}",
+                "id": f"label_{int(now_ts)}",
                 "name": name,
                 "color": color,
                 "order": order,
                 "status": "active",
-                "created_at": time.time()
+                "created_at": now_ts
             }
             return {"label": label_data, "message": "Label created successfully (mock mode)"}
 
         # Real API implementation
-        headers = {"Authorization": f"Bearer {self.api_token}"}
         label_data = {"name": name, "color": color, "order": order}
 
-        response = requests.post(f"{self.base_url}/labels", json=label_data, headers=headers)
-        response.raise_for_status()
+        label = await self._request("POST", f"{self.base_url}/labels", json=label_data)
 
-        return {"label": response.json(), "message": "Label created successfully"}
+        return {"label": label, "message": "Label created successfully"}
 
+    @handles("read")
     async def _read_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Read a Todoist item"""
         item_id = payload.get("id")
@@ -180,22 +340,15 @@ class TodoistServiceHandler(BaseServiceHandler):
             return {"item": mock_data, "item_type": item_type}
 
         # Real API implementation
-        headers = {"Authorization": f"Bearer {self.api_token}"}
-
-        if item_type == "task":
-            endpoint = f"{self.base_url}/tasks/{item_id}"
-        elif item_type == "project":
-            endpoint = f"{self.base_url}/projects/{item_id}"
-        elif item_type == "label":
-            endpoint = f"{self.base_url}/labels/{item_id}"
-        else:
+        path = _TODOIST_ENDPOINTS.get(item_type)
+        if path is None:
             raise ValueError(f"Unsupported item type: {item_type}")
 
-        response = requests.get(endpoint, headers=headers)
-        response.raise_for_status()
+        item = await self._request("GET", f"{self.base_url}/{path}/{item_id}")
 
-        return {"item": response.json(), "item_type": item_type}
+        return {"item": item, "item_type": item_type}
 
+    @handles("update")
     async def _update_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Update a Todoist item"""
         item_id = payload.get("id")
@@ -228,6 +381,7 @@ class TodoistServiceHandler(BaseServiceHandler):
 
         return {"item": updated_data, "message": "Item updated successfully"}
 
+    @handles("delete")
     async def _delete_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Delete a Todoist item"""
         item_id = payload.get("id")
@@ -242,50 +396,53 @@ class TodoistServiceHandler(BaseServiceHandler):
         # Real API implementation would go here
         return {"message": f"Item {item_id} deleted successfully"}
 
+    @handles("list")
     async def _list_items(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """List Todoist items"""
         item_type = payload.get("item_type", "task")
         limit = payload.get("limit", 10)
         project_id = payload.get("project_id")
         label_id = payload.get("label_id")
+        task_id = payload.get("task_id")
 
         if not self.api_token:
             # Mock implementation
+            count = min(limit, 5)
+            now_ts = time.time()
             mock_items = [
                 {
                     "id": f"{item_type}_{i}",
                     "name": f"Sample {item_type} {i}",
                     "status": "active",
-                    "created_at": time.time()
+                    "created_at": now_ts
                 }
-                for i in range(1, min(limit + 1, 6))
+                for i in range(1, count + 1)
             ]
             return {"items": mock_items, "count": len(mock_items), "item_type": item_type}
 
         # Real API implementation
-        headers = {"Authorization": f"Bearer {self.api_token}"}
-
-        if item_type == "task":
-            endpoint = f"{self.base_url}/tasks"
-        elif item_type == "project":
-            endpoint = f"{self.base_url}/projects"
-        elif item_type == "label":
-            endpoint = f"{self.base_url}/labels"
-        else:
+        path = _TODOIST_ENDPOINTS.get(item_type)
+        if path is None:
             raise ValueError(f"Unsupported item type: {item_type}")
 
+        # GET /comments answers 400 unless it is scoped to a task or project
+        if item_type == "comment" and not (task_id or project_id):
+            raise ValueError("Listing comments requires a task_id or project_id")
+
         params = {}
         if project_id:
             params["project_id"] = project_id
         if label_id:
             params["label_id"] = label_id
+        if task_id:
+            params["task_id"] = task_id
 
-        response = requests.get(endpoint, headers=headers, params=params)
-        response.raise_for_status()
-
-        items = response.json()
-        return {"items": items[:limit], "count": len(items), "item_type": item_type}
+        # REST v2 list endpoints take no page size, so the limit is applied here;
+        # count reports what is returned, not the account total
+        items = (await self._request("GET", f"{self.base_url}/{path}", params=params))[:limit]
+        return {"items": items, "count": len(items), "item_type": item_type}
 
+    @handles("search")
     async def _search_items(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Search Todoist items"""
         query = payload.get("query", "")
@@ -296,26 +453,34 @@ class TodoistServiceHandler(BaseServiceHandler):
 
         if not self.api_token:
             # Mock implementation
+            count = min(max_results, 3)
+            now_ts = time.time()
             mock_results = [
                 {
                     "id": f"search_{i}",
                     "name": f"Search result {i} for '{query}'",
                     "status": "active",
-                    "created_at": time.time()
+                    "created_at": now_ts
                 }
-                for i in range(1, min(max_results + 1, 4))
+                for i in range(1, count + 1)
             ]
             return {"items": mock_results, "count": len(mock_results), "query": query}
 
         # Real API implementation
-        headers = {"Authorization": f"Bearer {self.api_token}"}
-
-        # Todoist REST API v2 doesn't have a search endpoint, so we'll list and filter
-        response = requests.get(f"{self.base_url}/tasks", headers=headers)
-        response.raise_for_status()
-        all_tasks = response.json()
-
-        # Simple text search in task content
-        matching_tasks = [task for task in all_tasks if query.lower() in task.get("content", "").lower()]
 
-        return {"items": matching_tasks[:max_results], "count": len(matching_tasks), "query": query}
+        # Let Todoist filter server-side unless the query would be read as filter syntax;
+        # if Todoist rejects the filter, list and match locally
+        matching_tasks = None
+        if not _FILTER_SYNTAX_RE.search(query):
+            try:
+                matching_tasks = await self._request("GET", f"{self.base_url}/tasks", params={"filter": f"search: {query}"})
+            except requests.HTTPError:
+                pass
+        if matching_tasks is None:
+            pattern = re.compile(re.escape(query), re.IGNORECASE)
+            all_tasks = await self._request("GET", f"{self.base_url}/tasks")
+            matching_tasks = [task for task in all_tasks if pattern.search(task.get("content", ""))]
+
+        # Like list, count reports what is returned, not every match
+        items = matching_tasks[:max_results]
+        return {"items": items, "count": len(items), "query": query}
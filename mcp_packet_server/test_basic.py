@@ -4,139 +4,115 @@ Basic test script for MCP Packet Server
 Tests core functionality without running the full demo
 """
 
-import asyncio
+import logging
 import sys
 from pathlib import Path
 
 # Add the current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from bootstrap import buffer_stdout, init_test_logging, run_eager, use_uvloop
 from packet import MCPPacket, create_example_packets
 from server import MCPPacketServer
+from validation_tripwires import PacketValidationTripwires
+from warmup import warm_up
 
+_log = logging.getLogger(__name__)
 
-async def test_basic_functionality():
-    """Test basic functionality of the MCP Packet Server"""
-    print("🧪 Testing MCP Packet Server Basic Functionality")
-    print("=" * 50)
 
-    # Test 1: Packet creation and validation
+# Packet fixtures built once per interpreter
+VALID_TODOIST_PACKET = MCPPacket(
+    tool_type="todoist",
+    action="create",
+    item_type="task",
+    payload={"content": "Test task"}
+)
+INVALID_TOOL_PACKET = MCPPacket(
+    tool_type="invalid_service",
+    action="create",
+    item_type="task",
+    payload={"content": "Test task"}
+)
+
+
+def test_packet_creation() -> None:
+    """Example packets build and validate"""
     print("\n1️⃣ Testing Packet System...")
-    try:
-        packets = create_example_packets()
-        print(f"   ✅ Created {len(packets)} example packets")
+    packets = create_example_packets()
+    print(f"   ✅ Created {len(packets)} example packets")
 
-        for i, packet in enumerate(packets, 1):
-            print(f"   📦 Packet {i}: {packet.tool_type}:{packet.action}:{packet.item_type}")
-            print(f"      Valid: {packet.validate()}")
-            print(f"      Routing Key: {packet.get_routing_key()}")
+    for i, packet in enumerate(packets, 1):
+        _log.debug("   📦 Packet %d: %s:%s:%s", i, packet.tool_type, packet.action, packet.item_type)
+        _log.debug("      Valid: %s", packet.validate())
+        _log.debug("      Routing Key: %s", packet.get_routing_key())
+
+    assert packets, "no example packets created"
+    print("   ✅ Packet system working correctly")
 
-        print("   ✅ Packet system working correctly")
-    except Exception as e:
-        print(f"   ❌ Packet system failed: {e}")
-        return False
 
-    # Test 2: Server initialization
+def test_server_init(server: MCPPacketServer) -> None:
+    """Server exposes its tools and resources"""
     print("\n2️⃣ Testing Server Initialization...")
-    try:
-        server = MCPPacketServer()
-        print("   ✅ Server initialized successfully")
-        print(f"   📚 Available tools: {len(server.tools)}")
-        print(f"   🔗 Available resources: {len(server.resources)}")
+    print(f"   📚 Available tools: {len(server.tools)}")
+    print(f"   🔗 Available resources: {len(server.resources)}")
 
-        # List tools
-        print("   📋 Core Tools:")
-        for tool in server.list_tools():
-            print(f"      • {tool['name']}: {tool['description']}")
+    tools = server.list_tools()
+    print("   📋 Core Tools:")
+    for tool in tools:
+        _log.debug("      • %s: %s", tool['name'], tool['description'])
 
-        print("   ✅ Server initialization working correctly")
-    except Exception as e:
-        print(f"   ❌ Server initialization failed: {e}")
-        return False
+    assert tools, "server registered no tools"
+    print("   ✅ Server initialization working correctly")
 
-    # Test 3: Service listing
+
+async def test_service_listing(server: MCPPacketServer) -> None:
+    """Every registered service reports its operations"""
     print("\n3️⃣ Testing Service Listing...")
-    try:
-        services_result = await server._list_services({})
-        if services_result["success"]:
-            print("   ✅ Services listed successfully")
-            print(f"   🔧 Total services: {services_result['total_services']}")
-
-            for service_name, service_info in services_result["services"].items():
-                total_ops = len(service_info["supported_actions"]) * len(service_info["supported_item_types"])
-                print(f"      • {service_name}: {total_ops} operations")
-
-            print("   ✅ Service listing working correctly")
-        else:
-            print(f"   ❌ Service listing failed: {services_result.get('error', 'Unknown error')}")
-            return False
-    except Exception as e:
-        print(f"   ❌ Service listing failed: {e}")
-        return False
+    services_result = await server._list_services({})
+    assert services_result["success"], services_result.get("error", "Unknown error")
+    print(f"   🔧 Total services: {services_result['total_services']}")
 
-    # Test 4: Basic packet execution
-    print("\n4️⃣ Testing Basic Packet Execution...")
-    try:
-        # Test a simple operation
-        result = await server._execute_packet({
-            "tool_type": "todoist",
-            "action": "list",
-            "item_type": "task",
-            "payload": {"limit": 3}
-        })
-
-        if result["success"]:
-            print("   ✅ Packet execution successful")
-            print(f"   📝 Packet ID: {result['packet_id']}")
-            print(f"   ⏱️  Execution time: {result['execution_time']:.3f}s")
-            print("   ✅ Basic packet execution working correctly")
-        else:
-            print(f"   ❌ Packet execution failed: {result.get('error', 'Unknown error')}")
-            return False
-    except Exception as e:
-        print(f"   ❌ Packet execution failed: {e}")
-        return False
+    for service_name, service_info in services_result["services"].items():
+        _log.debug("      • %s: %d operations", service_name, service_info["total_operations"])
 
-    # Test 5: Service schema retrieval
+    print("   ✅ Service listing working correctly")
+
+
+async def test_execute_todoist_list(server: MCPPacketServer) -> None:
+    """A simple Todoist list packet executes end to end"""
+    print("\n4️⃣ Testing Basic Packet Execution...")
+    result = await server._execute_packet({
+        "tool_type": "todoist",
+        "action": "list",
+        "item_type": "task",
+        "payload": {"limit": 3}
+    })
+    assert result["success"], result.get("error", "Unknown error")
+    print(f"   📝 Packet ID: {result['packet_id']}")
+    print(f"   ⏱️  Execution time: {result['execution_time']:.3f}s")
+    print("   ✅ Basic packet execution working correctly")
+
+
+async def test_schema_todoist(server: MCPPacketServer) -> None:
+    """The Todoist schema lists its actions"""
     print("\n5️⃣ Testing Service Schema Retrieval...")
-    try:
-        schema_result = await server._get_service_schema({"service_name": "todoist"})
-        if schema_result["success"]:
-            print("   ✅ Schema retrieved successfully")
-            schema = schema_result["schema"]
-            if "actions" in schema:
-                print(f"   📖 Actions defined: {len(schema['actions'])}")
-                for action in schema["actions"]:
-                    print(f"      • {action}")
-            print("   ✅ Service schema retrieval working correctly")
-        else:
-            print(f"   ❌ Schema retrieval failed: {schema_result.get('error', 'Unknown error')}")
-            return False
-    except Exception as e:
-        print(f"   ❌ Schema retrieval failed: {e}")
-        return False
+    schema_result = await server._get_service_schema({"service_name": "todoist"})
+    assert schema_result["success"], schema_result.get("error", "Unknown error")
 
-    print("\n🎉 All basic functionality tests passed!")
-    return True
+    schema = schema_result["schema"]
+    if "actions" in schema:
+        print(f"   📖 Actions defined: {len(schema['actions'])}")
+        for action in schema["actions"]:
+            _log.debug("      • %s", action)
+    print("   ✅ Service schema retrieval working correctly")
 
 
-def test_packet_validation():
+def test_packet_validation() -> None:
     """Test packet validation logic with tripwire system"""
     print("\n🔍 Testing Packet Validation...")
 
-    # Test valid packet
-    valid_packet = MCPPacket(
-        tool_type="todoist",
-        action="create",
-        item_type="task",
-        payload={"content": "Test task"}
-    )
-
-    if valid_packet.validate():
-        print("   ✅ Valid packet validation working")
-    else:
-        print("   ❌ Valid packet validation failed")
-        return False
+    assert VALID_TODOIST_PACKET.validate(), "valid packet failed validation"
+    print("   ✅ Valid packet validation working")
 
     # Test invalid packet (missing required field)
     try:
@@ -146,66 +122,41 @@ def test_packet_validation():
             # Missing item_type
             payload={"content": "Test task"}
         )
-
-        if not invalid_packet.validate():
-            print("   ✅ Invalid packet validation working")
-        else:
-            print("   ❌ Invalid packet validation failed")
-            return False
-    except Exception as e:
+        assert not invalid_packet.validate(), "packet without item_type passed validation"
+        print("   ✅ Invalid packet validation working")
+    except TypeError as e:
         print(f"   ✅ Invalid packet handling working (caught: {e})")
 
-    # Test tripwire validation system
-    try:
-        from validation_tripwires import PacketValidationTripwires
-
-        tripwires = PacketValidationTripwires()
-
-        # Test with valid packet
-        validation_result = tripwires.validate_packet(valid_packet)
-        if validation_result.is_valid:
-            print("   ✅ Tripwire validation working for valid packets")
-        else:
-            print("   ❌ Tripwire validation failed for valid packets")
-            return False
-
-        # Test with invalid packet (wrong tool type)
-        invalid_tool_packet = MCPPacket(
-            tool_type="invalid_service",
-            action="create",
-            item_type="task",
-            payload={"content": "Test task"}
-        )
+    # Invalid packet (wrong tool type), validated in the same batch as the valid one
+    valid_result, validation_result = PacketValidationTripwires().validate_packet_batch(
+        [VALID_TODOIST_PACKET, INVALID_TOOL_PACKET]
+    )
 
-        validation_result = tripwires.validate_packet(invalid_tool_packet)
-        if not validation_result.is_valid:
-            print("   ✅ Tripwire validation correctly caught invalid tool type")
-            print(f"   📝 Validation errors: {len(validation_result.validation_errors)}")
-        else:
-            print("   ❌ Tripwire validation missed invalid tool type")
-            return False
+    assert valid_result.is_valid, "tripwires rejected a valid packet"
+    print("   ✅ Tripwire validation working for valid packets")
 
-    except Exception as e:
-        print(f"   ❌ Tripwire validation test failed: {e}")
-        return False
+    assert not validation_result.is_valid, "tripwires missed an invalid tool type"
+    print("   ✅ Tripwire validation correctly caught invalid tool type")
+    print(f"   📝 Validation errors: {len(validation_result.validation_errors)}")
 
     print("   ✅ Packet validation tests passed")
-    return True
 
 
-async def main():
-    """Main test entry point"""
+async def main() -> bool:
+    """Run every test in order when this file is executed directly"""
     print("🚀 MCP Packet Server - Basic Functionality Test")
     print("=" * 60)
 
-    # Test packet validation
-    if not test_packet_validation():
-        print("\n❌ Packet validation tests failed!")
-        return False
-
-    # Test basic functionality
-    if not await test_basic_functionality():
-        print("\n❌ Basic functionality tests failed!")
+    server = MCPPacketServer()
+    try:
+        test_packet_validation()
+        test_packet_creation()
+        test_server_init(server)
+        await test_service_listing(server)
+        await test_execute_todoist_list(server)
+        await test_schema_todoist(server)
+    except AssertionError as e:
+        print(f"\n❌ Basic functionality tests failed: {e}")
         return False
 
     print("\n🎯 SUMMARY")
@@ -224,8 +175,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    buffer_stdout()
+    init_test_logging()
+    use_uvloop()
+    warm_up()
     try:
-        success = asyncio.run(main())
+        success = run_eager(main())
         if not success:
             sys.exit(1)
     except KeyboardInterrupt:
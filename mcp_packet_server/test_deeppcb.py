@@ -3,166 +3,176 @@
 Test script for DeepPCB service functionality
 """
 
-import asyncio
 import json
+import logging
+import os
+import sys
+import traceback
 
-from packet import MCPPacket
+from bootstrap import buffer_stdout, init_test_logging, run_eager, use_uvloop
 from server import MCPPacketServer
+from warmup import warm_up
 
+_log = logging.getLogger(__name__)
 
-async def test_deeppcb_service():
+
+async def test_deeppcb_service(server: MCPPacketServer) -> None:
     """Test the DeepPCB service functionality"""
     print("🧪 Testing DeepPCB Service")
     print("=" * 50)
 
-    server = MCPPacketServer()
-
-    # Test 1: Create a PCB design
-    print("\n1️⃣ Testing PCB Design Creation...")
-    pcb_packet = MCPPacket(
-        tool_type="deep_pcb",
-        action="create",
-        item_type="pcb_design",
-        payload={
-            "design_name": "Test Arduino Shield",
-            "description": "A test PCB design for Arduino compatibility",
-            "layers": 2
-        }
-    )
-
-    result = await server.handle_tool_call("execute_packet", {
+    # Creates and the search are independent, so one batch_execute call runs them
+    # concurrently inside the server; listing waits for the design create.
+    batch_result = await server.handle_tool_call("batch_execute", {"packets": [
+        {
+            "tool_type": "deep_pcb",
+            "action": "create",
+            "item_type": "pcb_design",
+            "payload": {
+                "design_name": "Test Arduino Shield",
+                "description": "A test PCB design for Arduino compatibility",
+                "layers": 2
+            }
+        },
+        {
+            "tool_type": "deep_pcb",
+            "action": "create",
+            "item_type": "component",
+            "payload": {
+                "component_name": "ATmega328P",
+                "package_type": "DIP",
+                "pin_count": 28
+            }
+        },
+        {
+            "tool_type": "deep_pcb",
+            "action": "search",
+            "item_type": "component",
+            "payload": {
+                "query": "microcontroller",
+                "max_results": 3
+            }
+        },
+        {
+            "tool_type": "deep_pcb",
+            "action": "create",
+            "item_type": "footprint",
+            "payload": {
+                "footprint_name": "SOIC-8",
+                "package_type": "SMD",
+                "dimensions": {
+                    "width": 3.9,
+                    "length": 4.9,
+                    "height": 1.75
+                }
+            }
+        },
+    ]})
+    result, component_result, search_result, footprint_result = batch_result["results"]
+    list_result = await server.handle_tool_call("execute_packet", {
         "tool_type": "deep_pcb",
-        "action": "create",
+        "action": "list",
         "item_type": "pcb_design",
         "payload": {
-            "design_name": "Test Arduino Shield",
-            "description": "A test PCB design for Arduino compatibility",
-            "layers": 2
+            "max_results": 5
         }
     })
 
-    if result["success"]:
-        print("   ✅ PCB Design created successfully!")
+    # Test 1: Create a PCB design
+    print("\n1️⃣ Testing PCB Design Creation...")
+    assert result["success"], f"PCB design creation failed: {result.get('error')}"
+    if os.getenv("VERBOSE_TESTS"):
         print(f"   📝 Result structure: {json.dumps(result, indent=2)}")
-        # Extract data from the result structure
-        design_data = result['result']
-        print(f"   📝 Design ID: {design_data['design']['id']}")
-        print(f"   📝 Design Name: {design_data['design']['name']}")
-        print(f"   📝 Layers: {design_data['design']['layers']}")
-        print(f"   ⏱️  Execution time: {result['execution_time']:.3f}s")
-    else:
-        print(f"   ❌ Failed to create PCB design: {result.get('error', 'Unknown error')}")
+    design = result['result']['design']
+    assert design['id'], "created design has no id"
+    assert design['name'] == "Test Arduino Shield", f"design created as {design['name']!r}"
+    assert design['layers'] == 2, f"design created with {design['layers']} layers"
+    print("   ✅ PCB Design created successfully!")
+    print(f"   📝 Design ID: {design['id']}")
+    print(f"   ⏱️  Execution time: {result['execution_time']:.3f}s")
 
     # Test 2: Create a component
     print("\n2️⃣ Testing Component Creation...")
-    component_result = await server.handle_tool_call("execute_packet", {
-        "tool_type": "deep_pcb",
-        "action": "create",
-        "item_type": "component",
-        "payload": {
-            "component_name": "ATmega328P",
-            "package_type": "DIP",
-            "pin_count": 28
-        }
-    })
-
-    if component_result["success"]:
-        print("   ✅ Component created successfully!")
-        # Extract data from the result structure
-        component_data = component_result['result']
-        print(f"   📝 Component ID: {component_data['component']['id']}")
-        print(f"   📝 Component Name: {component_data['component']['name']}")
-        print(f"   📝 Package Type: {component_data['component']['package_type']}")
-        print(f"   📝 Pin Count: {component_data['component']['pin_count']}")
-        print(f"   ⏱️  Execution time: {component_result['execution_time']:.3f}s")
-    else:
-        print(f"   ❌ Failed to create component: {component_result.get('error', 'Unknown error')}")
+    assert component_result["success"], f"component creation failed: {component_result.get('error')}"
+    component = component_result['result']['component']
+    assert component['id'], "created component has no id"
+    assert component['name'] == "ATmega328P", f"component created as {component['name']!r}"
+    assert component['package_type'] == "DIP", f"component package is {component['package_type']!r}"
+    assert component['pin_count'] == 28, f"component has {component['pin_count']} pins"
+    print("   ✅ Component created successfully!")
+    print(f"   📝 Component ID: {component['id']}")
+    print(f"   ⏱️  Execution time: {component_result['execution_time']:.3f}s")
 
     # Test 3: List PCB designs
     print("\n3️⃣ Testing PCB Design Listing...")
-    list_result = await server.handle_tool_call("execute_packet", {
-        "tool_type": "deep_pcb",
-        "action": "list",
-        "item_type": "pcb_design",
-        "payload": {
-            "max_results": 5
-        }
-    })
-
-    if list_result["success"]:
-        print("   ✅ PCB Designs listed successfully!")
-        # Extract data from the result structure
-        list_data = list_result['result']
-        print(f"   📝 Found {list_data['count']} designs")
-        for design in list_data['items']:
-            print(f"      • {design['name']} (ID: {design['id']})")
-        print(f"   ⏱️  Execution time: {list_result['execution_time']:.3f}s")
-    else:
-        print(f"   ❌ Failed to list PCB designs: {list_result.get('error', 'Unknown error')}")
+    assert list_result["success"], f"PCB design listing failed: {list_result.get('error')}"
+    list_data = list_result['result']
+    assert list_data['count'] == len(list_data['items']) <= 5, "design listing count does not match its items"
+    assert all(design['id'] and design['name'] for design in list_data['items']), "listed design without id or name"
+    print(f"   ✅ PCB Designs listed successfully! Found {list_data['count']} designs")
+    for design in list_data['items']:
+        _log.debug("      • %s (ID: %s)", design['name'], design['id'])
+    print(f"   ⏱️  Execution time: {list_result['execution_time']:.3f}s")
 
     # Test 4: Search components
     print("\n4️⃣ Testing Component Search...")
-    search_result = await server.handle_tool_call("execute_packet", {
-        "tool_type": "deep_pcb",
-        "action": "search",
-        "item_type": "component",
-        "payload": {
-            "query": "microcontroller",
-            "max_results": 3
-        }
-    })
-
-    if search_result["success"]:
-        print("   ✅ Component search completed successfully!")
-        print("   🔍 Query: 'microcontroller'")
-        # Extract data from the result structure
-        search_data = search_result['result']
-        print(f"   📝 Found {search_data['count']} results")
-        for component in search_data['items']:
-            print(f"   📝 Component Name: {component['name']} (ID: {component['id']})")
-        print(f"   ⏱️  Execution time: {search_result['execution_time']:.3f}s")
-    else:
-        print(f"   ❌ Failed to search components: {search_result.get('error', 'Unknown error')}")
+    assert search_result["success"], f"component search failed: {search_result.get('error')}"
+    search_data = search_result['result']
+    assert search_data['count'] == len(search_data['items']) <= 3, "search count does not match its items"
+    print(f"   ✅ Component search for 'microcontroller' found {search_data['count']} results")
+    for component in search_data['items']:
+        _log.debug("   📝 Component Name: %s (ID: %s)", component['name'], component['id'])
+    print(f"   ⏱️  Execution time: {search_result['execution_time']:.3f}s")
 
     # Test 5: Create a footprint
     print("\n5️⃣ Testing Footprint Creation...")
-    footprint_result = await server.handle_tool_call("execute_packet", {
+    assert footprint_result["success"], f"footprint creation failed: {footprint_result.get('error')}"
+    footprint = footprint_result['result']['footprint']
+    assert footprint['id'], "created footprint has no id"
+    assert footprint['name'] == "SOIC-8", f"footprint created as {footprint['name']!r}"
+    assert footprint['dimensions']['width'] == 3.9, f"footprint dimensions are {footprint['dimensions']}"
+    print("   ✅ Footprint created successfully!")
+    print(f"   📝 Footprint ID: {footprint['id']}")
+    print(f"   ⏱️  Execution time: {footprint_result['execution_time']:.3f}s")
+
+    # Test 6: A bad packet comes back as the failure envelope
+    print("\n6️⃣ Testing Failure Envelope...")
+    failed = await server.handle_tool_call("execute_packet", {
         "tool_type": "deep_pcb",
-        "action": "create",
-        "item_type": "footprint",
-        "payload": {
-            "footprint_name": "SOIC-8",
-            "package_type": "SMD",
-            "dimensions": {
-                "width": 3.9,
-                "length": 4.9,
-                "height": 1.75
-            }
-        }
+        "action": "read",
+        "item_type": "pcb_design",
+        "payload": {}
     })
-
-    if footprint_result["success"]:
-        print("   ✅ Footprint created successfully!")
-        # Extract data from the result structure
-        footprint_data = footprint_result['result']
-        print(f"   📝 Footprint ID: {footprint_data['footprint']['id']}")
-        print(f"   📝 Footprint Name: {footprint_data['footprint']['name']}")
-        print(f"   📝 Package Type: {footprint_data['footprint']['package_type']}")
-        print(f"   📝 Dimensions: {footprint_data['footprint']['dimensions']}")
-        print(f"   ⏱️  Execution time: {footprint_result['execution_time']:.3f}s")
-    else:
-        print(f"   ❌ Failed to create footprint: {footprint_result.get('error', 'Unknown error')}")
+    assert not failed["success"], "read without an id should fail"
+    assert "ID is required" in failed["error"], f"unexpected error: {failed['error']}"
+    print(f"   ✅ Read without an ID rejected: {failed['error']}")
 
     print("\n🎉 DeepPCB Service Testing Completed!")
-    print("🚀 All operations are working correctly!")
+
+
+async def main() -> bool:
+    """Run the DeepPCB checks when this file is executed directly"""
+    try:
+        await test_deeppcb_service(MCPPacketServer())
+    except AssertionError as e:
+        print(f"\n❌ DeepPCB tests failed: {e}")
+        return False
+    return True
 
 
 if __name__ == "__main__":
+    buffer_stdout()
+    init_test_logging()
+    use_uvloop()
+    warm_up()
     try:
-        asyncio.run(test_deeppcb_service())
+        success = run_eager(main())
+        if not success:
+            sys.exit(1)
     except KeyboardInterrupt:
         print("\n🛑 Testing interrupted by user")
+        sys.exit(1)
     except Exception as e:
         print(f"\n❌ Testing failed with error: {e}")
-        import traceback
         traceback.print_exc()
+        sys.exit(1)
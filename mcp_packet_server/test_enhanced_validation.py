@@ -4,35 +4,66 @@ Enhanced Validation and Error Handling Test
 Demonstrates the comprehensive tripwire validation system
 """
 
-import asyncio
+import copy
+import logging
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from bootstrap import buffer_stdout, init_test_logging, run_eager, use_uvloop
 from enhanced_server import EnhancedMCPServer
 from packet import ErrorDetails, MCPPacket
 from validation_tripwires import PacketValidationTripwires
-
-
-def test_tripwire_validation():
+from warmup import warm_up
+
+_log = logging.getLogger(__name__)
+
+
+# Packet fixtures built once per interpreter; tests that mutate a packet deep-copy it
+VALID_TODOIST_PACKET = MCPPacket(
+    tool_type="todoist",
+    action="create",
+    item_type="task",
+    payload={"content": "Test task"}
+)
+INVALID_TOOL_PACKET = MCPPacket(
+    tool_type="invalid_service",
+    action="create",
+    item_type="task",
+    payload={"content": "Test task"}
+)
+INVALID_ACTION_PACKET = MCPPacket(
+    tool_type="todoist",
+    action="invalid_action",
+    item_type="task",
+    payload={"content": "Test task"}
+)
+INVALID_PAYLOAD_PACKET = MCPPacket(
+    tool_type="todoist",
+    action="create",
+    item_type="task",
+    payload="not_a_dict"  # Should be dict
+)
+
+
+def test_tripwire_validation() -> None:
     """Test the tripwire validation system"""
     print("🚨 Testing Tripwire Validation System")
     print("=" * 50)
 
     tripwires = PacketValidationTripwires()
 
+    # One batch call validates every fixture; results print per test below
+    valid_result, tool_result, action_result, payload_result = tripwires.validate_packet_batch([
+        VALID_TODOIST_PACKET, INVALID_TOOL_PACKET, INVALID_ACTION_PACKET, INVALID_PAYLOAD_PACKET
+    ])
+
     # Test 1: Valid packet
     print("\n1️⃣ Testing Valid Packet...")
-    valid_packet = MCPPacket(
-        tool_type="todoist",
-        action="create",
-        item_type="task",
-        payload={"content": "Test task"}
-    )
-
-    result = tripwires.validate_packet(valid_packet)
-    print(f"   ✅ Valid packet validation: {'PASSED' if result.is_valid else 'FAILED'}")
+    result = valid_result
+    assert result.is_valid, "tripwires rejected a valid packet"
+    print("   ✅ Valid packet validation: PASSED")
     print(f"   📊 Validation passed: {len(result.validation_passed)} checks")
     print(f"   🚨 Validation errors: {len(result.validation_errors)}")
     print(f"   ⚠️  Validation warnings: {len(result.validation_warnings)}")
@@ -51,53 +82,52 @@ def test_tripwire_validation():
 
     # Test 3: Invalid tool type
     print("\n3️⃣ Testing Invalid Tool Type...")
-    invalid_tool_packet = MCPPacket(
-        tool_type="invalid_service",
-        action="create",
-        item_type="task",
-        payload={"content": "Test task"}
-    )
-
-    result = tripwires.validate_packet(invalid_tool_packet)
-    print(f"   ✅ Invalid tool type caught: {'PASSED' if not result.is_valid else 'FAILED'}")
-    if not result.is_valid:
-        print(f"   🚨 Error: {result.validation_errors[0].error_message}")
-        print(f"   💡 Suggestion: {result.validation_errors[0].suggestions[0]}")
+    result = tool_result
+    assert not result.is_valid, "invalid tool type not caught"
+    print("   ✅ Invalid tool type caught: PASSED")
+    print(f"   🚨 Error: {result.validation_errors[0].error_message}")
+    print(f"   💡 Suggestion: {result.validation_errors[0].suggestions[0]}")
 
     # Test 4: Invalid action
     print("\n4️⃣ Testing Invalid Action...")
-    invalid_action_packet = MCPPacket(
-        tool_type="todoist",
-        action="invalid_action",
-        item_type="task",
-        payload={"content": "Test task"}
-    )
-
-    result = tripwires.validate_packet(invalid_action_packet)
-    print(f"   ✅ Invalid action caught: {'PASSED' if not result.is_valid else 'FAILED'}")
-    if not result.is_valid:
-        print(f"   🚨 Error: {result.validation_errors[0].error_message}")
-        print(f"   💡 Suggestion: {result.validation_errors[0].suggestions[0]}")
+    result = action_result
+    assert not result.is_valid, "invalid action not caught"
+    print("   ✅ Invalid action caught: PASSED")
+    print(f"   🚨 Error: {result.validation_errors[0].error_message}")
+    print(f"   💡 Suggestion: {result.validation_errors[0].suggestions[0]}")
 
     # Test 5: Invalid payload structure
     print("\n5️⃣ Testing Invalid Payload Structure...")
-    invalid_payload_packet = MCPPacket(
-        tool_type="todoist",
-        action="create",
+    result = payload_result
+    assert not result.is_valid, "invalid payload not caught"
+    print("   ✅ Invalid payload caught: PASSED")
+    print(f"   🚨 Error: {result.validation_errors[0].error_message}")
+    print(f"   💡 Suggestion: {result.validation_errors[0].suggestions[0]}")
+
+    # Test 6: Unhashable fields still get the remaining enum checks
+    print("\n6️⃣ Testing Unhashable Tool Type With Invalid Action...")
+    result = tripwires.validate_packet(MCPPacket(
+        tool_type=["todoist"],  # type: ignore[arg-type]
+        action="invalid_action",
         item_type="task",
-        payload="not_a_dict"  # Should be dict
-    )
-
-    result = tripwires.validate_packet(invalid_payload_packet)
-    print(f"   ✅ Invalid payload caught: {'PASSED' if not result.is_valid else 'FAILED'}")
-    if not result.is_valid:
-        print(f"   🚨 Error: {result.validation_errors[0].error_message}")
-        print(f"   💡 Suggestion: {result.validation_errors[0].suggestions[0]}")
-
-    return True
-
-
-def test_error_details_structure():
+        payload={"content": "Test task"}
+    ))
+    error_codes = [error.error_code for error in result.validation_errors]
+    assert error_codes == ["INVALID_FIELD_TYPE", "INVALID_ACTION"], f"unexpected errors: {error_codes}"
+    print("   ✅ Type and action errors both caught: PASSED")
+
+    # Test 7: Repeated results never share lists or errors
+    print("\n7️⃣ Testing Results Are Not Shared...")
+    first, second = tripwires.validate_packet_batch([INVALID_ACTION_PACKET, INVALID_ACTION_PACKET])
+    assert first.validation_errors[0] is not second.validation_errors[0], "enum errors are shared"
+    first.validation_passed.append("mutated")
+    assert "mutated" not in tripwires.validate_packet(INVALID_ACTION_PACKET).validation_passed, "passed list is shared"
+    assert tripwires._check_checksum(VALID_TODOIST_PACKET) is not tripwires._check_checksum(VALID_TODOIST_PACKET), \
+        "success results are shared"
+    print("   ✅ Fresh results per packet: PASSED")
+
+
+def test_error_details_structure() -> None:
     """Test the error details structure"""
     print("\n🔍 Testing Error Details Structure")
     print("=" * 40)
@@ -123,151 +153,116 @@ def test_error_details_structure():
 
     # Test serialization
     error_dict = error.to_dict()
-    print(f"   🔄 Serialization: {'PASSED' if 'error_type' in error_dict else 'FAILED'}")
-
-    return True
+    assert 'error_type' in error_dict, "error_type missing from serialized error"
+    print("   🔄 Serialization: PASSED")
 
 
-def test_processing_log():
+def test_processing_log() -> None:
     """Test the processing log functionality"""
     print("\n📝 Testing Processing Log")
     print("=" * 30)
 
-    packet = MCPPacket(
-        tool_type="todoist",
-        action="create",
-        item_type="task",
-        payload={"content": "Test task"}
-    )
+    packet = copy.deepcopy(VALID_TODOIST_PACKET)
 
     # Add processing steps
-    packet.add_processing_step("packet_received", "VALIDATION", "SUCCESS")
-    packet.add_processing_step("format_validation", "VALIDATION", "SUCCESS", {"duration": "15ms"})
-    packet.add_processing_step("service_routing", "ROUTING", "SUCCESS", {"target": "todoist"})
+    packet.extend_processing_log([
+        ("packet_received", "VALIDATION", "SUCCESS"),
+        ("format_validation", "VALIDATION", "SUCCESS", {"duration": "15ms"}),
+        ("service_routing", "ROUTING", "SUCCESS", {"target": "todoist"}),
+    ])
 
     print("   ✅ Processing log created")
     print(f"   📊 Total steps: {len(packet.processing_log)}")
 
     for i, step in enumerate(packet.processing_log, 1):
-        print(f"   {i}. {step.step_name} ({step.step_type}): {step.status}")
+        _log.debug("   %d. %s (%s): %s", i, step.step_name, step.step_type, step.status)
         if step.details:
-            print(f"      📋 Details: {step.details}")
+            _log.debug("      📋 Details: %s", step.details)
 
     # Test serialization
     packet_dict = packet.to_dict()
-    if 'processing_log' in packet_dict:
-        print("   🔄 Log serialization: PASSED")
-    else:
-        print("   ❌ Log serialization: FAILED")
-
-    return True
+    assert 'processing_log' in packet_dict, "processing log missing from serialized packet"
+    print("   🔄 Log serialization: PASSED")
 
 
-async def test_server_integration():
+async def test_server_integration(enhanced_server: EnhancedMCPServer) -> None:
     """Test the enhanced server with tripwire validation"""
     print("\n🚀 Testing Enhanced Server Integration")
     print("=" * 45)
 
-    try:
-        # Initialize server
-        server = EnhancedMCPServer(cache_policy="lfu", max_tools=80)
-        print("   ✅ Server initialized with tripwire validation")
-
-        # Test 1: Valid packet execution
-        print("\n1️⃣ Testing Valid Packet Execution...")
-        result = await server._execute_packet({
-            "tool_type": "todoist",
-            "action": "create",
-            "item_type": "task",
-            "payload": {"content": "Test task"}
-        })
-
-        if result["success"]:
-            print("   ✅ Valid packet executed successfully")
-            print(f"   📝 Packet ID: {result.get('packet_id', 'N/A')}")
-            print(f"   ⏱️  Execution duration: {result.get('execution_duration_ms', 'N/A')}ms")
-        else:
-            print(f"   ❌ Valid packet execution failed: {result.get('error', 'Unknown error')}")
-            return False
-
-        # Test 2: Invalid packet (wrong service)
-        print("\n2️⃣ Testing Invalid Packet (Wrong Service)...")
-        result = await server._execute_packet({
-            "tool_type": "invalid_service",
-            "action": "create",
-            "item_type": "task",
-            "payload": {"content": "Test task"}
-        })
-
-        if not result["success"]:
-            print("   ✅ Invalid service correctly caught")
-            print(f"   🚨 Error: {result.get('error', 'Unknown error')}")
-
-            # Check if packet details are returned
-            if "packet" in result:
-                packet_data = result["packet"]
-                print("   📦 Packet returned with error details")
-                print(f"   📊 Processing steps: {len(packet_data.get('processing_log', []))}")
-
-                # Show processing log
-                for step in packet_data.get('processing_log', []):
-                    print(f"      • {step['step']}: {step['status']}")
-                    if step.get('error_details'):
-                        error = step['error_details']
-                        print(f"        🚨 {error['error_message']}")
-            else:
-                print("   ⚠️  No packet details returned")
-        else:
-            print("   ❌ Invalid service should have failed")
-            return False
-
-        # Test 3: Invalid packet (unsupported action)
-        print("\n3️⃣ Testing Invalid Packet (Unsupported Action)...")
-        result = await server._execute_packet({
-            "tool_type": "todoist",
-            "action": "invalid_action",
-            "item_type": "task",
-            "payload": {"content": "Test task"}
-        })
-
-        if not result["success"]:
-            print("   ✅ Invalid action correctly caught")
-            print(f"   🚨 Error: {result.get('error', 'Unknown error')}")
-        else:
-            print("   ❌ Invalid action should have failed")
-            return False
-
-        print("   ✅ Server integration tests passed")
-        return True
-
-    except Exception as e:
-        print(f"   ❌ Server integration test failed: {e}")
-        return False
+    server = enhanced_server
+    print("   ✅ Server initialized with tripwire validation")
+
+    # Test 1: Valid packet execution
+    print("\n1️⃣ Testing Valid Packet Execution...")
+    result = await server._execute_packet({
+        "tool_type": "todoist",
+        "action": "create",
+        "item_type": "task",
+        "payload": {"content": "Test task"}
+    })
+
+    assert result["success"], result.get("error", "Unknown error")
+    print("   ✅ Valid packet executed successfully")
+    print(f"   📝 Packet ID: {result.get('packet_id', 'N/A')}")
+    print(f"   ⏱️  Execution duration: {result.get('execution_duration_ms', 'N/A')}ms")
+
+    # Test 2: Invalid packet (wrong service)
+    print("\n2️⃣ Testing Invalid Packet (Wrong Service)...")
+    result = await server._execute_packet({
+        "tool_type": "invalid_service",
+        "action": "create",
+        "item_type": "task",
+        "payload": {"content": "Test task"}
+    })
+
+    assert not result["success"], "invalid service should have failed"
+    print("   ✅ Invalid service correctly caught")
+    print(f"   🚨 Error: {result.get('error', 'Unknown error')}")
+
+    # Check if packet details are returned
+    if "packet" in result:
+        packet_data = result["packet"]
+        print("   📦 Packet returned with error details")
+        print(f"   📊 Processing steps: {len(packet_data.get('processing_log', []))}")
+
+        # Show processing log
+        for step in packet_data.get('processing_log', []):
+            _log.debug("      • %s: %s", step['step'], step['status'])
+            if step.get('error_details'):
+                error = step['error_details']
+                _log.debug("        🚨 %s", error['error_message'])
+    else:
+        print("   ⚠️  No packet details returned")
 
+    # Test 3: Invalid packet (unsupported action)
+    print("\n3️⃣ Testing Invalid Packet (Unsupported Action)...")
+    result = await server._execute_packet({
+        "tool_type": "todoist",
+        "action": "invalid_action",
+        "item_type": "task",
+        "payload": {"content": "Test task"}
+    })
 
-async def main():
-    """Main test function"""
-    print("🚨 Enhanced Validation and Error Handling Test")
-    print("=" * 60)
+    assert not result["success"], "invalid action should have failed"
+    print("   ✅ Invalid action correctly caught")
+    print(f"   🚨 Error: {result.get('error', 'Unknown error')}")
 
-    # Test 1: Tripwire validation
-    if not test_tripwire_validation():
-        print("\n❌ Tripwire validation tests failed!")
-        return False
+    print("   ✅ Server integration tests passed")
 
-    # Test 2: Error details structure
-    if not test_error_details_structure():
-        print("\n❌ Error details structure tests failed!")
-        return False
 
-    # Test 3: Processing log
-    if not test_processing_log():
-        print("\n❌ Processing log tests failed!")
-        return False
+async def main() -> bool:
+    """Run every test in order when this file is executed directly"""
+    print("🚨 Enhanced Validation and Error Handling Test")
+    print("=" * 60)
 
-    # Test 4: Server integration
-    if not await test_server_integration():
-        print("\n❌ Server integration tests failed!")
+    try:
+        test_tripwire_validation()
+        test_error_details_structure()
+        test_processing_log()
+        await test_server_integration(EnhancedMCPServer(cache_policy="lfu", max_tools=80))
+    except AssertionError as e:
+        print(f"\n❌ Enhanced validation tests failed: {e}")
         return False
 
     print("\n🎯 SUMMARY")
@@ -285,8 +280,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    buffer_stdout()
+    init_test_logging()
+    use_uvloop()
+    warm_up()
     try:
-        success = asyncio.run(main())
+        success = run_eager(main())
         if not success:
             sys.exit(1)
     except KeyboardInterrupt:
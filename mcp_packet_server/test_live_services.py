@@ -118,6 +118,8 @@ async def main():
 
     server = EnhancedMCPServer()
 
+    # One service at a time, so each header precedes its own calls and every
+    # duration_ms times that call alone rather than a share of the whole run
     summaries = []
     for svc, plan in TEST_PLAN.items():
         print(f"\n▶︎ Exercising {svc} service...")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test script for the Todoist handler against a canned HTTP session
+"""
+
+import asyncio
+import json
+import logging
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from bootstrap import buffer_stdout, init_test_logging, run_eager, use_uvloop
+from services import TodoistServiceHandler
+from services.todoist_handler import TODOIST_SYNC_URL
+from warmup import warm_up
+
+_log = logging.getLogger(__name__)
+
+
+class CannedSession(requests.Session):
+    """Session that answers Todoist calls from canned data instead of the network"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        # Answer filtered task lists with 400, as Todoist does for filters it cannot parse
+        self.reject_filters = False
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,  # type: ignore[override]
+                **kwargs: Any) -> requests.Response:
+        """Record the call and answer it like the Todoist API would"""
+        body: Any = json.loads(kwargs["data"]) if "data" in kwargs else None
+        self.calls.append((method, url, {**kwargs, "json": body}))
+
+        if method == "POST" and url.endswith("/tasks"):
+            task_id = str(len(self.tasks) + 1)
+            self.tasks[task_id] = {"id": task_id, **body}
+            return self._response(200, self.tasks[task_id])
+
+        if url == TODOIST_SYNC_URL:
+            sync_status, temp_id_mapping = {}, {}
+            for command in body["commands"]:
+                task_id = str(len(self.tasks) + 1)
+                self.tasks[task_id] = {"id": task_id, **command["args"]}
+                sync_status[command["uuid"]] = "ok"
+                temp_id_mapping[command["temp_id"]] = task_id
+            return self._response(200, {"sync_status": sync_status, "temp_id_mapping": temp_id_mapping})
+
+        if method == "GET" and url.endswith("/tasks"):
+            params = kwargs.get("params") or {}
+            if "ids" in params:
+                return self._response(200, [self.tasks[task_id] for task_id in params["ids"].split(",")])
+            if "filter" in params:
+                if self.reject_filters:
+                    return self._response(400, {"error": "Invalid filter"})
+                text = params["filter"].removeprefix("search: ").lower()
+                return self._response(200, [task for task in self.tasks.values() if text in task["content"].lower()])
+            return self._response(200, list(self.tasks.values()))
+
+        return self._response(404, {"error": f"unexpected call: {method} {url}"})
+
+    @staticmethod
+    def _response(status: int, payload: Any) -> requests.Response:
+        """Build a response carrying a JSON body"""
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(payload).encode()
+        return response
+
+
+def make_handler(session: CannedSession) -> TodoistServiceHandler:
+    """Todoist handler in real-API mode, talking to the canned session"""
+    handler = TodoistServiceHandler(session=session)
+    handler.api_token = "test-token"
+    return handler
+
+
+async def test_concurrent_creates_share_one_sync_call() -> None:
+    """Creates issued together go out as one item_add Sync call, one task per caller"""
+    print("🧪 Testing Todoist create batching")
+    print("=" * 50)
+
+    session = CannedSession()
+    handler = make_handler(session)
+    contents = [f"Batched task {i}" for i in range(5)]
+    results = await asyncio.gather(*(
+        handler._execute_with_timing("create", {"content": content}, "task") for content in contents
+    ))
+
+    sync_calls = [call for call in session.calls if call[1] == TODOIST_SYNC_URL]
+    assert len(sync_calls) == 1, f"expected one Sync call, got {len(sync_calls)}"
+    commands = sync_calls[0][2]["json"]["commands"]
+    assert [command["type"] for command in commands] == ["item_add"] * len(contents), "commands are not all item_add"
+    print(f"✅ {len(contents)} creates sent as one Sync call")
+
+    for content, result in zip(contents, results):
+        assert result["success"], f"create failed: {result.get('error')}"
+        assert result["result"]["task"]["content"] == content, f"caller got {result['result']['task']}"
+    task_ids = {result["result"]["task"]["id"] for result in results}
+    assert len(task_ids) == len(contents), "callers were handed the same task"
+    print("✅ Each caller got its own created task")
+
+
+async def test_search_filter_and_fallback() -> None:
+    """Plain queries filter server-side; filter syntax and rejected filters match locally"""
+    print("\n🔍 Testing Todoist search")
+
+    session = CannedSession()
+    handler = make_handler(session)
+    for content in ("Buy milk & eggs", "Buy bread", "Call (mum)"):
+        task_id = str(len(session.tasks) + 1)
+        session.tasks[task_id] = {"id": task_id, "content": content}
+
+    async def search(query: str) -> List[str]:
+        """Run one search and return the matched task contents"""
+        session.calls.clear()
+        result = await handler._execute_with_timing("search", {"query": query})
+        assert result["success"], f"search for {query!r} failed: {result.get('error')}"
+        assert result["result"]["count"] == len(result["result"]["items"]), "search count does not match its items"
+        return [task["content"] for task in result["result"]["items"]]
+
+    def filters_sent() -> List[str]:
+        """Filters the last search sent to Todoist"""
+        return [call[2]["params"]["filter"] for call in session.calls if "filter" in (call[2].get("params") or {})]
+
+    assert await search("buy") == ["Buy milk & eggs", "Buy bread"], "server-side search returned the wrong tasks"
+    assert filters_sent() == ["search: buy"], f"unexpected filters: {filters_sent()}"
+    print("✅ Plain query filtered server-side")
+
+    for query, expected in (("milk & eggs", ["Buy milk & eggs"]), ("(mum)", ["Call (mum)"]), ("a, b | !c", [])):
+        assert await search(query) == expected, f"local search for {query!r} returned the wrong tasks"
+        assert not filters_sent(), f"filter syntax in {query!r} reached the filter language"
+    print("✅ Queries with filter syntax matched locally")
+
+    session.reject_filters = True
+    assert await search("BREAD") == ["Buy bread"], "fallback search returned the wrong tasks"
+    assert filters_sent() == ["search: BREAD"], "rejected filter was not tried first"
+    print("✅ Rejected filter fell back to local matching")
+
+
+async def test_comment_listing_scope() -> None:
+    """Unscoped comment listings fail against the API but still work in mock mode"""
+    print("\n💬 Testing Todoist comment listing")
+
+    session = CannedSession()
+    result = await make_handler(session)._execute_with_timing("list", {"item_type": "comment"})
+    assert not result["success"] and "task_id or project_id" in result["error"], f"unscoped listing: {result}"
+    assert not session.calls, "unscoped comment listing reached the API"
+    print("✅ Unscoped comment listing rejected before calling the API")
+
+    mock_handler = TodoistServiceHandler()
+    mock_handler.api_token = None
+    result = await mock_handler._execute_with_timing("list", {"item_type": "comment"})
+    assert result["success"] and result["result"]["count"], f"mock comment listing failed: {result}"
+    print("✅ Mock mode lists comments without a scope")
+
+
+async def main() -> bool:
+    """Run the Todoist checks when this file is executed directly"""
+    try:
+        await test_concurrent_creates_share_one_sync_call()
+        await test_search_filter_and_fallback()
+        await test_comment_listing_scope()
+    except AssertionError as e:
+        print(f"\n❌ Todoist tests failed: {e}")
+        return False
+
+    print("\n🎉 Todoist tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    buffer_stdout()
+    init_test_logging()
+    use_uvloop()
+    warm_up()
+    try:
+        success = run_eager(main())
+        if not success:
+            sys.exit(1)
+    except KeyboardInterrupt:
+        print("\n🛑 Tests interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Tests failed with error: {e}")
+        sys.exit(1)
@@ -1,66 +1,367 @@
 """
 MCP Packet Validation Tripwires
 Comprehensive validation system for catching formatting and input errors
+
+Fully annotated so the hot path can be compiled with `mypyc validation_tripwires.py`;
+the pure-Python module stays the default.
 """
 
-from typing import Any, Dict
+import asyncio
+import sys
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, cast
 
 from packet import ErrorDetails, MCPPacket, ValidationResults
 
+# Validation tables, built once at import and shared by every tripwire instance
+REQUIRED_FIELDS = ('tool_type', 'action', 'item_type', 'payload')
+FIELD_TYPES = MappingProxyType({
+    'tool_type': str,
+    'action': str,
+    'item_type': str,
+    'payload': dict,
+    'priority': str,
+})
+# Static pairs iterate as a plain tuple, without a dict view per packet
+FIELD_TYPE_CHECKS = tuple(FIELD_TYPES.items())
+ALLOWED_TOOLS = frozenset({'todoist', 'gcal', 'gmail', 'deep_pcb'})
+ALLOWED_ACTIONS = frozenset({'create', 'read', 'update', 'delete', 'list', 'search'})
+ALLOWED_PRIORITIES = frozenset({'low', 'normal', 'high', 'critical'})
+ALLOWED_TOOLS_STR = ', '.join(sorted(ALLOWED_TOOLS))
+ALLOWED_ACTIONS_STR = ', '.join(sorted(ALLOWED_ACTIONS))
+ALLOWED_PRIORITIES_STR = ', '.join(sorted(ALLOWED_PRIORITIES))
+
+# Async ingest batching: the first packet is validated inline and opens a window
+# of this many seconds; later packets queue and flush at this many, or when it
+# closes. Zero closes it on the next loop pass, batching the rest of the tick.
+VALIDATION_BATCH_LIMIT = 64
+VALIDATION_BATCH_WINDOW = 0.0
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11
+_FROMISOFORMAT_TAKES_Z = sys.version_info >= (3, 11)
+
+def _passed(name: str) -> ValidationResults:
+    """Success result for one tripwire; built per call so no two packets share lists or timestamps"""
+    return ValidationResults(is_valid=True, validation_passed=[name])
+
+
+@lru_cache(maxsize=128)
+def _joined(values: FrozenSet[str]) -> str:
+    """Sorted, comma-joined display form of a value set, built once per set"""
+    return ', '.join(sorted(values))
+
+
+def _is_uuid(value: str) -> bool:
+    """True for the canonical 8-4-4-4-12 hex UUID form
+
+    Fixed dash positions plus one C-level hex parse; fromhex skips
+    whitespace, so the decoded length is checked too.
+    """
+    if len(value) != 36 or value[8] != '-' or value[13] != '-' or value[18] != '-' or value[23] != '-':
+        return False
+    try:
+        return len(bytes.fromhex(value.replace('-', ''))) == 16
+    except ValueError:
+        return False
+
+
+def _field_type_error(field_name: str, value: Any, expected_type: type) -> ErrorDetails:
+    """Error for a field whose value is not of the expected type"""
+    return ErrorDetails(
+        error_type="FORMAT_ERROR",
+        error_code="INVALID_FIELD_TYPE",
+        error_message=f"Field '{field_name}' has wrong type",
+        error_location=field_name,
+        field_path=[field_name],
+        expected_format=f"Type: {expected_type.__name__}",
+        actual_value=f"Type: {type(value).__name__}, Value: {value}",
+        suggestions=[
+            f"Change {field_name} to {expected_type.__name__} type"
+        ]
+    )
+
+
+def _build_field_type_errors() -> Callable[..., List[ErrorDetails]]:
+    """Generate a straight-line type tripwire from FIELD_TYPE_CHECKS
+
+    The schema is fixed at import, so the loop over (field, type) pairs is
+    unrolled into one `isinstance` test per field with the types bound as
+    defaults. Arguments follow FIELD_TYPE_CHECKS order.
+    """
+    names = [field_name for field_name, _ in FIELD_TYPE_CHECKS]
+    type_args = [f"_T{i}=_T{i}" for i in range(len(names))]
+    lines = [f"def _field_type_errors({', '.join(names + type_args)}):", "    errors = []"]
+    for i, field_name in enumerate(names):
+        lines.append(f"    if {field_name} is not None and not isinstance({field_name}, _T{i}):")
+        lines.append(f"        errors.append(_field_type_error({field_name!r}, {field_name}, _T{i}))")
+    lines.append("    return errors")
+
+    namespace: Dict[str, Any] = {"_field_type_error": _field_type_error}
+    namespace.update((f"_T{i}", expected_type) for i, (_, expected_type) in enumerate(FIELD_TYPE_CHECKS))
+    exec("\n".join(lines), namespace)
+    return cast(Callable[..., List[ErrorDetails]], namespace["_field_type_errors"])
+
+
+_field_type_errors = _build_field_type_errors()
+
+
+def _payload_error(payload: Any) -> Optional[ErrorDetails]:
+    """Payload tripwire; None for a non-empty dictionary"""
+    if not payload:
+        return ErrorDetails(
+            error_type="FORMAT_ERROR",
+            error_code="EMPTY_PAYLOAD",
+            error_message="Payload cannot be empty",
+            error_location="payload",
+            field_path=["payload"],
+            expected_format="Non-empty dictionary with service parameters",
+            actual_value="Empty or missing payload",
+            suggestions=[
+                "Add required parameters to payload",
+                "Ensure payload is a valid dictionary"
+            ]
+        )
+
+    if not isinstance(payload, dict):
+        return ErrorDetails(
+            error_type="FORMAT_ERROR",
+            error_code="INVALID_PAYLOAD_TYPE",
+            error_message="Payload must be a dictionary",
+            error_location="payload",
+            field_path=["payload"],
+            expected_format="Dictionary type",
+            actual_value=f"Type: {type(payload).__name__}",
+            suggestions=[
+                "Convert payload to dictionary format",
+                "Use key-value pairs for payload parameters"
+            ]
+        )
+
+    return None
+
+
+def _checksum_error(checksum: Any) -> Optional[ErrorDetails]:
+    """Checksum tripwire; None for an 8-character checksum"""
+    if not checksum:
+        return ErrorDetails(
+            error_type="FORMAT_ERROR",
+            error_code="MISSING_CHECKSUM",
+            error_message="Packet checksum is missing",
+            error_location="checksum",
+            field_path=["checksum"],
+            expected_format="8-character checksum string",
+            actual_value="Missing checksum",
+            suggestions=[
+                "Generate checksum for packet content",
+                "Ensure packet integrity validation"
+            ]
+        )
+
+    # Verify checksum format (8 characters)
+    if len(checksum) != 8:
+        return ErrorDetails(
+            error_type="FORMAT_ERROR",
+            error_code="INVALID_CHECKSUM_FORMAT",
+            error_message="Invalid checksum format",
+            error_location="checksum",
+            field_path=["checksum"],
+            expected_format="8-character string",
+            actual_value=f"Length: {len(checksum)}",
+            suggestions=[
+                "Ensure checksum is exactly 8 characters",
+                "Regenerate checksum using proper algorithm"
+            ]
+        )
+
+    return None
+
+
+# (field, value, pre-joined valid values, error code, label) for one bad enum field
+_EnumFailure = Tuple[str, Any, str, str, str]
+
+
+def _enum_failures(tool_type: Any, action: Any, priority: Any,
+                   valid_tool_types: FrozenSet[str], valid_tool_types_str: str) -> Tuple[_EnumFailure, ...]:
+    """Enum fields of one (tool_type, action, priority) combination that hold invalid values"""
+    failures: List[_EnumFailure] = []
+    for field, value, valid, valid_str, error_code, label in (
+        ('tool_type', tool_type, valid_tool_types, valid_tool_types_str, "INVALID_TOOL_TYPE", "tool types"),
+        ('action', action, ALLOWED_ACTIONS, ALLOWED_ACTIONS_STR, "INVALID_ACTION", "actions"),
+        ('priority', priority, ALLOWED_PRIORITIES, ALLOWED_PRIORITIES_STR, "INVALID_PRIORITY", "priorities"),
+    ):
+        if not value:
+            continue
+        try:
+            invalid = value not in valid
+        except TypeError:
+            # Unhashable values cannot be enum members; the field-type tripwire reports them
+            continue
+        if invalid:
+            failures.append((field, value, valid_str, error_code, label))
+    return tuple(failures)
+
+
+# Packets repeat the same few combinations, so the lookup is memoized; the cached
+# tuples are immutable, and callers build fresh ErrorDetails from them
+_cached_enum_failures = lru_cache(maxsize=1024)(_enum_failures)
+
+
+def _enum_errors(tool_type: Any, action: Any, priority: Any,
+                 valid_tool_types: FrozenSet[str], valid_tool_types_str: str) -> List[ErrorDetails]:
+    """Enum tripwire: one error per field holding a value outside its allowed set"""
+    try:
+        failures = _cached_enum_failures(tool_type, action, priority, valid_tool_types, valid_tool_types_str)
+    except TypeError:
+        # An unhashable field cannot key the memo; check every field uncached instead
+        failures = _enum_failures(tool_type, action, priority, valid_tool_types, valid_tool_types_str)
+
+    return [
+        ErrorDetails(
+            error_type="FORMAT_ERROR",
+            error_code=error_code,
+            error_message=f"Invalid {field}: {value}",
+            error_location=field,
+            field_path=[field],
+            expected_format=f"One of: {valid_str}",
+            actual_value=value,
+            suggestions=[
+                f"Use one of the valid {label}: {valid_str}"
+            ]
+        )
+        for field, value, valid_str, error_code, label in failures
+    ]
+
 
 class PacketValidationTripwires:
     """Comprehensive packet validation using multiple tripwires"""
 
-    def __init__(self, service_handlers: Dict[str, Any] = None):
+    __slots__ = ("service_handlers", "_allowed_tools", "_allowed_tools_str", "_pending", "_flush_handle")
+
+    def __init__(self, service_handlers: Optional[Dict[str, Any]] = None) -> None:
         """Initialize with optional service handlers for dynamic validation"""
-        self.service_handlers = service_handlers or {}
+        self.service_handlers: Dict[str, Any] = service_handlers or {}
+        # Registries are fixed once the server is built, so the tool set is frozen here
+        if self.service_handlers:
+            self._allowed_tools = frozenset(self.service_handlers)
+            self._allowed_tools_str = _joined(self._allowed_tools)
+        else:
+            self._allowed_tools = ALLOWED_TOOLS
+            self._allowed_tools_str = ALLOWED_TOOLS_STR
+
+        # Packets queued by validate_packet_async, awaiting the next batch
+        self._pending: List[Tuple[MCPPacket, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
 
     def validate_packet(self, packet: MCPPacket) -> ValidationResults:
-        """Run all validation tripwires on the packet"""
-        all_results = []
+        """Run all validation tripwires on the packet
+
+        The tripwires are fused into one pass: each field is read once and
+        errors go straight into a single result.
+        """
+        tool_type = packet.tool_type
+        action = packet.action
+        priority = packet.priority
+        payload = packet.payload
+        passed: List[str] = []
 
         # TRIPWIRE 1: Basic field presence and types
-        type_results = self._check_field_types(packet)
-        all_results.append(type_results)
+        errors: List[ErrorDetails] = _field_type_errors(
+            tool_type=tool_type, action=action, item_type=packet.item_type,
+            payload=payload, priority=priority
+        )
+        if not errors:
+            passed.append("field_types")
 
         # TRIPWIRE 2: Enum value validation (using dynamic service registry)
-        enum_results = self._check_enum_values(packet)
-        all_results.append(enum_results)
+        enum_errors = _enum_errors(tool_type, action, priority, self._allowed_tools, self._allowed_tools_str)
+        if enum_errors:
+            errors.extend(enum_errors)
+        else:
+            passed.append("enum_values")
 
         # TRIPWIRE 3: Payload structure validation
-        payload_results = self._check_payload_structure(packet)
-        all_results.append(payload_results)
+        error = _payload_error(payload)
+        if error is None:
+            passed.append("payload_structure")
+        else:
+            errors.append(error)
 
         # TRIPWIRE 4: Checksum validation
-        checksum_results = self._check_checksum(packet)
-        all_results.append(checksum_results)
-
-        # Aggregate all results
-        is_valid = all(result.is_valid for result in all_results)
-        all_errors = []
-        all_warnings = []
-        all_passed = []
-
-        for result in all_results:
-            all_errors.extend(result.validation_errors)
-            all_warnings.extend(result.validation_warnings)
-            all_passed.extend(result.validation_passed)
+        error = _checksum_error(packet.checksum)
+        if error is None:
+            passed.append("checksum_validation")
+        else:
+            errors.append(error)
 
         return ValidationResults(
-            is_valid=is_valid,
-            validation_errors=all_errors,
-            validation_warnings=all_warnings,
-            validation_passed=all_passed
+            is_valid=not errors,
+            validation_errors=errors,
+            validation_passed=passed
         )
 
+    def validate_packet_batch(self, packets: List[MCPPacket]) -> List[ValidationResults]:
+        """Run all validation tripwires on each packet; results follow packet order"""
+        validate = self.validate_packet
+        return [validate(packet) for packet in packets]
+
+    async def validate_packet_async(self, packet: MCPPacket) -> ValidationResults:
+        """Validate the packet, batching it with any others that arrive in the same window
+
+        A packet with no window open is validated inline; it opens a window
+        that queues the packets following it in the same loop pass.
+        """
+        loop = asyncio.get_running_loop()
+        if self._flush_handle is not None and getattr(self._flush_handle, "_loop", loop) is not loop:
+            # Left over from a loop that has since stopped; its callers are gone
+            self._flush_handle = None
+            self._pending = []
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(VALIDATION_BATCH_WINDOW, self._flush_pending)
+            return self.validate_packet(packet)
+
+        future: asyncio.Future[ValidationResults] = loop.create_future()
+        self._pending.append((packet, future))
+        if len(self._pending) >= VALIDATION_BATCH_LIMIT:
+            self._flush_pending()
+
+        return await future
+
+    def _flush_pending(self) -> None:
+        """Validate the queued packets as one batch and resolve each caller's future"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        try:
+            results: List[Any] = self.validate_packet_batch([packet for packet, _ in batch])
+        except Exception:
+            # One malformed packet must not fail the rest; retry each on its own
+            results = []
+            for packet, _ in batch:
+                try:
+                    results.append(self.validate_packet(packet))
+                except Exception as e:
+                    results.append(e)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
     def _check_required_fields(self, packet: MCPPacket) -> ValidationResults:
         """Tripwire: Check all required fields are present"""
-        required_fields = ['tool_type', 'action', 'item_type', 'payload']
-        missing_fields = []
-
-        for field in required_fields:
-            if not hasattr(packet, field) or getattr(packet, field) is None:
-                missing_fields.append(field)
+        fields = packet.__dict__
+        missing_fields = [field for field in REQUIRED_FIELDS if fields.get(field) is None]
 
         if missing_fields:
             return ValidationResults(
@@ -79,187 +380,46 @@ class PacketValidationTripwires:
                 )]
             )
 
-        return ValidationResults(is_valid=True, validation_passed=["required_fields"])
+        return _passed("required_fields")
 
     def _check_field_types(self, packet: MCPPacket) -> ValidationResults:
         """Tripwire: Check field data types"""
-        type_checks = [
-            ('tool_type', str),
-            ('action', str),
-            ('item_type', str),
-            ('payload', dict),
-            ('priority', str)
-        ]
-
-        type_errors = []
-        for field_name, expected_type in type_checks:
-            if hasattr(packet, field_name):
-                value = getattr(packet, field_name)
-                if value is not None and not isinstance(value, expected_type):
-                    type_errors.append(ErrorDetails(
-                        error_type="FORMAT_ERROR",
-                        error_code="INVALID_FIELD_TYPE",
-                        error_message=f"Field '{field_name}' has wrong type",
-                        error_location=field_name,
-                        field_path=[field_name],
-                        expected_format=f"Type: {expected_type.__name__}",
-                        actual_value=f"Type: {type(value).__name__}, Value: {value}",
-                        suggestions=[
-                            f"Change {field_name} to {expected_type.__name__} type"
-                        ]
-                    ))
+        fields = packet.__dict__
+        type_errors = _field_type_errors(*[fields.get(field_name) for field_name, _ in FIELD_TYPE_CHECKS])
 
         if type_errors:
             return ValidationResults(is_valid=False, validation_errors=type_errors)
 
-        return ValidationResults(is_valid=True, validation_passed=["field_types"])
+        return _passed("field_types")
 
     def _check_enum_values(self, packet: MCPPacket) -> ValidationResults:
         """Tripwire: Check enum values are valid using dynamic service registry"""
-        # Get valid tool types from service handlers
-        valid_tool_types = list(self.service_handlers.keys()) if self.service_handlers else ['todoist', 'gcal', 'gmail', 'deep_pcb']
-        valid_actions = ['create', 'read', 'update', 'delete', 'list', 'search']
-        valid_priorities = ['low', 'normal', 'high', 'critical']
-
-        enum_errors = []
-
-        # Check tool_type
-        if hasattr(packet, 'tool_type') and packet.tool_type:
-            if packet.tool_type not in valid_tool_types:
-                enum_errors.append(ErrorDetails(
-                    error_type="FORMAT_ERROR",
-                    error_code="INVALID_TOOL_TYPE",
-                    error_message=f"Invalid tool_type: {packet.tool_type}",
-                    error_location="tool_type",
-                    field_path=["tool_type"],
-                    expected_format=f"One of: {', '.join(valid_tool_types)}",
-                    actual_value=packet.tool_type,
-                    suggestions=[
-                        f"Use one of the valid tool types: {', '.join(valid_tool_types)}"
-                    ]
-                ))
-
-        # Check action
-        if hasattr(packet, 'action') and packet.action:
-            if packet.action not in valid_actions:
-                enum_errors.append(ErrorDetails(
-                    error_type="FORMAT_ERROR",
-                    error_code="INVALID_ACTION",
-                    error_message=f"Invalid action: {packet.action}",
-                    error_location="action",
-                    field_path=["action"],
-                    expected_format=f"One of: {', '.join(valid_actions)}",
-                    actual_value=packet.action,
-                    suggestions=[
-                        f"Use one of the valid actions: {', '.join(valid_actions)}"
-                    ]
-                ))
-
-        # Check priority
-        if hasattr(packet, 'priority') and packet.priority:
-            if packet.priority not in valid_priorities:
-                enum_errors.append(ErrorDetails(
-                    error_type="FORMAT_ERROR",
-                    error_code="INVALID_PRIORITY",
-                    error_message=f"Invalid priority: {packet.priority}",
-                    error_location="priority",
-                    field_path=["priority"],
-                    expected_format=f"One of: {', '.join(valid_priorities)}",
-                    actual_value=packet.priority,
-                    suggestions=[
-                        f"Use one of the valid priorities: {', '.join(valid_priorities)}"
-                    ]
-                ))
-
+        enum_errors = _enum_errors(packet.tool_type, packet.action, packet.priority,
+                                   self._allowed_tools, self._allowed_tools_str)
         if enum_errors:
             return ValidationResults(is_valid=False, validation_errors=enum_errors)
 
-        return ValidationResults(is_valid=True, validation_passed=["enum_values"])
+        return _passed("enum_values")
 
     def _check_payload_structure(self, packet: MCPPacket) -> ValidationResults:
         """Tripwire: Check payload structure and content"""
-        if not hasattr(packet, 'payload') or not packet.payload:
-            return ValidationResults(
-                is_valid=False,
-                validation_errors=[ErrorDetails(
-                    error_type="FORMAT_ERROR",
-                    error_code="EMPTY_PAYLOAD",
-                    error_message="Payload cannot be empty",
-                    error_location="payload",
-                    field_path=["payload"],
-                    expected_format="Non-empty dictionary with service parameters",
-                    actual_value="Empty or missing payload",
-                    suggestions=[
-                        "Add required parameters to payload",
-                        "Ensure payload is a valid dictionary"
-                    ]
-                )]
-            )
-
-        if not isinstance(packet.payload, dict):
-            return ValidationResults(
-                is_valid=False,
-                validation_errors=[ErrorDetails(
-                    error_type="FORMAT_ERROR",
-                    error_code="INVALID_PAYLOAD_TYPE",
-                    error_message="Payload must be a dictionary",
-                    error_location="payload",
-                    field_path=["payload"],
-                    expected_format="Dictionary type",
-                    actual_value=f"Type: {type(packet.payload).__name__}",
-                    suggestions=[
-                        "Convert payload to dictionary format",
-                        "Use key-value pairs for payload parameters"
-                    ]
-                )]
-            )
+        error = _payload_error(packet.payload)
+        if error is not None:
+            return ValidationResults(is_valid=False, validation_errors=[error])
 
-        return ValidationResults(is_valid=True, validation_passed=["payload_structure"])
+        return _passed("payload_structure")
 
     def _check_checksum(self, packet: MCPPacket) -> ValidationResults:
         """Tripwire: Validate packet checksum"""
-        if not hasattr(packet, 'checksum') or not packet.checksum:
-            return ValidationResults(
-                is_valid=False,
-                validation_errors=[ErrorDetails(
-                    error_type="FORMAT_ERROR",
-                    error_code="MISSING_CHECKSUM",
-                    error_message="Packet checksum is missing",
-                    error_location="checksum",
-                    field_path=["checksum"],
-                    expected_format="8-character checksum string",
-                    actual_value="Missing checksum",
-                    suggestions=[
-                        "Generate checksum for packet content",
-                        "Ensure packet integrity validation"
-                    ]
-                )]
-            )
+        error = _checksum_error(packet.checksum)
+        if error is not None:
+            return ValidationResults(is_valid=False, validation_errors=[error])
 
-        # Verify checksum format (8 characters)
-        if len(packet.checksum) != 8:
-            return ValidationResults(
-                is_valid=False,
-                validation_errors=[ErrorDetails(
-                    error_type="FORMAT_ERROR",
-                    error_code="INVALID_CHECKSUM_FORMAT",
-                    error_message="Invalid checksum format",
-                    error_location="checksum",
-                    field_path=["checksum"],
-                    expected_format="8-character string",
-                    actual_value=f"Length: {len(packet.checksum)}",
-                    suggestions=[
-                        "Ensure checksum is exactly 8 characters",
-                        "Regenerate checksum using proper algorithm"
-                    ]
-                )]
-            )
-
-        return ValidationResults(is_valid=True, validation_passed=["checksum_validation"])
+        return _passed("checksum_validation")
 
     def _check_timestamp_format(self, packet: MCPPacket) -> ValidationResults:
         """Tripwire: Validate timestamp format"""
-        if not hasattr(packet, 'timestamp') or not packet.timestamp:
+        if not packet.timestamp:
             return ValidationResults(
                 is_valid=False,
                 validation_errors=[ErrorDetails(
@@ -278,9 +438,11 @@ class PacketValidationTripwires:
             )
 
         # Basic ISO format validation
+        timestamp = packet.timestamp
+        if not _FROMISOFORMAT_TAKES_Z and timestamp.endswith('Z'):
+            timestamp = timestamp[:-1] + '+00:00'
         try:
-            from datetime import datetime
-            datetime.fromisoformat(packet.timestamp.replace('Z', '+00:00'))
+            datetime.fromisoformat(timestamp)
         except ValueError:
             return ValidationResults(
                 is_valid=False,
@@ -299,11 +461,11 @@ class PacketValidationTripwires:
                 )]
             )
 
-        return ValidationResults(is_valid=True, validation_passed=["timestamp_format"])
+        return _passed("timestamp_format")
 
     def _check_uuid_format(self, packet: MCPPacket) -> ValidationResults:
         """Tripwire: Validate UUID format"""
-        if not hasattr(packet, 'packet_id') or not packet.packet_id:
+        if not packet.packet_id:
             return ValidationResults(
                 is_valid=False,
                 validation_errors=[ErrorDetails(
@@ -322,9 +484,7 @@ class PacketValidationTripwires:
             )
 
         # Basic UUID format validation
-        import re
-        uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-        if not re.match(uuid_pattern, packet.packet_id, re.IGNORECASE):
+        if not _is_uuid(packet.packet_id):
             return ValidationResults(
                 is_valid=False,
                 validation_errors=[ErrorDetails(
@@ -342,18 +502,23 @@ class PacketValidationTripwires:
                 )]
             )
 
-        return ValidationResults(is_valid=True, validation_passed=["uuid_format"])
+        return _passed("uuid_format")
 
 
 class ServiceValidationTripwires:
     """Additional tripwires for service-specific validation"""
 
-    def __init__(self):
-        self.service_handlers = {}
+    __slots__ = ("service_handlers", "_service_names_joined")
 
-    def register_service_handler(self, service_name: str, handler):
+    def __init__(self) -> None:
+        self.service_handlers: Dict[str, Any] = {}
+        # Rebuilt on registration so error messages never re-join the names
+        self._service_names_joined = ""
+
+    def register_service_handler(self, service_name: str, handler: Any) -> None:
         """Register a service handler for validation"""
         self.service_handlers[service_name] = handler
+        self._service_names_joined = ', '.join(self.service_handlers)
 
     def validate_service_availability(self, packet: MCPPacket) -> ValidationResults:
         """Tripwire: Check if target service is available"""
@@ -366,23 +531,23 @@ class ServiceValidationTripwires:
                     error_message=f"Service '{packet.tool_type}' is not available",
                     error_location="service_routing",
                     field_path=["tool_type"],
-                    expected_format=f"Available services: {', '.join(self.service_handlers.keys())}",
+                    expected_format=f"Available services: {self._service_names_joined}",
                     actual_value=packet.tool_type,
                     suggestions=[
-                        f"Use one of the available services: {', '.join(self.service_handlers.keys())}"
+                        f"Use one of the available services: {self._service_names_joined}"
                     ]
                 )]
             )
 
-        return ValidationResults(is_valid=True, validation_passed=["service_availability"])
+        return _passed("service_availability")
 
     def validate_action_support(self, packet: MCPPacket) -> ValidationResults:
         """Tripwire: Check if action is supported by the service"""
         if packet.tool_type not in self.service_handlers:
-            return ValidationResults(is_valid=True, validation_passed=["action_support"])  # Skip if service not available
+            return _passed("action_support")  # Skip if service not available
 
         handler = self.service_handlers[packet.tool_type]
-        if hasattr(handler, 'supported_actions') and packet.action not in handler.supported_actions:
+        if packet.action not in handler.supported_actions:
             return ValidationResults(
                 is_valid=False,
                 validation_errors=[ErrorDetails(
@@ -391,23 +556,23 @@ class ServiceValidationTripwires:
                     error_message=f"Action '{packet.action}' not supported by {packet.tool_type}",
                     error_location="action_validation",
                     field_path=["action"],
-                    expected_format=f"Supported actions: {', '.join(handler.supported_actions)}",
+                    expected_format=f"Supported actions: {_joined(handler.supported_actions)}",
                     actual_value=packet.action,
                     suggestions=[
-                        f"Use one of the supported actions: {', '.join(handler.supported_actions)}"
+                        f"Use one of the supported actions: {_joined(handler.supported_actions)}"
                     ]
                 )]
             )
 
-        return ValidationResults(is_valid=True, validation_passed=["action_support"])
+        return _passed("action_support")
 
     def validate_item_type_support(self, packet: MCPPacket) -> ValidationResults:
         """Tripwire: Check if item type is supported by the service"""
         if packet.tool_type not in self.service_handlers:
-            return ValidationResults(is_valid=True, validation_passed=["item_type_support"])  # Skip if service not available
+            return _passed("item_type_support")  # Skip if service not available
 
         handler = self.service_handlers[packet.tool_type]
-        if hasattr(handler, 'supported_item_types') and packet.item_type not in handler.supported_item_types:
+        if packet.item_type not in handler.supported_item_types:
             return ValidationResults(
                 is_valid=False,
                 validation_errors=[ErrorDetails(
@@ -416,22 +581,20 @@ class ServiceValidationTripwires:
                     error_message=f"Item type '{packet.item_type}' not supported by {packet.tool_type}",
                     error_location="item_type_validation",
                     field_path=["item_type"],
-                    expected_format=f"Supported item types: {', '.join(handler.supported_item_types)}",
+                    expected_format=f"Supported item types: {_joined(handler.supported_item_types)}",
                     actual_value=packet.item_type,
                     suggestions=[
-                        f"Use one of the supported item types: {', '.join(handler.supported_item_types)}"
+                        f"Use one of the supported item types: {_joined(handler.supported_item_types)}"
                     ]
                 )]
             )
 
-        return ValidationResults(is_valid=True, validation_passed=["item_type_support"])
+        return _passed("item_type_support")
 
 
 # Example usage
 if __name__ == "__main__":
     # Test the tripwire system
-    from packet import MCPPacket
-
     # Create a test packet
     test_packet = MCPPacket(
         tool_type="todoist",
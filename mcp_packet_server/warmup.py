@@ -0,0 +1,37 @@
+"""
+Warm-up helper for the MCP Packet Server test scripts
+Pays first-import and handler-registration cost once, before anything is measured
+"""
+
+import asyncio
+
+_WARMED = False
+
+# DeepPCB is mock-only, so this packet never reaches a live API whatever the environment holds
+_CANNED_PACKET = {
+    "tool_type": "deep_pcb",
+    "action": "list",
+    "item_type": "pcb_design",
+    "payload": {"max_results": 1}
+}
+
+
+def warm_up() -> None:
+    """Import the packet/validation/server modules, then validate and execute one canned packet"""
+    global _WARMED
+
+    if _WARMED:
+        return
+
+    import enhanced_server  # noqa: F401
+    import server  # noqa: F401
+    from packet import MCPPacket
+    from services import DeepPCBServiceHandler
+    from validation_tripwires import PacketValidationTripwires
+
+    # The handler runs on its own; building a whole server would construct every live handler
+    packet = MCPPacket.from_dict(dict(_CANNED_PACKET))
+    PacketValidationTripwires().validate_packet(packet)
+    asyncio.run(DeepPCBServiceHandler()._execute_with_timing(packet.action, packet.payload, packet.item_type))
+
+    _WARMED = True
@@ -4,13 +4,20 @@ Simple test script for Cairn MCP Server
 """
 
 import asyncio
+import json
 import sys
+import threading
+import urllib.error
+import urllib.request
+from http.server import HTTPServer
 from pathlib import Path
 
 # Add the cairn package to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from cairn.database import CairnDatabase
+from cairn.http_server import CairnHTTPHandler
+from cairn.server import SimpleMCPServer
 from cairn.models import Step, Path, StepType, StepStatus, PathStatus
 
 
@@ -76,5 +83,61 @@ def test_database():
         traceback.print_exc()
 
 
+def _post_json(url, body):
+    """POST a JSON body and return (status, decoded JSON response)"""
+    request = urllib.request.Request(
+        url, data=json.dumps(body).encode('utf-8'), headers={'Content-Type': 'application/json'}
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_tool_batch_endpoint():
+    """Test that /tool/batch answers every call and rejects malformed bodies"""
+    print("Testing /tool/batch endpoint...")
+
+    mcp_server = SimpleMCPServer("test_cairn.db")
+    http_server = HTTPServer(
+        ("127.0.0.1", 0),
+        lambda *args, **kwargs: CairnHTTPHandler(*args, mcp_server=mcp_server, **kwargs)
+    )
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{http_server.server_address[1]}/tool/batch"
+
+    try:
+        # A call that raises, an unknown tool and a nameless call each get their own error
+        status, data = _post_json(url, [
+            {"name": "get_path", "arguments": {"unexpected": 1}},
+            {"name": "no_such_tool"},
+            {"arguments": {}},
+        ])
+        assert status == 200, f"expected 200, got {status}: {data}"
+        results = data["results"]
+        assert len(results) == 3 and not any(result["success"] for result in results), f"unexpected results: {results}"
+        assert "unexpected" in results[0]["error"], f"raising call reported {results[0]}"
+        assert "Unknown tool" in results[1]["error"], f"unknown tool reported {results[1]}"
+        assert "Tool name is required" in results[2]["error"], f"nameless call reported {results[2]}"
+        print("✓ Each failing call reported on its own")
+
+        for body in ([1, "get_path"], [{"name": "get_path"}, None], {"name": "get_path"}):
+            status, data = _post_json(url, body)
+            assert status == 400, f"expected 400 for {body!r}, got {status}: {data}"
+        print("✓ Non-list bodies and non-object calls rejected")
+
+        print("\n🎉 All /tool/batch tests passed!")
+
+    except Exception as e:
+        print(f"✗ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        http_server.shutdown()
+        http_server.server_close()
+
+
 if __name__ == "__main__":
     test_database()
+    test_tool_batch_endpoint()
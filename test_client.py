@@ -4,131 +4,250 @@ Simple test client for Cairn MCP HTTP Server
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
+from pathlib import Path
+import argparse
+import hashlib
 import json
+import os
+import sys
 import time
 
+# orjson is optional; the client falls back to the stdlib codec without it
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        """Serialize a request body"""
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+BASE_URL = "http://localhost:8000"
+
+# Concurrency levels stepped through by --load, capped at --concurrency
+LOAD_LEVELS = (1, 5, 10, 20, 50)
+
+# Replayed /tools and /resources responses, used only with CAIRN_TEST_CACHE=1
+CACHE_DIR = Path(__file__).parent / ".cairn_test_cache"
+
+# Indent for per-item lines; each listing is written in one call
+ITEM_PREFIX = "   - "
+
+CachedResponse = namedtuple("CachedResponse", ["status_code", "content"])
+
+# Whether the server accepts POST /tool/batch; None until the first batch is sent
+_batch_supported = None
+
+# Workflow path created by step 4
+PATH_DATA = {
+    "name": "Test Workflow Path",
+    "description": "A test workflow for demonstration",
+    "steps": [
+        {
+            "name": "Initialize",
+            "description": "Initialize the workflow",
+            "step_type": "prompt",
+            "content": "Let's start by understanding your requirements.",
+            "context": {"step": 1},
+            "metadata": {"version": "1.0"}
+        },
+        {
+            "name": "Process",
+            "description": "Process the input",
+            "step_type": "tool_call",
+            "content": "Processing your request...",
+            "context": {"step": 2},
+            "metadata": {"version": "1.0"}
+        }
+    ],
+    "tags": ["test", "workflow", "demo"],
+    "branch": "main"
+}
+
+# Step 4 and 6 tool calls, encoded once and reused for every run
+TOOL_CALLS = [
+    {
+        "name": "create_path",
+        "arguments": PATH_DATA
+    },
+    {
+        "name": "search_paths",
+        "arguments": {
+            "query": "test",
+            "limit": 10
+        }
+    }
+]
+TOOL_CALLS_BODY = _dumps(TOOL_CALLS)
+TOOL_CALL_BODIES = [_dumps(call) for call in TOOL_CALLS]
+
+
+def make_session(pool_maxsize=16):
+    """Create a keep-alive session so every call reuses one pooled connection"""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=0))
+    session.headers.update({"Connection": "keep-alive", "Content-Type": "application/json"})
+    return session
+
+
+def cached_get(session, url, ttl=300):
+    """GET static server metadata, replaying a copy younger than ttl seconds
+    
+    Only active with CAIRN_TEST_CACHE=1 so CI always hits the server; tool
+    calls must never go through here.
+    """
+    if os.getenv("CAIRN_TEST_CACHE") != "1":
+        return session.get(url)
+    
+    path = CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            return CachedResponse(200, path.read_bytes())
+    except FileNotFoundError:
+        pass
+    
+    response = session.get(url)
+    if response.status_code == 200:
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(response.content)
+        os.replace(tmp_path, path)
+    return response
+
+
+def read_json(response):
+    """Decode a stream=True response straight from the socket
+    
+    The raw bytes go to the decoder without being buffered on the response
+    first; callers close the response so the connection returns to the pool.
+    """
+    return _loads(response.raw.read(decode_content=True))
+
+
+def post_tool_calls(session, base_url, batch_body, call_bodies):
+    """Run pre-encoded independent tool calls, returning one (status_code, result) pair per call
+    
+    batch_body goes out as a single POST /tool/batch; a server without that
+    endpoint answers 404 once and is sent call_bodies one POST /tool at a
+    time from then on.
+    """
+    global _batch_supported
+    
+    if _batch_supported is not False:
+        with session.post(f"{base_url}/tool/batch", data=batch_body, stream=True) as response:
+            if response.status_code != 404:
+                _batch_supported = True
+                if response.status_code != 200:
+                    return [(response.status_code, None)] * len(call_bodies)
+                return [(200, result) for result in read_json(response)["results"]]
+        _batch_supported = False
+    
+    pairs = []
+    for body in call_bodies:
+        with session.post(f"{base_url}/tool", data=body, stream=True) as response:
+            pairs.append((response.status_code, read_json(response) if response.status_code == 200 else None))
+    return pairs
+
 
 def test_server():
     """Test the cairn HTTP server"""
-    base_url = "http://localhost:8000"
+    base_url = BASE_URL
     
     print("🧪 Testing Cairn MCP HTTP Server...")
     
+    with make_session() as session, ThreadPoolExecutor(max_workers=4) as executor:
+        run_checks(session, executor, base_url)
+
+
+def run_checks(session, executor, base_url):
+    """Run the status, listing, path and search checks over one session"""
     try:
         # Test server status
         print("\n1. Testing server status...")
-        response = requests.get(f"{base_url}/")
+        response = session.get(f"{base_url}/")
         if response.status_code == 200:
             print("✅ Server is running")
-            print(f"   Response: {response.json()}")
+            print(f"   Response: {_loads(response.content)}")
         else:
             print(f"❌ Server status failed: {response.status_code}")
             return
         
+        # The status check has opened the pool; the two listings don't depend
+        # on each other or on the path created below, so they are issued
+        # together and printed in step order. Sharing the session is safe
+        # here: both are plain GETs that set no cookies, auth or headers, and
+        # the urllib3 pool underneath hands each thread its own connection
+        tools_future = executor.submit(cached_get, session, f"{base_url}/tools")
+        resources_future = executor.submit(cached_get, session, f"{base_url}/resources")
+        
         # Test listing tools
         print("\n2. Testing tools listing...")
-        response = requests.get(f"{base_url}/tools")
+        response = tools_future.result()
         if response.status_code == 200:
-            tools = response.json()["tools"]
+            tools = _loads(response.content)["tools"]
             print(f"✅ Found {len(tools)} tools:")
-            for tool in tools:
-                print(f"   - {tool['name']}: {tool['description']}")
+            sys.stdout.write("".join(f"{ITEM_PREFIX}{tool['name']}: {tool['description']}\n" for tool in tools))
         else:
             print(f"❌ Tools listing failed: {response.status_code}")
             return
         
         # Test listing resources
         print("\n3. Testing resources listing...")
-        response = requests.get(f"{base_url}/resources")
+        response = resources_future.result()
         if response.status_code == 200:
-            resources = response.json()["resources"]
+            resources = _loads(response.content)["resources"]
             print(f"✅ Found {len(resources)} resources:")
-            for resource in resources:
-                print(f"   - {resource['uri']}: {resource['description']}")
+            sys.stdout.write("".join(f"{ITEM_PREFIX}{resource['uri']}: {resource['description']}\n" for resource in resources))
         else:
             print(f"❌ Resources listing failed: {response.status_code}")
             return
         
         # Test creating a path
         print("\n4. Testing path creation...")
-        path_data = {
-            "name": "Test Workflow Path",
-            "description": "A test workflow for demonstration",
-            "steps": [
-                {
-                    "name": "Initialize",
-                    "description": "Initialize the workflow",
-                    "step_type": "prompt",
-                    "content": "Let's start by understanding your requirements.",
-                    "context": {"step": 1},
-                    "metadata": {"version": "1.0"}
-                },
-                {
-                    "name": "Process",
-                    "description": "Process the input",
-                    "step_type": "tool_call",
-                    "content": "Processing your request...",
-                    "context": {"step": 2},
-                    "metadata": {"version": "1.0"}
-                }
-            ],
-            "tags": ["test", "workflow", "demo"],
-            "branch": "main"
-        }
         
-        response = requests.post(
-            f"{base_url}/tool",
-            json={
-                "name": "create_path",
-                "arguments": path_data
-            }
+        # Creation and search go out as one batch; the server runs them in
+        # order, so the search also sees the new path
+        (status_code, result), (search_status_code, search_result) = post_tool_calls(
+            session, base_url, TOOL_CALLS_BODY, TOOL_CALL_BODIES
         )
         
-        if response.status_code == 200:
-            result = response.json()
+        if status_code == 200:
             if result.get("success"):
                 path_id = result["path_id"]
                 print(f"✅ Path created successfully with ID: {path_id}")
                 
                 # Test getting the created path
                 print("\n5. Testing path retrieval...")
-                response = requests.get(f"{base_url}/resource/cairn://paths/{path_id}")
-                if response.status_code == 200:
-                    path_info = response.json()
-                    print(f"✅ Path retrieved: {path_info['name']}")
-                    print(f"   Description: {path_info['description']}")
-                    print(f"   Steps: {len(json.loads(path_info['content'])['steps'])}")
-                else:
-                    print(f"❌ Path retrieval failed: {response.status_code}")
+                with session.get(f"{base_url}/resource/cairn://paths/{path_id}", stream=True) as response:
+                    if response.status_code == 200:
+                        path_info = read_json(response)
+                        print(f"✅ Path retrieved: {path_info['name']}")
+                        print(f"   Description: {path_info['description']}")
+                        print(f"   Steps: {len(_loads(path_info['content'])['steps'])}")
+                    else:
+                        print(f"❌ Path retrieval failed: {response.status_code}")
             else:
                 print(f"❌ Path creation failed: {result.get('error', 'Unknown error')}")
         else:
-            print(f"❌ Path creation request failed: {response.status_code}")
+            print(f"❌ Path creation request failed: {status_code}")
         
         # Test searching paths
         print("\n6. Testing path search...")
-        response = requests.post(
-            f"{base_url}/tool",
-            json={
-                "name": "search_paths",
-                "arguments": {
-                    "query": "test",
-                    "limit": 10
-                }
-            }
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            if result.get("success"):
-                paths = result["paths"]
+        if search_status_code == 200:
+            if search_result.get("success"):
+                paths = search_result["paths"]
                 print(f"✅ Search successful, found {len(paths)} paths")
-                for path in paths:
-                    print(f"   - {path['name']} ({path['status']})")
+                sys.stdout.write("".join(f"{ITEM_PREFIX}{path['name']} ({path['status']})\n" for path in paths))
             else:
-                print(f"❌ Search failed: {result.get('error', 'Unknown error')}")
+                print(f"❌ Search failed: {search_result.get('error', 'Unknown error')}")
         else:
-            print(f"❌ Search request failed: {response.status_code}")
+            print(f"❌ Search request failed: {search_status_code}")
         
         print("\n🎉 All tests completed!")
         
@@ -138,5 +257,83 @@ def test_server():
         print(f"❌ Test failed with error: {e}")
 
 
+def fire_requests(url, body, count):
+    """POST body count times, returning (latencies in seconds, error count)
+    
+    Each client opens its own session: requests.Session is not documented
+    as thread-safe, and a private connection keeps clients from queueing on
+    a shared pool.
+    """
+    latencies = []
+    errors = 0
+    with make_session(pool_maxsize=1) as session:
+        for _ in range(count):
+            start = time.perf_counter()
+            response = session.post(url, data=body)
+            _ = response.content
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors += 1
+    return latencies, errors
+
+
+def run_load(total_requests, max_concurrency, base_url=BASE_URL):
+    """Ramp concurrent clients against POST /tool and print one CSV row per level
+    
+    Each level splits total_requests over that many threads sending the
+    search_paths call; the level where req_per_s stops growing is the knee.
+    """
+    levels = sorted({level for level in LOAD_LEVELS if level < max_concurrency} | {max_concurrency})
+    url = f"{base_url}/tool"
+    search_body = TOOL_CALL_BODIES[1]
+    
+    print("concurrency,requests,errors,elapsed_s,req_per_s,mean_latency_ms")
+    try:
+        for concurrency in levels:
+            per_client = max(total_requests // concurrency, 1)
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [
+                    executor.submit(fire_requests, url, search_body, per_client)
+                    for _ in range(concurrency)
+                ]
+                results = [future.result() for future in futures]
+            elapsed = time.perf_counter() - start
+            
+            latencies = [latency for client_latencies, _ in results for latency in client_latencies]
+            errors = sum(client_errors for _, client_errors in results)
+            print(
+                f"{concurrency},{len(latencies)},{errors},{elapsed:.3f},"
+                f"{len(latencies) / elapsed:.1f},{sum(latencies) / len(latencies) * 1000:.2f}"
+            )
+    except requests.exceptions.ConnectionError:
+        print(f"❌ Could not connect to server. Make sure the server is running on {base_url}")
+
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
 if __name__ == "__main__":
-    test_server()
+    parser = argparse.ArgumentParser(description="Test client for the Cairn MCP HTTP Server")
+    parser.add_argument("--load", type=positive_int, metavar="N",
+                        help="send N search_paths calls per concurrency level instead of the functional checks")
+    parser.add_argument("--concurrency", type=positive_int, default=LOAD_LEVELS[-1], metavar="C",
+                        help=f"highest concurrency level for --load (default: {LOAD_LEVELS[-1]})")
+    args = parser.parse_args()
+    
+    # Block-buffer stdout so the report goes out in a few large writes
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
+    if args.load:
+        run_load(args.load, args.concurrency)
+    else:
+        test_server()